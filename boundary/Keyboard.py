@@ -1,5 +1,8 @@
 import os
 import sys
+import time
+from collections import deque
+from typing import Optional
 if os.name == "nt":
     import msvcrt
 
@@ -85,6 +88,65 @@ if os.name == "nt":
 
             return ctrl_char.get(char)
     
+        # Intervalle entre deux consultations du clavier, en secondes (voir `poll`)
+        POLL_INTERVAL = 0.01
+
+        events = deque() # Touches frappées, pas encore lues (voir `poll`)
+        active = False # Si une session clavier est ouverte (voir `start`)
+
+        @staticmethod
+        def start() -> None :
+            """
+            Ouvre une session clavier (pour Windows). La console lit déjà les touches une à une : rien n'est à configurer.
+            """
+
+            Keyboard.active = True
+
+        @staticmethod
+        def stop() -> None :
+            """
+            Ferme la session clavier (pour Windows).
+            """
+
+            Keyboard.active = False
+
+        @staticmethod
+        def poll(timeout:Optional[float]=0.0) -> Optional[str] :
+            """
+            Retourne la prochaine touche frappée, en attendant au plus `timeout` secondes (pour Windows).
+
+            Parameters:
+            -----------
+            timeout : Optional[float], optional
+                Le temps d'attente maximal, en secondes. 0 pour ne pas attendre, None pour attendre une touche.
+
+            Returns:
+            --------
+            Optional[str]
+                La touche, ou None si aucune touche n'a été frappée à temps.
+            """
+
+            deadline = None if timeout is None else time.monotonic() + timeout
+
+            while len(Keyboard.events) == 0 :
+                while msvcrt.kbhit() : # Lit toutes les touches en attente
+                    ch = msvcrt.getwch()
+
+                    if ch in ("\x00", "\xe0") : # Touche spéciale : suivie de son code
+                        ch = "^[" + msvcrt.getwch()
+
+                    Keyboard.events.append(ch)
+
+                if len(Keyboard.events) > 0 :
+                    break
+
+                if deadline is not None and time.monotonic() >= deadline :
+                    return None
+
+                time.sleep(Keyboard.POLL_INTERVAL)
+
+            return Keyboard.events.popleft()
+
         @staticmethod
         def getch() -> str :
             """
@@ -97,15 +159,11 @@ if os.name == "nt":
             """
 
             sys.stdout.flush()
-            ch = ""
 
-            ch = msvcrt.getwch()
-
-            if ord(ch) == 224 :
-                ch = "^[" + Keyboard.getch()
-
-            return ch
+            return Keyboard.poll(None)
 else:
+    import codecs
+    import selectors
     import tty
     import termios
 
@@ -191,35 +249,172 @@ else:
             
             return ctrl_char.get(char)
 
+        # Intervalle entre deux consultations du clavier, en secondes, pour qui ne peut pas attendre (voir `poll`)
+        POLL_INTERVAL = 0.01
+
+        # Temps laissé à la fin d'une séquence d'échappement coupée en deux lectures, en secondes.
+        # Passé ce délai, la touche Échap a été frappée seule.
+        ESCAPE_DELAY = 0.05
+
+        events = deque() # Touches frappées, pas encore lues (voir `poll`)
+        active = False # Si une session clavier est ouverte (voir `start`)
+        buffer = "" # Caractères lus, pas encore découpés en touches (séquence d'échappement incomplète)
+        since = None # Instant de la lecture du début de `buffer`
+        decoder = codecs.getincrementaldecoder("utf-8")("replace") # Garde les caractères multi-octets coupés entre deux lectures
+        selector = None
+        settings = None # Configuration du terminal à rétablir (voir `stop`)
+
+        @staticmethod
+        def start() -> None :
+            """
+            Ouvre une session clavier (pour Linux) : le terminal passe une seule fois en mode brut, jusqu'à `stop`.
+
+            Seule l'entrée est brute (touches lues une à une, sans écho) : la sortie reste normale, un saut de ligne revient en début de ligne.
+            """
+
+            if Keyboard.active :
+                return
+
+            fd = sys.stdin.fileno()
+            Keyboard.settings = termios.tcgetattr(fd)
+
+            tty.setraw(fd)
+            attributes = termios.tcgetattr(fd)
+            attributes[1] |= termios.OPOST | termios.ONLCR # Rétablit le traitement de la sortie
+            termios.tcsetattr(fd, termios.TCSADRAIN, attributes)
+
+            Keyboard.selector = selectors.DefaultSelector()
+            Keyboard.selector.register(fd, selectors.EVENT_READ)
+            Keyboard.active = True
+
+        @staticmethod
+        def stop() -> None :
+            """
+            Ferme la session clavier (pour Linux) et rétablit la configuration du terminal.
+            """
+
+            if not Keyboard.active :
+                return
+
+            Keyboard.selector.close()
+            Keyboard.selector = None
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, Keyboard.settings)
+            Keyboard.active = False
+
+        @staticmethod
+        def poll(timeout:Optional[float]=0.0) -> Optional[str] :
+            """
+            Retourne la prochaine touche frappée, en attendant au plus `timeout` secondes (pour Linux).
+
+            Une session clavier doit être ouverte (voir `start`).
+
+            Parameters:
+            -----------
+            timeout : Optional[float], optional
+                Le temps d'attente maximal, en secondes. 0 pour ne pas attendre, None pour attendre une touche.
+
+            Returns:
+            --------
+            Optional[str]
+                La touche, ou None si aucune touche n'a été frappée à temps.
+            """
+
+            deadline = None if timeout is None else time.monotonic() + timeout
+
+            while len(Keyboard.events) == 0 :
+                wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+
+                if Keyboard.buffer != "" : # Séquence incomplète : n'attend sa suite que peu de temps
+                    left = max(0.0, Keyboard.since + Keyboard.ESCAPE_DELAY - time.monotonic())
+                    wait = left if wait is None else min(wait, left)
+
+                if Keyboard.selector.select(wait) != [] :
+                    data = os.read(sys.stdin.fileno(), 1024)
+
+                    if data == b"" : # Fin de l'entrée standard
+                        raise EOFError("Fin de l'entrée standard.")
+
+                    if Keyboard.buffer == "" :
+                        Keyboard.since = time.monotonic()
+
+                    Keyboard.buffer += Keyboard.decoder.decode(data)
+
+                Keyboard._parse(Keyboard.buffer != "" and time.monotonic() >= Keyboard.since + Keyboard.ESCAPE_DELAY)
+
+                if len(Keyboard.events) == 0 and deadline is not None and time.monotonic() >= deadline :
+                    return None
+
+            return Keyboard.events.popleft()
+
+        @staticmethod
+        def _parse(final:bool) -> None :
+            """
+            Découpe les caractères lus en touches, ajoutées à la file `events`. Une séquence d'échappement incomplète reste dans `buffer`.
+
+            Parameters:
+            -----------
+            final : bool
+                Si True, une séquence incomplète est délivrée telle quelle : sa suite n'arrivera plus.
+            """
+
+            buffer = Keyboard.buffer
+            i = 0
+
+            while i < len(buffer) :
+                if buffer[i] != "\x1b" : # Caractère simple
+                    Keyboard.events.append(buffer[i])
+                    i += 1
+                    continue
+
+                if i + 1 == len(buffer) : # Échap seul, ou début de séquence
+                    if final :
+                        Keyboard.events.append(buffer[i])
+                        i += 1
+                    break
+
+                if buffer[i + 1] not in "[O" : # Alt + caractère
+                    Keyboard.events.append("^[" + buffer[i + 1])
+                    i += 2
+                    continue
+
+                j = i + 2
+                while j < len(buffer) and not "\x40" <= buffer[j] <= "\x7e" : # Cherche le caractère final de la séquence (paramètres avant)
+                    j += 1
+
+                if j == len(buffer) : # Séquence incomplète
+                    if final :
+                        Keyboard.events.append("^[" + buffer[i + 1:])
+                        i = len(buffer)
+                    break
+
+                Keyboard.events.append("^[" + buffer[i + 1 : j + 1])
+                i = j + 1
+
+            Keyboard.buffer = buffer[i:]
+
+            if Keyboard.buffer != "" and i > 0 :
+                Keyboard.since = time.monotonic()
+
+        @staticmethod
         def getch() -> str :
             """
             Attend la frappe d'un caractère puis le retourne (pour Linux).
+
+            Hors session clavier (voir `start`), une session est ouverte le temps de la lecture.
             
             Returns:
             --------
             str
                 caractère fr
             """
-        
 
             sys.stdout.flush()
-            ch = ""
 
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
+            if Keyboard.active :
+                return Keyboard.poll(None)
+
+            Keyboard.start()
             try :
-                tty.setraw(sys.stdin.fileno())
-                ch = sys.stdin.read(1)
+                return Keyboard.poll(None)
             finally :
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-
-            if ord(ch) == 27 :
-                _ch = Keyboard.getch()
-                _ch += Keyboard.getch()
-
-                while _ch[-1].isnumeric() or _ch[-1] == ";" :
-                    _ch += Keyboard.getch()
-
-                ch = "^[" + _ch
-
-            return ch
\ No newline at end of file
+                Keyboard.stop()
@@ -1,4 +1,4 @@
-from utils.terminal import clear, width, height, wrap
+from utils.terminal import clear, width, height, wrap, write, flush
 from controler.Menu import Menu
 from controler.Markdown import Markdown
 from boundary.View import View
@@ -41,6 +41,7 @@ class MenuView :
         ch = ""
         n = 0
         while True : # Attend une saisie
+            flush() # Affiche les boutons modifiés en une seule écriture
             ch = Keyboard.getch() # Récupère un caractère
             match ch :
                 case Keyboard.TOP : # Déplace le curseur
@@ -62,9 +63,9 @@ class MenuView :
         """
 
         clear() # Efface l'écran
-        print("\033[?25l", end="", flush=True) # Cache le curseur
+        write("\033[?25l") # Cache le curseur
 
-        print("\033[1;37m" # Gras
+        write("\033[1;37m" # Gras
               "╔══════╦══════╦══╗\n"
               "║╔═╗   ╚╗  ╔══╬╗╔╣\n"
               "╠╝╔╝╔═══╩══╩═╗╚╬╝║\n"
@@ -72,13 +73,13 @@ class MenuView :
               "║╔╝╔╩═╦══════╝╚╗ ║\n"
               "╠╣ ║  ╚══╗  ╔══╝ ║\n"
               "╚╩═╩═════╩══╩════╝\n"
-              "\033[0m", # Normal
-              end="")
+              "\033[0m") # Normal
         
         buttons = [
-            ("Jouer"  ,  9,  True), # Texte et hauteur des boutons
-            ("Règles" , 12, False),
-            ("Quitter", 15, False),
+            ("Jouer"   ,  9,  True), # Texte et hauteur des boutons
+            ("Regarder", 12, False),
+            ("Règles"  , 15, False),
+            ("Quitter" , 18, False),
         ]
 
         n = self._choice(buttons) # Demande de choisir un bouton
@@ -90,8 +91,17 @@ class MenuView :
                 winner = view.play()
                 self._end(winner) # Affiche l'écran de fin de partie
             case 1 :
-                self._rules()
+                autoplayers = self.menu.get_autoplayers()
+                clear()
+                black = autoplayers[self._choice([(autoplayers[i].get_name(), 3+i*3, i == 0) for i in range(len(autoplayers))])] # Joueur bleu
+                clear()
+                white = autoplayers[self._choice([(autoplayers[i].get_name(), 3+i*3, i == 0) for i in range(len(autoplayers))])] # Joueur rouge
+                view = View(self.menu.get_game(), black, white)
+                winner = view.spectate() # Les coups s'enchaînent sans validation, l'affichage est limité à 10 images par seconde
+                self._end(winner)
             case 2 :
+                self._rules()
+            case 3 :
                 return
     
     def end(self) -> None :
@@ -100,7 +110,8 @@ class MenuView :
         """
 
         clear()
-        print("\033[?25h", end="", flush=True) # Remet le curseur
+        write("\033[?25h") # Remet le curseur
+        flush()
     
     def _print_button(self, label:str, line:int=None, focus:bool=False) -> None:
         """
@@ -118,14 +129,13 @@ class MenuView :
 
         label = label.center(14)
 
-        print((f"\033[{line};1H" if line else "") + # Se déplace à la ligne
+        write((f"\033[{line};1H" if line else "") + # Se déplace à la ligne
                 "\033[1;37m" + # Gras
                ("\033[31m" if focus else "") + # Rouge si focus
                 "┌────────────────┐\n"
                f"│ {   label    } │\n"
                 "└────────────────┘\n"
-                "\033[0m",
-                end="")
+                "\033[0m")
 
     def _choice_player(self) -> AutoPlayer :
         """
@@ -163,7 +173,8 @@ class MenuView :
             clear() # Efface l'écran
             h = height()
             slide = wrap(markdown, width())[n:n+h]
-            print(*slide, sep="\n", end="")
+            write("\n".join(slide))
+            flush()
             
             ch = Keyboard.getch() # Récupère un caractère
             match ch :
@@ -187,7 +198,7 @@ class MenuView :
             Le gagnant de la partie.
         """
         
-        print("\033[2K") # Efface la ligne
+        write("\033[2K\n") # Efface la ligne
         clear() # Efface l'écran
 
         text = ""
@@ -197,10 +208,12 @@ class MenuView :
                 text = "Victoire des  bleus !".center(23)
             case Pawn.WHITE :
                 text = "Victoire des  rouges !".center(23)
+            case Pawn.DRAW :
+                text = "Match nul".center(23)
             case Pawn.VOID :
                 text = "Abandon".center(23)
 
-        print("\033[1;37m" # Gras
+        write("\033[1;37m" # Gras
               "╔════════╦╦═══╦══╦═══╦═══╦════╗\n"
               "║╔══╗ ╔══╝╚╗  ╚╦╗║  ╔╩╗╔═╣  ╔═╣\n"
               "║║  ║ ║╔╗  ╠═══╝╚╝╔═╝ ╠╝╔╝ ╔╣ ║\n"
@@ -214,10 +227,10 @@ class MenuView :
               "║╔═╩╦═╝ ║ ╚╦═╝ ║╚═╗ ║╔╝╔╝ ║╔══╣\n"
               "╠╝ ╔╝╔══╝ ╔╝  ╔╝  ║╔╝╚╗╚═╦╩╝  ║\n"
               "╚══╩═╩════╩═══╩═══╩╩══╩══╩════╝\n"
-              "\033[0m", # Normal
-              end="")
+              "\033[0m") # Normal
         
-        print(f"\033[7;5H\033[37;1m{text}\033[0m") # Affiche le gagant au centre de l'écran de fin de partie
+        write(f"\033[7;5H\033[37;1m{text}\033[0m\n") # Affiche le gagant au centre de l'écran de fin de partie
+        flush()
 
 
         while True :
@@ -0,0 +1,108 @@
+import threading
+from typing import Callable
+
+from utils.Pawn import Pawn
+
+class Renderer :
+    def __init__(self, draw:Callable[[list[tuple[int, int, Pawn]]], None], fps:float=10.0) :
+        """
+        Construit un afficheur qui dessine la dernière position publiée, à fréquence fixe, dans son propre fil d'exécution.
+
+        La partie est jouée sans attendre l'affichage : elle publie ses positions (voir `publish`),
+        et l'afficheur ne dessine que la plus récente à chaque image. Les positions intermédiaires sont sautées.
+
+        Parameters:
+        -----------
+        draw : Callable[[list[tuple[int, int, Pawn]]], None]
+            La fonction qui dessine les pions d'une position (voir `View._render`).
+        fps : float, optional
+            Le nombre maximal d'images par seconde.
+        """
+
+        self.draw = draw
+        self.interval = 1 / fps
+        self.latest = None # Dernière position publiée
+        self.drawn = None # Dernière position dessinée
+        self.stopping = threading.Event()
+        self.thread = None
+
+    def publish(self, pawns:list[tuple[int, int, Pawn]]) -> None :
+        """
+        Publie une position à dessiner. Ne bloque jamais : la position précédente, si elle n'a pas été dessinée, est remplacée.
+
+        Parameters:
+        -----------
+        pawns : list[tuple[int, int, Pawn]]
+            Les pions de la position (voir `Game.get_pawns`). La liste ne doit plus être modifiée.
+        """
+
+        self.latest = pawns # Affectation atomique : aucun verrou nécessaire
+
+    def start(self) -> None :
+        """
+        Lance le fil d'affichage.
+        """
+
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None :
+        """
+        Arrête le fil d'affichage, après avoir dessiné la dernière position publiée.
+        """
+
+        self.stopping.set()
+
+        if self.thread is not None :
+            self.thread.join()
+            self.thread = None
+
+        self._frame()
+
+    def _run(self) -> None :
+        """
+        Dessine la dernière position publiée à chaque image, jusqu'à l'arrêt.
+        """
+
+        while not self.stopping.wait(self.interval) :
+            self._frame()
+
+    def _frame(self) -> None :
+        """
+        Dessine la dernière position publiée, si elle ne l'a pas déjà été.
+        """
+
+        pawns = self.latest
+
+        if pawns is not self.drawn : # Nouvelle position depuis la dernière image
+            self.draw(pawns)
+            self.drawn = pawns
+
+class NullRenderer(Renderer) :
+    def __init__(self) :
+        """
+        Construit un afficheur qui ne dessine rien : la partie est jouée sans aucun affichage.
+        """
+
+        super().__init__(lambda pawns : None)
+
+    def publish(self, pawns:list[tuple[int, int, Pawn]]) -> None :
+        """
+        Ignore la position publiée.
+
+        Parameters:
+        -----------
+        pawns : list[tuple[int, int, Pawn]]
+            Les pions de la position.
+        """
+
+    def start(self) -> None :
+        """
+        Ne lance aucun fil d'affichage.
+        """
+
+    def stop(self) -> None :
+        """
+        N'a rien à arrêter.
+        """
@@ -1,26 +1,40 @@
-from typing import Callable
+import asyncio
+from typing import Optional
 
-from utils.terminal import clear
+from utils.terminal import clear, write, flush
+from boundary.Renderer import Renderer, NullRenderer
+from boundary.Keyboard import Keyboard
 from controler.Game import Game
+from controler.AutoPlayer import AutoPlayer
+from controler.autoplayer.HumanIA import HumanIA
 from utils.Pawn import Pawn
+from utils.MoveCode import MoveCode
 
 class View:
-    def __init__(self, game:Game, iptBlack:Callable[[], str]=input, iptWhite:Callable[[], str]=input) :
+    # Touches qui quittent la partie pendant la réflexion d'un joueur automatique
+    QUIT_KEYS = ("q", "Q", Keyboard.ctrl_C)
+
+    # Intervalle entre deux consultations du clavier pendant la réflexion, en secondes, et images de l'indicateur d'activité
+    TICK = 0.05
+    SPINNER = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+    def __init__(self, game:Game, iptBlack:AutoPlayer, iptWhite:AutoPlayer) :
         """
-        Construit une interface utilisateur prenant en entrée un jeu et deux fonctions de saisie de coup.
+        Construit une interface utilisateur prenant en entrée un jeu et les deux joueurs.
 
         Parameters:
         -----------
         game : Game
             Le jeu.
-        iptBlack : Callable[[], str], optional
-            La fonction de saisie de coup du joueur bleu.
-        iptWhite : Callable[[], str], optional
-            La fonction de saisie de coup du joueur rouge.
+        iptBlack : AutoPlayer
+            Le joueur bleu, qui choisit ses coups avec `choose`.
+        iptWhite : AutoPlayer
+            Le joueur rouge, qui choisit ses coups avec `choose`.
         """
         self.game = game
         self.iptWhite = iptWhite
         self.iptBlack = iptBlack
+        self.frame = {} # Pions affichés à l'écran, par case (voir `View._render`)
 
     def _board(self) -> None:
         """
@@ -45,12 +59,13 @@ class View:
         result.append(letters)
 
         clear() # Efface l'écran
-        print("\n".join(result)) # Affiche le plateau de jeu
-
+        write("\n".join(result) + "\n") # Affiche le plateau de jeu
+        flush()
+        self.frame = {} # Le plateau affiché est vide
 
-    def _pawn(self, x:int, y:int, p:Pawn) -> None:
+    def _cell(self, x:int, y:int, p:Pawn) -> str :
         """
-        Affiche un pion sur le plateau de jeu.
+        Retourne les caractères qui affichent un pion sur le plateau de jeu.
 
         Parameters:
         -----------
@@ -60,95 +75,177 @@ class View:
             La coordonnée y du pion.
         p : Pawn
             La valeur du pion.
+
+        Returns:
+        --------
+        str
+            Le déplacement du curseur à la position (x, y) du plateau de jeu, suivi du pion.
         """
 
-        print("\033[" + str(2*y+2) + ";" + str(4*x+5) + "H", end="") # Se déplace à la position (x, y) du plateau de jeu
+        move = "\033[" + str(2*y+2) + ";" + str(4*x+5) + "H" # Se déplace à la position (x, y) du plateau de jeu
+
         match p :
             case Pawn.BLACK :
-                print("\033[34m●\033[0m") # Affiche un pion bleu. Rappel : \033[34m change la couleur du texte en bleu, \033[0m réinitialise la couleur (voir README.md)
+                return move + "\033[34m●\033[0m" # Pion bleu. Rappel : \033[34m change la couleur du texte en bleu, \033[0m réinitialise la couleur (voir README.md)
             case Pawn.WHITE :
-                print("\033[31m●\033[0m") # Affiche un pion rouge. Rappel : \033[31m change la couleur du texte en rouge (voir README.md)
-            case Pawn.VOID :
-                print(" ") # Affiche une case vide et efface le pion précédent si présent
-    
-    def _pawns(self) -> None :
+                return move + "\033[31m●\033[0m" # Pion rouge. Rappel : \033[31m change la couleur du texte en rouge (voir README.md)
+            case _ :
+                return move + " " # Case vide, efface le pion précédent si présent
+
+    def _render(self, pawns:Optional[list[tuple[int, int, Pawn]]]=None) -> None :
         """
         Affiche les pions du plateau de jeu.
-        """
 
-        for x, y, p in self.game.get_pawns() :
-            self._pawn(x, y, p)
-    
-    def _erase(self) -> None :
-        """
-        Efface les cases du plateau de jeu.
+        Seules les cases qui ont changé depuis le dernier affichage sont réécrites, en une seule écriture (voir `utils.terminal.flush`).
+
+        Parameters:
+        -----------
+        pawns : Optional[list[tuple[int, int, Pawn]]], optional
+            Les pions à afficher (voir `Game.get_pawns`). Par défaut, ceux de la position courante.
         """
 
-        for i in range(self.game.get_size()) :
-            for j in range(self.game.get_size()) :
-                self._pawn(i, j, Pawn.VOID)
-    
-    def _input(self) -> tuple[int, int, int, int] :
+        frame = {(x, y): p for x, y, p in (pawns if pawns is not None else self.game.get_pawns())}
+        changes = [
+            self._cell(x, y, frame.get((x, y), Pawn.VOID))
+            for x, y in self.frame.keys() | frame.keys()
+            if self.frame.get((x, y), Pawn.VOID) != frame.get((x, y), Pawn.VOID)
+        ]
+
+        if changes != [] :
+            write("".join(changes))
+            flush()
+
+        self.frame = frame
+
+    async def _input(self) -> int :
         """
-        Demande à l'utilisateur de saisir un coup.
+        Demande son coup au joueur courant.
 
         Returns:
         --------
-        tuple[int, int, int, int]
-            Les coordonnées du coup.
+        int
+            Le coup codé (voir `MoveCode`), `MoveCode.PASS` pour passer son tour ou `MoveCode.QUIT` pour quitter la partie.
         """
 
         match self.game.get_current_player() :
             case Pawn.BLACK :
                 player = "\033[34m●\033[0m" # Pion bleu
-                _input = self.iptBlack.input
+                autoplayer = self.iptBlack
             case Pawn.WHITE :
                 player = "\033[31m●\033[0m" # Pion rouge
-                _input = self.iptWhite.input
+                autoplayer = self.iptWhite
             case Pawn.VOID :
                 player = " " # Case vide
         
-        while True : # Demande une saisie tant que le coup n'est pas valide
+        while True : # Demande une saisie tant que le coup n'est pas reconnu
 
-            print("\033[" + str(2*self.game.get_size()+3) + ";0H") # Se déplace à la dernière ligne du plateau
+            write("\033[" + str(2*self.game.get_size()+3) + ";0H\n") # Se déplace à la dernière ligne du plateau
 
-            print("\033[2K" + player + " ", end="") # Efface la ligne et affiche le joueur courant et la demande de coup
+            write("\033[2K" + player + " ") # Efface la ligne et affiche le joueur courant et la demande de coup
+            flush()
             
-            ipt = _input()
+            code = await self._think(autoplayer) # Coup codé directement pour une IA, saisie convertie pour un humain (voir `AutoPlayer.think`)
 
-            if len(ipt) == 0 or ipt == "pass" : # Si la saisie est vide ou égale à "pass", le joueur passe son tour
-                return (-1, -1, -1, -1)
-            
-            if ipt == "exit" or ipt == "quit" or ipt == "q" : # Si la saisie est égale à "exit", "quit" ou "q", on arrête la partie
-                return (-2, -2, -2, -2)
+            if code is not None : # Si la saisie n'est pas reconnue (format ou coordonnées hors du plateau), on redemande une saisie
+                return code
 
-            if len(ipt) != 4 : # Si la saisie n'est pas de la forme "ABCD", on redemande une saisie
-                continue
-            
-            x1 = ipt[0]
-            y1 = ipt[1]
-            x2 = ipt[2]
-            y2 = ipt[3]
+    async def _think(self, autoplayer:AutoPlayer) -> Optional[int] :
+        """
+        Attend le coup d'un joueur en surveillant le clavier.
 
-            if not x1.isalpha() or not y1.isdigit() or not x2.isalpha() or not y2.isdigit() : # Si les coordonnées ne sont pas des lettres ou des chiffres, on redemande une saisie
-                continue
-            
-            x1 = ord(x1.upper()) - 65 # Conversion des lettres en nombres (A -> 0, B -> 1, C -> 2, ...)
-            y1 = int(y1) - 1
-            x2 = ord(x2.upper()) - 65
-            y2 = int(y2) - 1
-
-            if (not (0 <= x1 < self.game.get_size()) or
-                not (0 <= y1 < self.game.get_size()) or
-                not (0 <= x2 < self.game.get_size()) or
-                not (0 <= y2 < self.game.get_size())) : # Si les coordonnées ne sont pas dans le plateau de jeu, on redemande une saisie
-                continue
-            
-            return x1, y1, x2, y2
+        Pendant la réflexion d'un joueur automatique, une des touches `QUIT_KEYS` quitte aussitôt la partie (la réflexion est annulée),
+        et un indicateur d'activité tourne à côté de la demande de coup. Un joueur humain lit lui-même le clavier (voir `HumanIA.think`).
+
+        Parameters:
+        -----------
+        autoplayer : AutoPlayer
+            Le joueur courant.
+
+        Returns:
+        --------
+        Optional[int]
+            Le coup codé, `MoveCode.QUIT` pour quitter la partie, ou None si la saisie n'est pas reconnue.
+        """
+
+        task = asyncio.create_task(autoplayer.think(self.game))
+
+        if isinstance(autoplayer, HumanIA) or not Keyboard.active : # Personne d'autre ne doit lire le clavier
+            code = await task
+        else :
+            line = 2*self.game.get_size() + 3
+            frame = 0
+
+            while not task.done() :
+                if Keyboard.poll(0) in View.QUIT_KEYS :
+                    task.cancel()
+                    try :
+                        await task # Attend l'arrêt de la recherche
+                    except asyncio.CancelledError :
+                        pass
+                    return MoveCode.QUIT
+
+                write(f"\033[{line};3H" + View.SPINNER[frame % len(View.SPINNER)]) # Indicateur d'activité
+                flush()
+                frame += 1
+
+                await asyncio.wait({task}, timeout=View.TICK)
+
+            code = task.result()
+
+        if getattr(autoplayer, "validation", False) and code is not None : # Le coup est joué après l'appui sur Entrée (voir `HeuristIA`)
+            return await self._validate(code)
+
+        return code
+
+    async def _validate(self, code:int) -> int :
+        """
+        Attend l'appui sur Entrée avant de jouer le coup d'un joueur automatique.
+
+        Parameters:
+        -----------
+        code : int
+            Le coup codé.
 
-    def play(self) -> None :
+        Returns:
+        --------
+        int
+            Le coup codé, ou `MoveCode.QUIT` si une des touches `QUIT_KEYS` est appuyée.
+        """
+
+        while True :
+            ch = Keyboard.poll(0) if Keyboard.active else Keyboard.getch()
+
+            if ch == Keyboard.NL :
+                return code
+
+            if ch in View.QUIT_KEYS :
+                return MoveCode.QUIT
+
+            if ch is None :
+                await asyncio.sleep(View.TICK)
+
+    def play(self) -> Pawn :
         """
         Joue une partie.
+
+        La partie est jouée dans une boucle d'événements (voir `asyncio`) : le clavier reste lu pendant la réflexion des joueurs automatiques.
+
+        Returns:
+        --------
+        Pawn
+            Le gagnant, `Pawn.DRAW` si la partie est nulle, `Pawn.VOID` si elle est abandonnée.
+        """
+
+        return asyncio.run(self._play())
+
+    async def _play(self) -> Pawn :
+        """
+        Joue une partie (voir `play`).
+
+        Returns:
+        --------
+        Pawn
+            Le gagnant, `Pawn.DRAW` si la partie est nulle, `Pawn.VOID` si elle est abandonnée.
         """
 
         winner = Pawn.VOID
@@ -156,19 +253,16 @@ class View:
         self._board() # Affiche le plateau de jeu
 
         while True :
-            self._erase() # Efface les pions
-            self._pawns() # Affiche les pions
+            self._render() # Affiche les pions qui ont changé
 
-            x1, y1, x2, y2 = self._input() # Demande un coup
+            code = await self._input() # Demande un coup
 
-            if (x1, y1, x2, y2) == (-2, -2, -2, -2) : # Si le joueur quitte la partie
+            if code == MoveCode.QUIT : # Si le joueur quitte la partie
                 break
 
-            if (x1, y1, x2, y2) == (-1, -1, -1, -1) : # Si le joueur passe son tour
+            if code == MoveCode.PASS : # Si le joueur passe son tour
                 self.game.pass_turn()
-                continue
-
-            if self.game.play(x1, y1, x2, y2) : # Si le coup est valide, on le valide auprès du jouer
+            elif self.game.play_code(code) : # Si le coup est valide, on le valide auprès du jouer
                 match self.game.get_current_player() :
                     case Pawn.BLACK :
                         self.iptBlack.played()
@@ -180,4 +274,66 @@ class View:
             if winner != Pawn.VOID : # Si la partie est terminée, on arrête la boucle
                 break
         
-        return winner
\ No newline at end of file
+        return winner
+
+    def spectate(self, fps:Optional[float]=10.0, max_moves:int=1000) -> Pawn :
+        """
+        Joue une partie entre les deux joueurs automatiques, sans attendre l'affichage.
+
+        Les coups sont joués aussi vite que les joueurs les choisissent. Un afficheur (voir `Renderer`) dessine la dernière position
+        au plus `fps` fois par seconde, dans son propre fil d'exécution. Les coups ne sont pas validés au clavier (voir `View._validate`).
+
+        Parameters:
+        -----------
+        fps : Optional[float], optional
+            Le nombre maximal d'images par seconde. None (ou 0) pour ne rien afficher.
+        max_moves : int, optional
+            Le nombre maximal de coups. Au-delà, la partie est arrêtée sans gagnant.
+
+        Returns:
+        --------
+        Pawn
+            Le gagnant, `Pawn.DRAW` si la partie est nulle, `Pawn.VOID` si elle est arrêtée.
+        """
+
+        players = {Pawn.BLACK: self.iptBlack, Pawn.WHITE: self.iptWhite}
+
+        if fps :
+            self._board()
+            renderer = Renderer(self._render, fps)
+        else :
+            renderer = NullRenderer()
+
+        winner = Pawn.VOID
+        passes = 0
+        renderer.publish(self.game.get_pawns())
+        renderer.start()
+
+        try :
+            for _ in range(max_moves) :
+                player = players[self.game.get_current_player()]
+                code = player.choose()
+
+                if code == MoveCode.PASS : # Le joueur passe son tour
+                    passes += 1
+                    if passes == 2 : # Les deux joueurs passent l'un après l'autre
+                        break
+                    self.game.pass_turn()
+                else :
+                    passes = 0
+
+                    if code is None or not self.game.play_code(code) : # Coup refusé : le joueur perd
+                        winner = Pawn.WHITE if player is self.iptBlack else Pawn.BLACK
+                        break
+
+                    player.played()
+
+                renderer.publish(self.game.get_pawns())
+                winner = self.game.is_finished()
+
+                if winner != Pawn.VOID :
+                    break
+        finally :
+            renderer.stop()
+
+        return winner
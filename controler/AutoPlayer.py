@@ -1,5 +1,11 @@
+import asyncio
+import threading
 from abc import ABC, abstractmethod
+from time import perf_counter
+from typing import Callable, Optional
+
 from controler.Game import Game
+from utils.MoveCode import MoveCode
 
 class AutoPlayer(ABC):
     def __init__(self, game:Game):
@@ -15,19 +21,111 @@ class AutoPlayer(ABC):
         self.temp_shot = ""
         self.shots = []
         self.name = ""
+        self.plan = [] # Prises restant à jouer dans la chaîne choisie (voir `_follow`)
+        self.plan_hash = None # Clé de la position attendue pour continuer la chaîne
+        self.cancelled = threading.Event() # Demande d'arrêt de la réflexion en cours (voir `think`)
 
-    @abstractmethod
-    def input(self) -> str:
+    def input(self) -> str :
         """
-        Méthode pour générer le coup du joueur automatique.
+        Retourne le coup du joueur automatique en notation texte ("a1b2" ou "pass"), pour l'affichage.
+
+        Par défaut, le coup retourné par `choose` est converti. Les joueurs qui saisissent leurs coups sous forme de texte
+        (voir `HumanIA`) redéfinissent aussi cette méthode.
 
         Returns:
         --------
         str
             Le coup choisi par le joueur.
         """
+
+        move_string = MoveCode.to_text(self.choose())
+        self.last_shot = move_string # Enregistre
+
+        return move_string
+
+    @abstractmethod
+    def choose(self) -> Optional[int] :
+        """
+        Retourne le coup du joueur automatique sous forme de coup codé (voir `MoveCode`), sans conversion en texte.
+
+        Ne lit jamais le clavier ni le terminal : les attentes de l'utilisateur sont gérées par l'interface (voir `View`).
+
+        Returns:
+        --------
+        Optional[int]
+            Le coup codé, `MoveCode.PASS` pour passer son tour, `MoveCode.QUIT` pour quitter la partie,
+            ou None si la saisie n'est pas reconnue.
+        """
+
         pass
 
+    async def think(self, game:Game, deadline:Optional[float]=None) -> Optional[int] :
+        """
+        Réfléchit au coup du joueur sans bloquer la boucle d'événements : `choose` est exécuté dans un fil à part,
+        et l'interface reste libre de lire le clavier ou d'afficher pendant ce temps.
+
+        La réflexion peut être annulée (`Task.cancel`) : l'arrêt est demandé à la recherche (`cancelled`), puis attendu,
+        pour que la partie soit restaurée avant de rendre la main. Les recherches qui consultent `cancelled`
+        (`AlphaBetaIA`, `MCTSIA`) s'arrêtent aussitôt, les autres terminent leur recherche.
+
+        Parameters:
+        -----------
+        game : Game
+            La partie. Elle ne doit pas être modifiée pendant la réflexion.
+        deadline : Optional[float], optional
+            L'instant (`time.perf_counter`) où l'arrêt de la recherche est demandé : le meilleur coup trouvé jusque-là est retourné.
+            None pour laisser la recherche gérer son temps.
+
+        Returns:
+        --------
+        Optional[int]
+            Le coup codé (voir `choose`).
+
+        Raises:
+        -------
+        asyncio.CancelledError
+            Si la réflexion est annulée.
+        """
+
+        loop = asyncio.get_running_loop()
+        previous, self.game = self.game, game
+        self.cancelled.clear()
+        timer = loop.call_later(max(0.0, deadline - perf_counter()), self.cancelled.set) if deadline is not None else None
+        future = loop.run_in_executor(None, self.choose)
+
+        try :
+            return await asyncio.shield(future) # L'annulation n'interrompt pas le fil : elle est transmise par `cancelled`
+        except asyncio.CancelledError :
+            self.cancelled.set()
+            await asyncio.wait({future}) # Attend que la recherche ait restauré la partie
+            raise
+        finally :
+            if timer is not None :
+                timer.cancel()
+            self.cancelled.clear() # La recherche est terminée : un appel suivant à `choose` ne doit pas être arrêté
+            self.game = previous
+
+    @staticmethod
+    def _code(move:Optional[tuple[int, int, int, int]]) -> int :
+        """
+        Code un coup trouvé par une recherche.
+
+        Parameters:
+        -----------
+        move : Optional[tuple[int, int, int, int]]
+            Le coup (x1, y1, x2, y2), ou None si le joueur n'a aucun coup.
+
+        Returns:
+        --------
+        int
+            Le coup codé, `MoveCode.PASS` si le joueur n'a aucun coup.
+        """
+
+        if move is None :
+            return MoveCode.PASS
+
+        return MoveCode.encode(*move)
+
     def get_name(self) -> str :
         """
         Retourne le nom du joueur automatique.
@@ -47,3 +145,39 @@ class AutoPlayer(ABC):
 
         self.shots.append(self.temp_shot) # Ajoute le coup
         self.temp_shot = ""
+
+    def _follow(self, search:Callable[[], Optional[tuple[tuple[int, int, int, int], ...]]]) -> Optional[tuple[int, int, int, int]] :
+        """
+        Retourne le prochain coup d'un tour complet (déplacement simple ou chaîne de prises).
+
+        Si une chaîne de prises choisie précédemment est en cours et que la position est celle attendue, son coup suivant est retourné.
+        Sinon un nouveau tour est cherché, et la suite de la chaîne est retenue pour les appels suivants.
+
+        Parameters:
+        -----------
+        search : Callable[[], Optional[tuple[tuple[int, int, int, int], ...]]]
+            La fonction de recherche d'un tour complet. Elle retourne None si le joueur n'a aucun coup.
+
+        Returns:
+        --------
+        Optional[tuple[int, int, int, int]]
+            Le coup à jouer, ou None si le joueur n'a aucun coup.
+        """
+
+        if self.plan != [] and self.plan_hash == self.game.get_hash() : # Continue la chaîne de prises déjà choisie
+            move = self.plan.pop(0)
+        else :
+            chain = search()
+
+            if chain is None :
+                self.plan = []
+                return None
+
+            move, *self.plan = chain
+
+        if self.plan != [] : # Retient la position attendue après ce coup
+            undo = self.game.make(*move)
+            self.plan_hash = self.game.get_hash()
+            self.game.unmake(undo)
+
+        return move
@@ -1,23 +1,51 @@
+from typing import Any, Iterator, Optional
+
 from entity.Board import Board
+from entity.BitBoard import BitBoard
 from utils.Pawn import Pawn
 from utils.Move import Move
+from utils.MoveCode import MoveCode
 
 class Game :
-    def __init__(self, size:int, config:list[tuple[int, int, Pawn]] = None) :
+    # Règles d'arbitrage des parties entre joueurs automatiques (voir `Runner`, `Tournament`), désactivées par défaut
+    AUTOPLAY_RULES = {"repetitions": 3, "quiet_limit": 100}
+
+    def __init__(self, size:int, config:list[tuple[int, int, Pawn]] = None, backend:type[Board | BitBoard] = Board, repetitions:Optional[int] = None, quiet_limit:Optional[int] = None, no_move_loses:bool = False) :
         """
         Initialise une nouvelle partie de jeu de taille spécifiée, avec une configuration initiale optionnelle.
 
+        La nulle par répétition et l'arbitrage après `quiet_limit` coups sans prise sont désactivés par défaut : seules les parties
+        entre joueurs automatiques les activent, avec `AUTOPLAY_RULES` (voir `Runner`, `Tournament`, `OpeningBook`).
+        Les parties jouées depuis l'interface (voir `main.py`) suivent les règles d'origine.
+
         Parameters :
         ----------
         size : int
             La taille du plateau de jeu. Automatiquement compris entre 3 et 9.
         config : list[list[Pawn]], optional
             La configuration initiale du plateau de jeu. Par défaut, le plateau est initialisé avec une configuration standard.
+        backend : type[Board | BitBoard], optional
+            La représentation du plateau de jeu. `Board` (par défaut) utilise une grille de pions, `BitBoard` utilise des masques de bits, plus rapides pour les recherches.
+        repetitions : Optional[int], optional
+            Le nombre d'occurrences d'une même position (même joueur à jouer) qui rend la partie nulle. None (par défaut) pour ne jamais déclarer nulle.
+        quiet_limit : Optional[int], optional
+            Le nombre de coups consécutifs sans prise au-delà duquel la partie est arbitrée : le camp qui a le plus de pions gagne,
+            à égalité la partie est nulle. None (par défaut) pour ne pas limiter. Voir `AUTOPLAY_RULES` pour les parties entre IA.
+        no_move_loses : bool, optional
+            Si True, un joueur qui n'a aucun coup perd la partie. Sinon (par défaut), il doit passer son tour,
+            et la partie est arbitrée comme pour `quiet_limit` lorsqu'aucun des deux camps ne peut jouer.
         """
 
-        self.board = Board(size, config) # Plateau de jeu
+        self.board = backend(size, config) # Plateau de jeu
         self.current_player = Pawn.BLACK # Joueur courant
         self.possible_moves = [] # Liste des coups autorisés. Si vide alors le joueur n'a aucune restriction de mouvement
+        self.hash = 0 # Part de la clé de Zobrist propre à la partie : joueur courant et prise à continuer (voir `Game.get_hash`)
+        self.legal = None # Coups autorisés de la position courante, calculés à la demande (voir `Game.get_legal_moves`). None si pas encore calculés
+        self.repetitions = repetitions
+        self.quiet_limit = quiet_limit
+        self.no_move_loses = no_move_loses
+        self.quiet = 0 # Nombre de coups joués depuis la dernière prise
+        self.history = {self.get_hash(): 1} # Nombre d'occurrences de chaque position jouée, par clé de Zobrist (voir `Game.is_finished`)
     
     def get_current_player(self) -> Pawn :
         """
@@ -31,6 +59,21 @@ class Game :
 
         return self.current_player
     
+    def get_hash(self) -> int :
+        """
+        Retourne la clé de Zobrist (64 bits) de la position.
+
+        La clé couvre les pions du plateau, le joueur courant et l'éventuelle prise à continuer (`possible_moves`).
+        Elle est mise à jour à chaque coup, sans parcourir le plateau.
+
+        Returns:
+        --------
+        int
+            La clé de Zobrist de la position.
+        """
+
+        return self.board.get_hash() ^ self.hash
+
     def get_pawns(self) -> list[tuple[int, int, Pawn]] :
         """
         Retourne les pions du plateau de jeu.
@@ -43,6 +86,40 @@ class Game :
 
         return self.board.get_pawns()
     
+    def get_player_pawns(self, player:Pawn) -> list[tuple[int, int]] :
+        """
+        Retourne les positions des pions d'un joueur.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
+
+        Returns:
+        --------
+        list[tuple[int, int]]
+            Les positions des pions du joueur.
+        """
+
+        return self.board.get_player_pawns(player)
+
+    def count(self, player:Pawn) -> int :
+        """
+        Retourne le nombre de pions d'un joueur.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
+
+        Returns:
+        --------
+        int
+            Le nombre de pions du joueur.
+        """
+
+        return self.board.count(player)
+
     def get_size(self) -> int :
         """
         Retourne la taille du plateau de jeu.
@@ -55,6 +132,88 @@ class Game :
 
         return self.board.get_size()
 
+    def to_bytes(self) -> bytes :
+        """
+        Sérialise la position sous une forme compacte, pour l'envoyer à un autre processus ou l'enregistrer.
+
+        Format : taille, joueur courant (0 bleu, 1 rouge), case du pion devant continuer sa prise (255 si aucun),
+        puis le masque des pions bleus et celui des pions rouges (bit `y * taille + x`), chacun sur ⌈taille² / 8⌉ octets.
+
+        Returns:
+        --------
+        bytes
+            La position sérialisée (au plus 25 octets).
+        """
+
+        size = self.get_size()
+        length = (size*size + 7) // 8
+        masks = []
+
+        for player in (Pawn.BLACK, Pawn.WHITE) :
+            mask = 0
+            for x, y in self.board.get_player_pawns(player) :
+                mask |= 1 << (y*size + x)
+            masks.append(mask.to_bytes(length, "little"))
+
+        forced = 255 if self.possible_moves == [] else self.possible_moves[0][1]*size + self.possible_moves[0][0]
+
+        return bytes((size, 0 if self.current_player == Pawn.BLACK else 1, forced)) + masks[0] + masks[1]
+
+    def get_rules(self) -> dict[str, Any] :
+        """
+        Retourne les règles de fin de partie, pour construire une autre partie avec les mêmes règles (voir `from_bytes`).
+
+        Returns:
+        --------
+        dict[str, Any]
+            Les paramètres `repetitions`, `quiet_limit` et `no_move_loses` du constructeur.
+        """
+
+        return {"repetitions": self.repetitions, "quiet_limit": self.quiet_limit, "no_move_loses": self.no_move_loses}
+
+    @staticmethod
+    def from_bytes(data:bytes, backend:type[Board | BitBoard] = Board, rules:Optional[dict[str, Any]] = None) -> "Game" :
+        """
+        Reconstruit une partie à partir d'une position sérialisée par `to_bytes`.
+
+        Parameters:
+        -----------
+        data : bytes
+            La position sérialisée.
+        backend : type[Board | BitBoard], optional
+            La représentation du plateau de jeu.
+        rules : Optional[dict[str, Any]], optional
+            Les règles de fin de partie (voir `get_rules`). Par défaut, celles du constructeur.
+
+        Returns:
+        --------
+        Game
+            La partie, dans la position sérialisée.
+        """
+
+        size, player, forced = data[0], data[1], data[2]
+        length = (size*size + 7) // 8
+        config = []
+
+        for i, p in enumerate((Pawn.BLACK, Pawn.WHITE)) :
+            mask = int.from_bytes(data[3 + i*length : 3 + (i+1)*length], "little")
+            config += [(sq % size, sq // size, p) for sq in range(size*size) if mask >> sq & 1]
+
+        game = Game(size, config, backend, **(rules if rules is not None else {}))
+
+        if player == 1 :
+            game.pass_turn()
+
+        if forced != 255 : # Restaure la prise à continuer
+            x, y = forced % size, forced // size
+            game.possible_moves = [(x, y, i, j) for i, j, mve in game.get_possible_moves(x, y) if mve == Move.TAKE]
+            game.hash ^= game.board.zobrist.forced[(x, y)]
+            game.legal = None
+
+        game.history = {game.get_hash(): 1} # L'historique et le nombre de coups sans prise ne sont pas sérialisés
+
+        return game
+
     def play(self, x1:int, y1:int, x2:int, y2:int) -> bool:
         """
         Joue un coup sur le plateau de jeu.
@@ -78,64 +237,252 @@ class Game :
             True si le coup a été joué avec succès, False sinon.
         """
 
-        if self.possible_moves != [] and (x1, y1, x2, y2) not in self.possible_moves : #  Le joueur doit prendre un pion et qu'il ne le fait pas
-            return False
-        
-        move = self.board.move_type(x1, y1, x2, y2)
+        return self.make(x1, y1, x2, y2) is not None
 
-        if self.board.get(x1, y1) != self.current_player : # Le joueur ne joue pas un de ses pions
-            return False
-        
-        if move == Move.INVALID : # Coup invalide
+    def play_code(self, code:int) -> bool :
+        """
+        Joue un coup codé (voir `MoveCode`), tel que retourné par `AutoPlayer.choose`.
+
+        Parameters:
+        -----------
+        code : int
+            Le coup codé. `MoveCode.PASS` fait passer son tour au joueur courant.
+
+        Returns:
+        --------
+        bool
+            True si le coup a été joué avec succès, False sinon.
+        """
+
+        if code == MoveCode.PASS :
+            self.pass_turn()
+            return True
+
+        if code < 0 : # Code spécial qui n'est pas un coup
             return False
 
+        return self.make(*MoveCode.decode(code)) is not None
+
+    def make(self, x1:int, y1:int, x2:int, y2:int, trusted:bool=False) -> Optional[tuple[int, int, int, int, Pawn, Pawn, list[tuple[int, int, int, int]], Optional[dict[tuple[int, int, int, int], Move]], int]] :
+        """
+        Joue un coup comme `play` et retourne de quoi l'annuler avec `unmake`.
+
+        Permet aux recherches de simuler des coups sur une seule partie, sans la copier.
+
+        Parameters:
+        -----------
+        x1 : int
+            La coordonnée x de la case de départ du coup.
+        y1 : int
+            La coordonnée y de la case de départ du coup.
+        x2 : int
+            La coordonnée x de la case d'arrivée du coup.
+        y2 : int
+            La coordonnée y de la case d'arrivée du coup.
+        trusted : bool, optional
+            Si True, le coup est supposé valide et n'est pas vérifié (coups d'une partie enregistrée, par exemple).
+            Jouer ainsi un coup invalide corrompt la partie.
+
+        Returns:
+        --------
+        Optional[tuple[int, int, int, int, Pawn, Pawn, list[tuple[int, int, int, int]], Optional[dict[tuple[int, int, int, int], Move]], int]]
+            L'enregistrement d'annulation (x1, y1, x2, y2, pion pris, joueur précédent, coups autorisés précédents, ensemble des coups autorisés précédent,
+            nombre de coups sans prise précédent), ou None si le coup est invalide.
+        """
+
+        if trusted : # Seule la distance distingue une prise d'un déplacement simple
+            move = Move.TAKE if abs(x2 - x1) == 2 or abs(y2 - y1) == 2 else Move.SIMPLE
+        else :
+            move = self.get_legal_moves().get((x1, y1, x2, y2)) # Prise à continuer, pion du joueur et validité du déplacement en une recherche
+
+            if move is None : # Coup invalide
+                return None
+
+        undo = (x1, y1, x2, y2, Pawn.VOID, self.current_player, self.possible_moves, self.legal, self.quiet) # Les coups autorisés ne sont jamais modifiés en place, on peut les garder tels quels
+
         match move :
             case Move.SIMPLE : # Déplacement simple
                 self.board.move(x1, y1, x2, y2)
                 self.pass_turn()
-                
-                return True
+                self.quiet += 1
             case Move.TAKE : # Prise
+                undo = (x1, y1, x2, y2, self.board.get((x1+x2)//2, (y1+y2)//2), self.current_player, self.possible_moves, self.legal, self.quiet) # Retient le pion pris
+
                 self.board.take(x1, y1, x2, y2) # Prend le pion
 
-                possible_takes = [(i, j) for i, j, mve in self.get_possible_moves(x2, y2) if mve == Move.TAKE] # Vérifie si le joueur peut prendre un autre pion
+                if self.possible_moves != [] : # Le pion qui devait continuer sa prise vient de le faire
+                    self.hash ^= self.board.zobrist.forced[(x1, y1)]
 
-                self.possible_moves = [(x2, y2, i, j) for i, j, mve in self.get_possible_moves(x2, y2) if mve == Move.TAKE] # Liste les prises possibles
+                self.possible_moves = [(x2, y2, i, j) for i, j, mve in self.get_possible_moves(x2, y2) if mve == Move.TAKE] # Liste les prises possibles, qui sont les seuls coups autorisés
 
-                if len(possible_takes) == 0 : # Si le joueur ne peut pas prendre un autre pion
+                if len(self.possible_moves) == 0 : # Si le joueur ne peut pas prendre un autre pion
                     self.pass_turn() # Passe le tour du joueur
+                else :
+                    self.hash ^= self.board.zobrist.forced[(x2, y2)] # Le pion doit continuer sa prise
+                    self.legal = dict.fromkeys(self.possible_moves, Move.TAKE)
+
+                self.quiet = 0
+
+        key = self.get_hash() # Ajoute la nouvelle position à l'historique
+        self.history[key] = self.history.get(key, 0) + 1
 
-                return True
+        return undo
+
+    def unmake(self, undo:tuple[int, int, int, int, Pawn, Pawn, list[tuple[int, int, int, int]], Optional[dict[tuple[int, int, int, int], Move]], int]) -> None :
+        """
+        Annule un coup joué avec `make` et restaure exactement la position précédente.
+
+        Les coups doivent être annulés dans l'ordre inverse de celui où ils ont été joués.
+
+        Parameters:
+        -----------
+        undo : tuple[int, int, int, int, Pawn, Pawn, list[tuple[int, int, int, int]], Optional[dict[tuple[int, int, int, int], Move]], int]
+            L'enregistrement d'annulation retourné par `make`.
+        """
+
+        x1, y1, x2, y2, taken, player, possible_moves, legal, quiet = undo
+
+        key = self.get_hash() # Retire la position annulée de l'historique
+        if self.history[key] == 1 :
+            del self.history[key]
+        else :
+            self.history[key] -= 1
+
+        self.board.move(x2, y2, x1, y1) # Ramène le pion à sa position initiale
+
+        if taken != Pawn.VOID : # Replace le pion pris
+            self.board.set((x1+x2)//2, (y1+y2)//2, taken)
+
+        self.current_player = player
+        self.possible_moves = possible_moves
+        self.legal = legal # Les coups autorisés restent valables : la position est restaurée
+        self.quiet = quiet
+        self.hash = (self.board.zobrist.side if player == Pawn.WHITE else 0) ^ (self.board.zobrist.forced[possible_moves[0][:2]] if possible_moves != [] else 0)
             
-    def pass_turn(self) -> None :
+    def pass_turn(self) -> list[tuple[int, int, int, int]] :
         """
         Passe le tour du joueur courant.
+
+        Returns:
+        --------
+        list[tuple[int, int, int, int]]
+            Les coups autorisés avant le passe-tour, pour l'annuler avec `unpass_turn`.
         """
 
+        possible_moves = self.possible_moves
+
+        if self.possible_moves != [] : # La prise à continuer est abandonnée
+            self.hash ^= self.board.zobrist.forced[self.possible_moves[0][:2]]
+
         self.current_player = Pawn.WHITE if self.current_player == Pawn.BLACK else Pawn.BLACK # Change le joueur courant, utilisation de l'opérateur ternaire (voir README.md)
+        self.hash ^= self.board.zobrist.side
         self.possible_moves = [] # Réinitialise les coups possibles, rappel: si vide alors le joueur n'a aucune restriction de mouvement
+        self.legal = None
+
+        return possible_moves
+
+    def unpass_turn(self, possible_moves:list[tuple[int, int, int, int]]) -> None :
+        """
+        Annule un passe-tour joué avec `pass_turn`.
+
+        Parameters:
+        -----------
+        possible_moves : list[tuple[int, int, int, int]]
+            Les coups autorisés avant le passe-tour, retournés par `pass_turn`.
+        """
+
+        self.current_player = Pawn.WHITE if self.current_player == Pawn.BLACK else Pawn.BLACK
+        self.hash ^= self.board.zobrist.side
+        self.possible_moves = possible_moves
+        self.legal = None
+
+        if possible_moves != [] : # La prise à continuer est rétablie
+            self.hash ^= self.board.zobrist.forced[possible_moves[0][:2]]
 
     
     def is_finished(self) -> Pawn :
         """
         Vérifie si la partie est terminée.
 
+        La partie est terminée lorsqu'un camp n'a plus de pions, lorsque la position courante s'est répétée `repetitions` fois (nulle),
+        après `quiet_limit` coups sans prise (le camp qui a le plus de pions gagne, nulle à égalité),
+        ou lorsque le joueur courant n'a aucun coup : il perd si `no_move_loses`, sinon la partie n'est arbitrée que si l'adversaire est lui aussi bloqué.
+
+        Returns:
+        --------
+        Pawn
+            Le gagnant, `Pawn.DRAW` si la partie est nulle, `Pawn.VOID` si elle n'est pas terminée.
+        """
+
+        black = self.board.count(Pawn.BLACK) # Compteurs tenus à jour par le plateau, sans le parcourir
+        white = self.board.count(Pawn.WHITE)
+
+        if black == 0 or white == 0 : # Un camp n'a plus de pions
+            if black > 0 :
+                return Pawn.BLACK
+            if white > 0 :
+                return Pawn.WHITE
+            return Pawn.VOID
+
+        if self.repetitions is not None and self.history.get(self.get_hash(), 0) >= self.repetitions : # Répétition de la position
+            return Pawn.DRAW
+
+        if self.quiet_limit is not None and self.quiet >= self.quiet_limit : # Arbitrage au nombre de pions
+            return Game._adjudicate(black, white)
+
+        if not self.has_legal_move() : # Le joueur courant est bloqué
+            opponent = Pawn.WHITE if self.current_player == Pawn.BLACK else Pawn.BLACK
+
+            if self.no_move_loses :
+                return opponent
+            if not self.board.can_move(opponent) : # Aucun des deux camps ne peut jouer
+                return Game._adjudicate(black, white)
+
+        return Pawn.VOID
+
+    @staticmethod
+    def _adjudicate(black:int, white:int) -> Pawn :
+        """
+        Arbitre une partie au nombre de pions.
+
+        Parameters:
+        -----------
+        black : int
+            Le nombre de pions bleus.
+        white : int
+            Le nombre de pions rouges.
+
+        Returns:
+        --------
+        Pawn
+            Le camp qui a le plus de pions, `Pawn.DRAW` à égalité.
+        """
+
+        if black > white :
+            return Pawn.BLACK
+        if white > black :
+            return Pawn.WHITE
+        return Pawn.DRAW
+
+    def has_legal_move(self) -> bool :
+        """
+        Vérifie si le joueur courant a au moins un coup autorisé.
+
+        Plus rapide que `get_legal_moves` lorsque les coups ne sont pas encore calculés : la recherche s'arrête au premier pion qui peut se déplacer.
+
         Returns:
         --------
         bool
-            True si la partie est terminée, False sinon.
+            True si le joueur courant a au moins un coup, False s'il ne peut que passer son tour.
         """
 
-        winner = Pawn.VOID # Initialise un gagnant non défini
-        for i in range(self.board.size) : # Parcours le plateau de jeu
-            for j in range(self.board.size) :
-                if self.board.get(i, j) != Pawn.VOID :
-                    if winner == Pawn.VOID :
-                        winner = self.board.get(i, j) # Définit le gagnant si non défini
-                    elif winner != self.board.get(i, j) : # Il reste des pions adverses
-                        return Pawn.VOID
-        
-        return winner
+        if self.legal is not None : # Coups déjà calculés
+            return self.legal != {}
+
+        if self.possible_moves != [] : # Prise à continuer
+            return True
+
+        return self.board.can_move(self.current_player)
 
     def __str__(self) -> str :
         """
@@ -166,14 +513,122 @@ class Game :
             Les coups possibles pour le pion.
         """
 
-        result = []
+        return self.board.get_moves(x, y)
+
+    def generate_moves(self, chains:bool=False) -> Iterator[tuple[int, int, int, int]] | Iterator[tuple[tuple[int, int, int, int], ...]] :
+        """
+        Génère, à la demande, tous les coups autorisés du joueur courant.
+
+        Les restrictions de `possible_moves` (prise à continuer) sont respectées. Les coups sont calculés pion par pion, au fil du parcours,
+        sauf s'ils l'ont déjà été pour cette position (voir `get_legal_moves`) ; un parcours complet les garde pour la suite.
+        La partie doit être dans le même état à chaque reprise du générateur : un coup joué entre deux reprises doit être annulé (voir `unmake`).
+
+        Parameters:
+        -----------
+        chains : bool, optional
+            Si False, génère les coups un par un (x1, y1, x2, y2).
+            Si True, génère des tours complets : un déplacement simple, ou une chaîne de prises menée jusqu'au bout comme l'impose `play`,
+            sous forme de tuple de coups.
+
+        Returns:
+        --------
+        Iterator[tuple[int, int, int, int]] | Iterator[tuple[tuple[int, int, int, int], ...]]
+            Les coups autorisés.
+        """
+
+        if not chains :
+            if self.legal is not None or self.possible_moves != [] : # Coups déjà calculés, ou seules les prises à continuer
+                yield from self.get_legal_moves()
+                return
+
+            legal = {} # Coups générés jusqu'ici, gardés comme coups autorisés de la position si le parcours va jusqu'au bout
+
+            for x1, y1 in self.board.get_player_pawns(self.current_player) :
+                for x2, y2, move in self.board.get_moves(x1, y1) :
+                    legal[(x1, y1, x2, y2)] = move
+                    yield (x1, y1, x2, y2)
+
+            self.legal = legal # La position est la même qu'au début du parcours
+            return
+
+        for move in self.generate_moves() :
+            x1, y1, x2, y2 = move
+
+            if abs(x2-x1) < 2 and abs(y2-y1) < 2 : # Déplacement simple
+                yield (move,)
+            else :
+                result = [] # Les chaînes sont énumérées puis le jeu restauré avant de les transmettre
+                self._chains((move,), result)
+                yield from result
+
+    def get_legal_moves(self) -> dict[tuple[int, int, int, int], Move] :
+        """
+        Retourne les coups autorisés du joueur courant, avec leur type.
+
+        Ils sont calculés une seule fois par position, puis gardés jusqu'à ce que la position change.
+        `make` les utilise pour valider un coup par une simple recherche, et `unmake` les restaure avec la position.
+        Le dictionnaire retourné ne doit pas être modifié.
+
+        Returns:
+        --------
+        dict[tuple[int, int, int, int], Move]
+            Les coups autorisés (x1, y1, x2, y2) et leur type, dans l'ordre de `generate_moves`.
+        """
+
+        if self.legal is None :
+            if self.possible_moves != [] : # Le joueur doit continuer sa prise
+                self.legal = dict.fromkeys(self.possible_moves, Move.TAKE)
+            else :
+                self.legal = {
+                    (x1, y1, x2, y2): move
+                    for x1, y1 in self.board.get_player_pawns(self.current_player)
+                    for x2, y2, move in self.board.get_moves(x1, y1)
+                }
+
+        return self.legal
+
+    def is_legal(self, x1:int, y1:int, x2:int, y2:int) -> bool :
+        """
+        Vérifie si un coup est autorisé pour le joueur courant, sans le jouer.
+
+        Parameters:
+        -----------
+        x1 : int
+            La coordonnée x de la case de départ du coup.
+        y1 : int
+            La coordonnée y de la case de départ du coup.
+        x2 : int
+            La coordonnée x de la case d'arrivée du coup.
+        y2 : int
+            La coordonnée y de la case d'arrivée du coup.
+
+        Returns:
+        --------
+        bool
+            True si le coup est autorisé, False sinon.
+        """
+
+        return (x1, y1, x2, y2) in self.get_legal_moves()
+
+    def _chains(self, steps:tuple[tuple[int, int, int, int], ...], result:list[tuple[tuple[int, int, int, int], ...]]) -> None :
+        """
+        Énumère les chaînes de prises complètes qui commencent par les coups donnés.
+
+        Parameters:
+        -----------
+        steps : tuple[tuple[int, int, int, int], ...]
+            Les prises déjà enchaînées, la dernière n'étant pas encore jouée.
+        result : list[tuple[tuple[int, int, int, int], ...]]
+            La liste dans laquelle les chaînes complètes sont ajoutées.
+        """
+
+        player = self.current_player
+        undo = self.make(*steps[-1])
 
-        for i in range(-1, 2) :
-            for j in range(-1, 2) :
-                for k in range(1, 3) : # Parcours les cases à une distance de 1 ou 2 autour du pion
-                    move = self.board.move_type(x, y, x+i*k, y+j*k)
+        if self.current_player == player : # Le joueur doit continuer sa prise
+            for move in self.possible_moves :
+                self._chains(steps + (move,), result)
+        else :
+            result.append(steps)
 
-                    if move != Move.INVALID :
-                        result.append((x+i*k, y+j*k, move)) # Ajoute le déplacement valide à la liste des coups possibles
-        
-        return result
\ No newline at end of file
+        self.unmake(undo)
\ No newline at end of file
@@ -0,0 +1,262 @@
+import mmap
+import os
+import struct
+from typing import Callable, Optional
+
+from controler.Game import Game
+from controler.Parallel import Parallel
+from controler.TranspositionTable import TranspositionTable
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+
+class OpeningBook :
+    # Début de tout fichier de livre d'ouvertures, suivi du numéro de version du format
+    MAGIC = b"AROB"
+    VERSION = 1
+
+    # Taille de l'en-tête (MAGIC, version, nombre de cases) et d'une case (clé de Zobrist, tour codé)
+    HEADER_SIZE = len(MAGIC) + 5
+    ENTRY_SIZE = 16
+
+    # Livres déjà ouverts, un par fichier (voir `OpeningBook.get`)
+    BOOKS = {}
+
+    def __init__(self, path:str) :
+        """
+        Prépare la consultation d'un livre d'ouvertures écrit par `OpeningBook.build`.
+
+        Le fichier n'est ouvert qu'à la première consultation, puis projeté en mémoire (mmap) :
+        seul l'en-tête est lu, puis les seules cases consultées.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier.
+        """
+
+        self.path = path
+        self.data = None # Contenu du fichier projeté en mémoire, None tant que le livre n'a pas été consulté
+        self.slots = 0
+
+    @staticmethod
+    def get(path:str) -> "OpeningBook" :
+        """
+        Retourne le livre d'ouvertures d'un fichier, ouvert une seule fois par processus.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier.
+
+        Returns:
+        --------
+        OpeningBook
+            Le livre d'ouvertures.
+        """
+
+        if path not in OpeningBook.BOOKS :
+            OpeningBook.BOOKS[path] = OpeningBook(path)
+
+        return OpeningBook.BOOKS[path]
+
+    def __reduce__(self) -> tuple :
+        """
+        Envoie le livre à un autre processus par son seul chemin : le processus qui le reçoit le projette lui-même en mémoire.
+
+        Returns:
+        --------
+        tuple
+            De quoi retrouver le livre dans l'autre processus (voir `OpeningBook.get`).
+        """
+
+        return OpeningBook.get, (self.path,)
+
+    @staticmethod
+    def build(path:str, sizes:list[int]=list(range(3, 10)), plies:int=2, time_limit:float=5.0, tt_mb:float=64, workers:int=1, progress:Optional[Callable[[int, int], None]]=None) -> int :
+        """
+        Construit un livre d'ouvertures par des recherches alpha-bêta profondes, puis l'écrit.
+
+        Les positions du livre sont celles atteintes en au plus `plies` tours depuis la position de départ de chaque taille,
+        tous les tours des deux joueurs étant envisagés (les transpositions ne sont cherchées qu'une fois).
+        Le meilleur tour de chaque position est cherché par `AlphaBetaIA`, les positions étant réparties entre les processus de travail.
+
+        Format : MAGIC, version (1 octet), nombre de cases (4 octets, puissance de 2), puis les cases : clé de Zobrist de la position (8 octets)
+        et meilleur tour (8 octets, voir `TranspositionTable._pack`), 0 pour une case vide. Une position est rangée dans la case `clé % nombre de cases`,
+        ou la suivante libre.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier. Il est écrit à côté puis renommé : une interruption ne laisse pas de livre incomplet.
+        sizes : list[int], optional
+            Les tailles de plateau.
+        plies : int, optional
+            Le nombre de tours couverts par le livre.
+        time_limit : float, optional
+            Le temps de recherche par position, en secondes.
+        tt_mb : float, optional
+            La taille de la table de transposition de chaque recherche, en mégaoctets.
+        workers : int, optional
+            Le nombre de processus de recherche. 1 pour chercher dans le processus courant.
+        progress : Optional[Callable[[int, int], None]], optional
+            Appelée après chaque position cherchée avec le nombre de positions cherchées et le nombre total de positions.
+
+        Returns:
+        --------
+        int
+            Le nombre de positions du livre.
+        """
+
+        from controler.autoplayer.AlphaBetaIA import AlphaBetaIA # Import local : le livre est consulté par les joueurs automatiques
+
+        positions = {} # Clé de Zobrist -> position sérialisée et tours possibles
+
+        for size in sizes :
+            frontier = [Game(size, backend=BitBoard, **Game.AUTOPLAY_RULES).to_bytes()]
+
+            for ply in range(plies + 1) :
+                following = []
+
+                for data in frontier :
+                    game = Game.from_bytes(data, BitBoard, Game.AUTOPLAY_RULES)
+                    key = game.get_hash()
+
+                    if key in positions or game.is_finished() != Pawn.VOID :
+                        continue
+
+                    chains = list(game.generate_moves(chains=True))
+
+                    if chains == [] :
+                        continue
+
+                    positions[key] = (data, chains)
+
+                    if ply < plies :
+                        for chain in chains :
+                            undos = [game.make(*move) for move in chain]
+                            following.append(game.to_bytes())
+                            for undo in reversed(undos) :
+                                game.unmake(undo)
+
+                frontier = following
+
+        options = {"time_limit": time_limit, "node_limit": None, "max_depth": 64, "tt": tt_mb, "tablebase": None}
+        keys = list(positions)
+        book = {}
+
+        if workers <= 1 :
+            tt = TranspositionTable(tt_mb)
+            for key in keys :
+                data, chains = positions[key]
+                tt.clear()
+                book[key] = AlphaBetaIA(Game.from_bytes(data, BitBoard, Game.AUTOPLAY_RULES), time_limit, tt=tt).search(AlphaBetaIA._ordered(chains))
+                if progress is not None :
+                    progress(len(book), len(keys))
+        else :
+            pool = Parallel.pool(workers)
+            futures = {key: pool.submit(Parallel.alphabeta, positions[key][0], BitBoard, options, AlphaBetaIA._ordered(positions[key][1]), Game.AUTOPLAY_RULES) for key in keys}
+            for key, future in futures.items() :
+                book[key] = future.result()[0]
+                if progress is not None :
+                    progress(len(book), len(keys))
+
+        entries = {key: TranspositionTable._pack(chain) for key, chain in book.items()}
+        entries = {key: code for key, code in entries.items() if code != 0} # Tours trop longs pour être codés
+
+        slots = 1
+        while slots < 2 * len(entries) : # Au plus une case sur deux occupée : les suites de cases occupées restent courtes
+            slots *= 2
+
+        table = bytearray(slots * OpeningBook.ENTRY_SIZE)
+
+        for key, code in entries.items() :
+            slot = key % slots
+            while struct.unpack_from("<Q", table, slot * OpeningBook.ENTRY_SIZE + 8)[0] != 0 :
+                slot = (slot + 1) % slots
+            struct.pack_into("<QQ", table, slot * OpeningBook.ENTRY_SIZE, key, code)
+
+        temp = path + ".tmp"
+
+        with open(temp, "wb") as f :
+            f.write(OpeningBook.MAGIC + bytes((OpeningBook.VERSION,)) + struct.pack("<I", slots))
+            f.write(table)
+
+        os.replace(temp, path)
+
+        return len(entries)
+
+    def lookup(self, game:Game) -> Optional[tuple[tuple[int, int, int, int], ...]] :
+        """
+        Cherche le tour du livre pour la position courante d'une partie.
+
+        Le tour trouvé est vérifié : il est joué puis annulé, pour écarter une position différente de même clé.
+
+        Parameters:
+        -----------
+        game : Game
+            La partie. Elle est restaurée après la vérification.
+
+        Returns:
+        --------
+        Optional[tuple[tuple[int, int, int, int], ...]]
+            Le tour du livre (suite de coups), ou None si la position n'est pas dans le livre.
+        """
+
+        if self.data is None :
+            self._open()
+
+        key = game.get_hash()
+        slot = key % self.slots
+
+        while True :
+            stored, code = struct.unpack_from("<QQ", self.data, OpeningBook.HEADER_SIZE + slot * OpeningBook.ENTRY_SIZE)
+
+            if code == 0 : # Case vide : la position n'est pas dans le livre
+                return None
+
+            if stored == key :
+                break
+
+            slot = (slot + 1) % self.slots
+
+        chain = TranspositionTable._unpack(code)
+        player = game.get_current_player()
+        undos = []
+        valid = True
+
+        for i, move in enumerate(chain) :
+            undo = game.make(*move)
+
+            if undo is None : # Coup refusé
+                valid = False
+                break
+
+            undos.append(undo)
+
+            if i < len(chain) - 1 and game.get_current_player() != player : # Chaîne interrompue
+                valid = False
+                break
+
+        for undo in reversed(undos) :
+            game.unmake(undo)
+
+        return chain if valid else None
+
+    def _open(self) -> None :
+        """
+        Ouvre le fichier, projette son contenu en mémoire et lit l'en-tête.
+
+        Raises:
+        -------
+        ValueError
+            Si le fichier n'est pas un livre d'ouvertures, ou d'une version inconnue.
+        """
+
+        with open(self.path, "rb") as f :
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) # La projection reste valable après la fermeture du fichier
+
+        if data[:len(OpeningBook.MAGIC)] != OpeningBook.MAGIC or data[len(OpeningBook.MAGIC)] != OpeningBook.VERSION :
+            raise ValueError(f"{self.path} n'est pas un livre d'ouvertures (version {OpeningBook.VERSION}).")
+
+        self.slots, = struct.unpack_from("<I", data, len(OpeningBook.MAGIC) + 1)
+        self.data = data
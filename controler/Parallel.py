@@ -0,0 +1,329 @@
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Any, Optional
+
+from controler.Game import Game
+from controler.TranspositionTable import TranspositionTable
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+from utils.Move import Move
+
+class Parallel :
+    # Groupes de processus déjà lancés, un par processus appelant et par nombre de processus (voir `Parallel.pool`)
+    POOLS = {}
+
+    # Événement d'arrêt partagé avec les processus de chaque groupe, même clé que `POOLS` (voir `Parallel.results`)
+    STOPS = {}
+
+    # Dans un processus de travail : l'événement d'arrêt de son groupe, consulté par les recherches
+    STOP = None
+
+    # Intervalle entre deux vérifications de la demande d'arrêt pendant l'attente des résultats, en secondes
+    CHECK_INTERVAL = 0.01
+
+    # Tables de transposition des processus de travail, gardées d'une recherche à l'autre
+    TABLES = {}
+
+    @staticmethod
+    def pool(workers:int) -> ProcessPoolExecutor :
+        """
+        Retourne un groupe de processus de travail, lancé une seule fois par nombre de processus.
+
+        Parameters:
+        -----------
+        workers : int
+            Le nombre de processus.
+
+        Returns:
+        --------
+        ProcessPoolExecutor
+            Le groupe de processus.
+        """
+
+        key = (os.getpid(), workers) # Un processus de travail ne doit pas réutiliser le groupe hérité de son parent
+
+        if key not in Parallel.POOLS :
+            stop = multiprocessing.Event()
+            Parallel.STOPS[key] = stop
+            Parallel.POOLS[key] = ProcessPoolExecutor(max_workers=workers, initializer=Parallel._init, initargs=(stop,))
+
+        return Parallel.POOLS[key]
+
+    @staticmethod
+    def _init(stop:Any) -> None :
+        """
+        Retient l'événement d'arrêt du groupe (exécutée au lancement de chaque processus de travail).
+
+        Parameters:
+        -----------
+        stop : multiprocessing.Event
+            L'événement d'arrêt du groupe.
+        """
+
+        Parallel.STOP = stop
+
+    @staticmethod
+    def results(futures:list[Future], workers:int, cancelled:threading.Event) -> list :
+        """
+        Attend les résultats des recherches soumises au groupe de `workers` processus, en transmettant aux processus une demande d'arrêt.
+
+        Tant que les recherches tournent, `cancelled` est surveillé : dès qu'il est levé (voir `AutoPlayer.think`),
+        l'événement d'arrêt du groupe l'est aussi, et chaque recherche retourne son meilleur résultat.
+
+        Parameters:
+        -----------
+        futures : list[Future]
+            Les recherches soumises.
+        workers : int
+            Le nombre de processus du groupe.
+        cancelled : threading.Event
+            La demande d'arrêt du joueur.
+
+        Returns:
+        --------
+        list
+            Les résultats, dans l'ordre des recherches.
+        """
+
+        stop = Parallel.STOPS[(os.getpid(), workers)]
+
+        try :
+            while wait(futures, timeout=Parallel.CHECK_INTERVAL).not_done :
+                if cancelled.is_set() :
+                    stop.set()
+
+            return [future.result() for future in futures]
+        finally :
+            stop.clear() # Toutes les recherches sont terminées : la suivante n'est pas arrêtée
+
+    @staticmethod
+    def remaining(deadline:Optional[float]) -> Optional[float] :
+        """
+        Convertit l'instant limite d'une recherche en temps restant, dans le processus qui la reçoit.
+
+        Parameters:
+        -----------
+        deadline : Optional[float]
+            L'instant limite (`time.time`, commun à tous les processus), None si la recherche n'est pas limitée.
+
+        Returns:
+        --------
+        Optional[float]
+            Le temps restant en secondes, None si la recherche n'est pas limitée.
+        """
+
+        if deadline is None :
+            return None
+
+        return max(0.0, deadline - time.time())
+
+    @staticmethod
+    def shutdown() -> None :
+        """
+        Arrête les groupes de processus lancés par le processus courant (exécutée à la fin du programme).
+
+        Les recherches en cours sont d'abord arrêtées, et les tâches pas encore commencées sont annulées.
+        """
+
+        for key in [key for key in Parallel.POOLS if key[0] == os.getpid()] :
+            Parallel.STOPS.pop(key).set()
+            Parallel.POOLS.pop(key).shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def split(items:list, parts:int) -> list[list] :
+        """
+        Répartit une liste en plusieurs parts, en alternance pour que chaque part reçoive des éléments de tête (les mieux classés).
+
+        Parameters:
+        -----------
+        items : list
+            Les éléments à répartir.
+        parts : int
+            Le nombre de parts.
+
+        Returns:
+        --------
+        list[list]
+            Les parts non vides.
+        """
+
+        return [items[i::parts] for i in range(parts) if items[i::parts] != []]
+
+    @staticmethod
+    def _table(size_mb:Optional[float]) -> Optional[TranspositionTable] :
+        """
+        Retourne la table de transposition du processus courant, créée au premier appel.
+
+        Parameters:
+        -----------
+        size_mb : Optional[float]
+            La taille de la table en mégaoctets, None pour ne pas en utiliser.
+
+        Returns:
+        --------
+        Optional[TranspositionTable]
+            La table de transposition.
+        """
+
+        if size_mb is None :
+            return None
+
+        if size_mb not in Parallel.TABLES :
+            Parallel.TABLES[size_mb] = TranspositionTable(size_mb)
+
+        return Parallel.TABLES[size_mb]
+
+    @staticmethod
+    def alphabeta(data:bytes, backend:type[Board | BitBoard], options:dict[str, Any], moves:list[tuple[tuple[int, int, int, int], ...]], rules:Optional[dict[str, Any]]=None) -> tuple[Optional[tuple[tuple[int, int, int, int], ...]], int, int, int] :
+        """
+        Recherche alpha-bêta restreinte à une partie des tours de la racine (exécutée dans un processus de travail).
+
+        Parameters:
+        -----------
+        data : bytes
+            La position sérialisée (voir `Game.to_bytes`).
+        backend : type[Board | BitBoard]
+            La représentation du plateau de jeu.
+        options : dict[str, Any]
+            Les paramètres du joueur (voir `AlphaBetaIA`), `tt` étant la taille de la table en mégaoctets et `tablebase` le chemin de la table de finales.
+            `time_limit` est remplacé par le temps restant avant `deadline`, s'il est donné (instant `time.time`, commun à tous les processus).
+        moves : list[tuple[tuple[int, int, int, int], ...]]
+            Les tours de la racine à chercher.
+        rules : Optional[dict[str, Any]], optional
+            Les règles de fin de partie (voir `Game.get_rules`).
+
+        Returns:
+        --------
+        tuple[Optional[tuple[tuple[int, int, int, int], ...]], int, int, int]
+            Le meilleur tour, son score, la profondeur atteinte et le nombre de positions visitées.
+        """
+
+        from controler.autoplayer.AlphaBetaIA import AlphaBetaIA # Import local : AlphaBetaIA importe ce module
+        from controler.Tablebase import Tablebase # Import local : Tablebase importe ce module
+
+        options = dict(options, tt=Parallel._table(options["tt"]), tablebase=Tablebase.get(options["tablebase"]) if options["tablebase"] is not None else None)
+        deadline = options.pop("deadline", None)
+        if deadline is not None : # Le temps passé dans la file d'attente est décompté
+            options["time_limit"] = Parallel.remaining(deadline)
+        player = AlphaBetaIA(Game.from_bytes(data, backend, rules), **options)
+
+        if Parallel.STOP is not None : # Arrêt demandé par le processus appelant (voir `Parallel.results`)
+            player.cancelled = Parallel.STOP
+
+        best = player.search(moves)
+
+        return best, player.score, player.depth, player.nodes
+
+    @staticmethod
+    def mcts(data:bytes, backend:type[Board | BitBoard], options:dict[str, Any], seed:int, rules:Optional[dict[str, Any]]=None) -> tuple[list[tuple[tuple[tuple[int, int, int, int], ...], int, float]], int] :
+        """
+        Recherche Monte-Carlo indépendante depuis la racine (exécutée dans un processus de travail).
+
+        Parameters:
+        -----------
+        data : bytes
+            La position sérialisée (voir `Game.to_bytes`).
+        backend : type[Board | BitBoard]
+            La représentation du plateau de jeu.
+        options : dict[str, Any]
+            Les paramètres du joueur (voir `MCTSIA`). `time_limit` est remplacé par le temps restant avant `deadline`, s'il est donné
+            (instant `time.time`, commun à tous les processus).
+        seed : int
+            La graine du générateur aléatoire, différente pour chaque processus.
+        rules : Optional[dict[str, Any]], optional
+            Les règles de fin de partie (voir `Game.get_rules`).
+
+        Returns:
+        --------
+        tuple[list[tuple[tuple[tuple[int, int, int, int], ...], int, float]], int]
+            Pour chaque tour de la racine, son nombre de visites et de victoires, puis le nombre de parties simulées.
+        """
+
+        from controler.autoplayer.MCTSIA import MCTSIA # Import local : MCTSIA importe ce module
+
+        options = dict(options)
+        deadline = options.pop("deadline", None)
+        if deadline is not None : # Le temps passé dans la file d'attente est décompté
+            options["time_limit"] = Parallel.remaining(deadline)
+        player = MCTSIA(Game.from_bytes(data, backend, rules), seed=seed, **options)
+
+        if Parallel.STOP is not None : # Arrêt demandé par le processus appelant (voir `Parallel.results`)
+            player.cancelled = Parallel.STOP
+
+        player.search()
+
+        return [(child.move, child.visits, child.wins) for child in player.root.children], player.playouts
+
+    @staticmethod
+    def heurist(data:bytes, backend:type[Board | BitBoard], possibles:list[tuple[tuple[int, int], tuple[int, int, Move]]], size_mb:Optional[float], rules:Optional[dict[str, Any]]=None) -> list[int] :
+        """
+        Évalue une partie des coups de la racine avec l'heuristique de `HeuristIA` (exécutée dans un processus de travail).
+
+        Parameters:
+        -----------
+        data : bytes
+            La position sérialisée (voir `Game.to_bytes`).
+        backend : type[Board | BitBoard]
+            La représentation du plateau de jeu.
+        possibles : list[tuple[tuple[int, int], tuple[int, int, Move]]]
+            Les coups à évaluer.
+        size_mb : Optional[float]
+            La taille de la table de transposition en mégaoctets, None pour ne pas en utiliser.
+        rules : Optional[dict[str, Any]], optional
+            Les règles de fin de partie (voir `Game.get_rules`).
+
+        Returns:
+        --------
+        list[int]
+            Le score de chaque coup, dans l'ordre. Si l'arrêt est demandé (voir `Parallel.results`), les coups restants ne sont pas évalués
+            et la liste est plus courte.
+        """
+
+        from controler.autoplayer.HeuristIA import HeuristIA # Import local : HeuristIA importe ce module
+
+        game = Game.from_bytes(data, backend, rules)
+        player = game.get_current_player()
+        tt = Parallel._table(size_mb)
+        scores = []
+
+        for pawn, move in possibles :
+            if Parallel.STOP is not None and Parallel.STOP.is_set() : # Arrêt demandé par le processus appelant
+                break
+
+            scores.append(HeuristIA._evaluate_move(game, player, pawn, move, tt))
+
+        return scores
+
+    @staticmethod
+    def tablebase(size:int, black:int, white:int, no_move_loses:bool, lower:dict[tuple[int, int], bytes]) -> bytes :
+        """
+        Résout une classe de matériel d'une table de finales (exécutée dans un processus de travail).
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+        black : int
+            Le nombre de pions bleus.
+        white : int
+            Le nombre de pions rouges.
+        no_move_loses : bool
+            La règle du joueur bloqué (voir `Game`).
+        lower : dict[tuple[int, int], bytes]
+            Les valeurs des classes atteintes par une prise.
+
+        Returns:
+        --------
+        bytes
+            Les valeurs des positions de la classe (voir `Tablebase.solve`).
+        """
+
+        from controler.Tablebase import Tablebase # Import local : Tablebase importe ce module
+
+        return Tablebase.solve(size, black, white, no_move_loses, lower)
+
+atexit.register(Parallel.shutdown)
\ No newline at end of file
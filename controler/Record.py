@@ -0,0 +1,313 @@
+import os
+import struct
+from typing import Any, Iterator, Optional
+
+from utils.Pawn import Pawn
+
+class Record :
+    # Début de tout fichier de parties, suivi du numéro de version du format
+    MAGIC = b"ARUB"
+    VERSION = 1
+
+    # Code d'un passe-tour dans un coup enregistré
+    PASS = 0xFFFF
+
+    # Codes du gagnant d'une partie
+    WINNERS = {Pawn.VOID: 0, Pawn.BLACK: 1, Pawn.WHITE: 2, Pawn.DRAW: 3}
+
+    @staticmethod
+    def encode(start:bytes, moves:list[Optional[tuple[int, int, int, int]]], black:str="", white:str="", winner:Pawn=Pawn.VOID) -> bytes :
+        """
+        Code une partie sous forme binaire.
+
+        Format : longueur de la partie codée (4 octets), position de départ (longueur sur 1 octet, puis voir `Game.to_bytes`),
+        noms des joueurs bleu puis rouge (longueur sur 1 octet, puis UTF-8), gagnant (1 octet : 0 aucun, 1 bleu, 2 rouge, 3 nulle),
+        puis les coups, 2 octets chacun : case de départ et case d'arrivée (`y * taille + x`), `PASS` pour un passe-tour.
+
+        Parameters:
+        -----------
+        start : bytes
+            La position de départ (voir `Game.to_bytes`).
+        moves : list[Optional[tuple[int, int, int, int]]]
+            Les coups (x1, y1, x2, y2) joués, None pour un passe-tour.
+        black : str, optional
+            Le nom du joueur bleu.
+        white : str, optional
+            Le nom du joueur rouge.
+        winner : Pawn, optional
+            Le gagnant, `Pawn.DRAW` si la partie est nulle, `Pawn.VOID` si elle est inachevée.
+
+        Returns:
+        --------
+        bytes
+            La partie codée.
+        """
+
+        size = start[0]
+        names = [name.encode("utf-8")[:255] for name in (black, white)]
+
+        body = bytearray()
+        body += bytes((len(start),)) + start
+        for name in names :
+            body += bytes((len(name),)) + name
+        body.append(Record.WINNERS[winner])
+
+        for move in moves :
+            if move is None :
+                body += Record.PASS.to_bytes(2, "little")
+            else :
+                x1, y1, x2, y2 = move
+                body += bytes((y1*size + x1, y2*size + x2))
+
+        return struct.pack("<I", len(body)) + bytes(body)
+
+    @staticmethod
+    def decode(body:bytes) -> dict[str, Any] :
+        """
+        Décode une partie codée par `encode`, sans sa longueur.
+
+        Parameters:
+        -----------
+        body : bytes
+            La partie codée.
+
+        Returns:
+        --------
+        dict[str, Any]
+            La taille du plateau (`size`), la position de départ (`start`, voir `Game.from_bytes`),
+            la configuration initiale (`config`), les noms des joueurs (`black`, `white`), le gagnant (`winner`)
+            et les coups (`moves`, None pour un passe-tour).
+        """
+
+        i = body[0] + 1
+        start = bytes(body[1:i])
+        size = start[0]
+
+        names = []
+        for _ in range(2) :
+            length = body[i]
+            names.append(body[i + 1 : i + 1 + length].decode("utf-8"))
+            i += 1 + length
+
+        winner = next(pawn for pawn, code in Record.WINNERS.items() if code == body[i])
+        i += 1
+
+        moves = []
+        for j in range(i, len(body), 2) :
+            a, b = body[j], body[j + 1]
+            if a == 0xFF and b == 0xFF :
+                moves.append(None)
+            else :
+                moves.append((a % size, a // size, b % size, b // size))
+
+        length = (size*size + 7) // 8
+        config = []
+        for k, p in enumerate((Pawn.BLACK, Pawn.WHITE)) :
+            mask = int.from_bytes(start[3 + k*length : 3 + (k+1)*length], "little")
+            config += [(sq % size, sq // size, p) for sq in range(size*size) if mask >> sq & 1]
+
+        return {
+            "size": size,
+            "start": start,
+            "config": config,
+            "black": names[0],
+            "white": names[1],
+            "winner": winner,
+            "moves": moves,
+        }
+
+    @staticmethod
+    def scan(path:str) -> tuple[int, int] :
+        """
+        Parcourt un fichier de parties en sautant d'une partie à la suivante, sans les lire.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier.
+
+        Returns:
+        --------
+        tuple[int, int]
+            Le nombre de parties complètes et la position de la fin de la dernière d'entre elles.
+        """
+
+        count = 0
+        size = os.path.getsize(path)
+
+        if size < len(Record.MAGIC) + 1 : # En-tête incomplet
+            return 0, 0
+
+        with open(path, "rb") as f :
+            end = f.seek(len(Record.MAGIC) + 1)
+
+            while True :
+                prefix = f.read(4)
+                if len(prefix) < 4 :
+                    break
+
+                length, = struct.unpack("<I", prefix)
+                if f.tell() + length > size :
+                    break
+
+                end = f.seek(length, os.SEEK_CUR)
+                count += 1
+
+        return count, end
+
+class RecordWriter :
+    def __init__(self, path:str) :
+        """
+        Ouvre un fichier de parties en ajout. L'en-tête est écrit si le fichier est nouveau (ou vide),
+        et une partie incomplète en fin de fichier est retirée.
+
+        Les parties sont écrites au fur et à mesure, sans être gardées en mémoire.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier.
+
+        Raises:
+        -------
+        ValueError
+            Si le fichier existe mais n'est pas un fichier de parties, ou d'une version inconnue. Il n'est pas modifié.
+        """
+
+        if os.path.exists(path) and os.path.getsize(path) > 0 :
+            with open(path, "rb") as f :
+                header = f.read(len(Record.MAGIC) + 1)
+
+            if header != Record.MAGIC + bytes((Record.VERSION,)) : # Vérifié avant toute troncature : un autre fichier n'est jamais écrasé
+                raise ValueError(f"{path} n'est pas un fichier de parties (version {Record.VERSION}).")
+
+            _, end = Record.scan(path)
+
+            if end < os.path.getsize(path) : # Retire une partie incomplète (écriture interrompue)
+                os.truncate(path, end)
+
+        self.file = open(path, "ab")
+
+        if self.file.tell() == 0 :
+            self.file.write(Record.MAGIC + bytes((Record.VERSION,)))
+
+        self.count = 0 # Nombre de parties écrites depuis l'ouverture
+
+    def write(self, start:bytes, moves:list[Optional[tuple[int, int, int, int]]], black:str="", white:str="", winner:Pawn=Pawn.VOID) -> None :
+        """
+        Ajoute une partie à la fin du fichier (voir `Record.encode`).
+
+        Parameters:
+        -----------
+        start : bytes
+            La position de départ (voir `Game.to_bytes`).
+        moves : list[Optional[tuple[int, int, int, int]]]
+            Les coups (x1, y1, x2, y2) joués, None pour un passe-tour.
+        black : str, optional
+            Le nom du joueur bleu.
+        white : str, optional
+            Le nom du joueur rouge.
+        winner : Pawn, optional
+            Le gagnant, `Pawn.DRAW` si la partie est nulle, `Pawn.VOID` si elle est inachevée.
+        """
+
+        self.file.write(Record.encode(start, moves, black, white, winner))
+        self.count += 1
+
+    def flush(self) -> None :
+        """
+        Écrit sur le disque les parties encore en mémoire tampon.
+        """
+
+        self.file.flush()
+
+    def close(self) -> None :
+        """
+        Ferme le fichier.
+        """
+
+        self.file.close()
+
+    def __enter__(self) -> "RecordWriter" :
+        """
+        Permet d'utiliser l'écrivain avec `with`.
+
+        Returns:
+        --------
+        RecordWriter
+            L'écrivain.
+        """
+
+        return self
+
+    def __exit__(self, *args:Any) -> None :
+        """
+        Ferme le fichier à la sortie du bloc `with`.
+        """
+
+        self.close()
+
+class RecordReader :
+    def __init__(self, path:str) :
+        """
+        Prépare la lecture d'un fichier de parties écrit par `RecordWriter`.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier.
+        """
+
+        self.path = path
+
+    def __iter__(self) -> Iterator[dict[str, Any]] :
+        """
+        Lit les parties une à une : une seule partie est gardée en mémoire à la fois.
+
+        Une partie incomplète en fin de fichier (écriture interrompue) est ignorée.
+
+        Returns:
+        --------
+        Iterator[dict[str, Any]]
+            Les parties, dans l'ordre du fichier (voir `Record.decode`).
+
+        Raises:
+        -------
+        ValueError
+            Si le fichier n'est pas un fichier de parties, ou d'une version inconnue.
+        """
+
+        with open(self.path, "rb") as f :
+            header = f.read(len(Record.MAGIC) + 1)
+
+            if header == b"" : # Fichier vide : aucune partie
+                return
+
+            if header[:-1] != Record.MAGIC or header[-1] != Record.VERSION :
+                raise ValueError(f"{self.path} n'est pas un fichier de parties (version {Record.VERSION}).")
+
+            while True :
+                prefix = f.read(4)
+                if len(prefix) < 4 :
+                    break
+
+                length, = struct.unpack("<I", prefix)
+                body = f.read(length)
+                if len(body) < length :
+                    break
+
+                yield Record.decode(body)
+
+    def __len__(self) -> int :
+        """
+        Compte les parties du fichier, sans les décoder.
+
+        Returns:
+        --------
+        int
+            Le nombre de parties complètes.
+        """
+
+        count, _ = Record.scan(self.path)
+
+        return count
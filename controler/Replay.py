@@ -0,0 +1,195 @@
+from typing import Any, Optional
+
+from controler.Game import Game
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+
+class Replay :
+    def __init__(self, record:dict[str, Any], interval:int=32, backend:type[Board | BitBoard]=Board, trusted:bool=False) :
+        """
+        Prépare la relecture d'une partie enregistrée, avec accès direct à n'importe quel coup.
+
+        La partie est jouée une fois à la construction : la position est retenue tous les `interval` coups (voir `Game.to_bytes`).
+        Aller au coup N repart de la position retenue la plus proche avant N, puis joue au plus `interval - 1` coups.
+        Les pas en avant et en arrière utilisent `make` et `unmake`.
+
+        Parameters:
+        -----------
+        record : dict[str, Any]
+            La partie, telle que lue par `RecordReader` (seuls `start` et `moves` sont utilisés).
+        interval : int, optional
+            Le nombre de coups entre deux positions retenues.
+        backend : type[Board | BitBoard], optional
+            La représentation du plateau de jeu.
+        trusted : bool, optional
+            Si True, les coups ne sont pas vérifiés (voir `Game.make`). À réserver aux parties dont les coups sont connus pour être valides.
+
+        Raises:
+        -------
+        ValueError
+            Si un coup de la partie est invalide (lorsque les coups sont vérifiés).
+        """
+
+        self.start = record["start"]
+        self.moves = record["moves"]
+        self.interval = max(1, interval)
+        self.backend = backend
+        self.trusted = trusted
+
+        self.snapshots = [] # Position avant le coup `i * interval`
+        game = Game.from_bytes(self.start, backend)
+
+        for i, move in enumerate(self.moves) :
+            if i % self.interval == 0 :
+                self.snapshots.append(game.to_bytes())
+
+            if self._apply(game, move) is None :
+                raise ValueError(f"Coup invalide au coup {i} : {move}.")
+
+        if len(self.moves) % self.interval == 0 : # Position finale
+            self.snapshots.append(game.to_bytes())
+
+        self.game = game
+        self.ply = len(self.moves) # Nombre de coups joués dans la position courante
+        self.undos = [] # Annulations des coups joués depuis la dernière position retenue chargée
+
+    def __len__(self) -> int :
+        """
+        Retourne le nombre de coups de la partie.
+
+        Returns:
+        --------
+        int
+            Le nombre de coups, passes comprises.
+        """
+
+        return len(self.moves)
+
+    def get_game(self) -> Game :
+        """
+        Retourne la partie dans la position courante. Elle ne doit pas être modifiée directement.
+
+        Returns:
+        --------
+        Game
+            La partie.
+        """
+
+        return self.game
+
+    def get_ply(self) -> int :
+        """
+        Retourne le nombre de coups joués dans la position courante.
+
+        Returns:
+        --------
+        int
+            Le numéro du coup courant.
+        """
+
+        return self.ply
+
+    def seek(self, ply:int) -> Game :
+        """
+        Va à la position après `ply` coups.
+
+        Si la position demandée est proche de la position courante, les coups sont joués ou annulés un à un.
+        Sinon, la position retenue la plus proche est chargée et au plus `interval - 1` coups sont joués.
+
+        Parameters:
+        -----------
+        ply : int
+            Le nombre de coups joués, ramené entre 0 et la longueur de la partie.
+
+        Returns:
+        --------
+        Game
+            La partie dans la position demandée.
+        """
+
+        ply = max(0, min(ply, len(self.moves)))
+
+        if self.ply <= ply < self.ply + self.interval : # Plus court en avançant depuis la position courante
+            while self.ply < ply :
+                self.forward()
+        elif ply < self.ply <= ply + len(self.undos) and self.ply - ply < self.interval : # Plus court en reculant
+            while self.ply > ply :
+                self.backward()
+        else :
+            self.game = Game.from_bytes(self.snapshots[ply // self.interval], self.backend)
+            self.ply = ply // self.interval * self.interval
+            self.undos = []
+
+            while self.ply < ply :
+                self.forward()
+
+        return self.game
+
+    def forward(self) -> bool :
+        """
+        Joue le coup suivant.
+
+        Returns:
+        --------
+        bool
+            True si un coup a été joué, False si la partie est déjà à la fin.
+        """
+
+        if self.ply >= len(self.moves) :
+            return False
+
+        move = self.moves[self.ply]
+        self.undos.append((move, self._apply(self.game, move)))
+        self.ply += 1
+
+        return True
+
+    def backward(self) -> bool :
+        """
+        Annule le dernier coup joué.
+
+        Returns:
+        --------
+        bool
+            True si un coup a été annulé, False si la partie est déjà au début.
+        """
+
+        if self.ply == 0 :
+            return False
+
+        if self.undos == [] : # Aucune annulation en mémoire : recharge depuis la position retenue précédente
+            self.seek(self.ply - 1)
+            return True
+
+        move, undo = self.undos.pop()
+
+        if move is None :
+            self.game.unpass_turn(undo)
+        else :
+            self.game.unmake(undo)
+
+        self.ply -= 1
+
+        return True
+
+    def _apply(self, game:Game, move:Optional[tuple[int, int, int, int]]) -> Optional[Any] :
+        """
+        Joue un coup enregistré sur une partie.
+
+        Parameters:
+        -----------
+        game : Game
+            La partie.
+        move : Optional[tuple[int, int, int, int]]
+            Le coup, None pour un passe-tour.
+
+        Returns:
+        --------
+        Optional[Any]
+            De quoi annuler le coup (voir `Game.make` et `Game.pass_turn`), ou None si le coup est invalide.
+        """
+
+        if move is None :
+            return game.pass_turn()
+
+        return game.make(*move, trusted=self.trusted)
@@ -0,0 +1,213 @@
+import random
+from time import perf_counter
+from typing import Any, Optional
+
+from controler.Game import Game
+from controler.AutoPlayer import AutoPlayer
+from controler.Parallel import Parallel
+from controler.Record import RecordWriter
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+from utils.MoveCode import MoveCode
+
+class Runner :
+    def __init__(self, black:tuple[type[AutoPlayer], dict[str, Any]], white:tuple[type[AutoPlayer], dict[str, Any]], size:int=7, backend:type[Board | BitBoard]=BitBoard, max_moves:int=500, workers:int=1, rules:dict[str, Any]=Game.AUTOPLAY_RULES) :
+        """
+        Construit un lanceur de parties entre deux joueurs automatiques, sans affichage ni saisie.
+
+        Les joueurs sont décrits par leur classe et les paramètres de leur constructeur (hors jeu) :
+        ils sont construits à nouveau pour chaque partie, dans le processus qui la joue.
+        Les coups sont obtenus par `AutoPlayer.choose`, sous forme de coups codés (voir `MoveCode`), sans passer par du texte.
+
+        Parameters:
+        -----------
+        black : tuple[type[AutoPlayer], dict[str, Any]]
+            La classe et les paramètres du joueur bleu.
+        white : tuple[type[AutoPlayer], dict[str, Any]]
+            La classe et les paramètres du joueur rouge.
+        size : int, optional
+            La taille du plateau.
+        backend : type[Board | BitBoard], optional
+            La représentation du plateau de jeu.
+        max_moves : int, optional
+            Le nombre maximal de coups d'une partie. Au-delà, la partie est nulle.
+        workers : int, optional
+            Le nombre de processus jouant les parties. 1 pour jouer les parties dans le processus courant.
+        rules : dict[str, Any], optional
+            Les règles de fin de partie (voir `Game.get_rules`). Par défaut, nulle par répétition et arbitrage des parties sans prise (`Game.AUTOPLAY_RULES`).
+        """
+
+        self.black = black
+        self.white = white
+        self.size = size
+        self.backend = backend
+        self.max_moves = max_moves
+        self.workers = workers
+        self.rules = rules
+
+    def run(self, games:int, seed:Optional[int]=None, path:Optional[str]=None) -> list[dict[str, Any]] :
+        """
+        Joue plusieurs parties, réparties entre les processus de travail.
+
+        Parameters:
+        -----------
+        games : int
+            Le nombre de parties.
+        seed : Optional[int], optional
+            La graine de la première partie, les suivantes utilisant les graines suivantes. Par défaut, une graine au hasard.
+        path : Optional[str], optional
+            Le fichier de parties (voir `RecordWriter`) auquel ajouter les parties, au fur et à mesure. None pour ne pas les enregistrer.
+
+        Returns:
+        --------
+        list[dict[str, Any]]
+            Le résultat de chaque partie, dans l'ordre (voir `Runner.play`).
+        """
+
+        if seed is None :
+            seed = random.getrandbits(32)
+
+        args = [(self.size, self.backend, self.black, self.white, self.max_moves, seed + i, self.rules) for i in range(games)]
+
+        if self.workers <= 1 :
+            results = (Runner.play(*arg) for arg in args)
+        else :
+            pool = Parallel.pool(self.workers)
+            futures = [pool.submit(Runner.play, *arg) for arg in args]
+            results = (future.result() for future in futures)
+
+        if path is None :
+            return list(results)
+
+        with RecordWriter(path) as writer :
+            played = []
+
+            for result in results :
+                writer.write(result["start"], result["shots"], result["black"], result["white"], result["winner"])
+                played.append(result)
+
+        return played
+
+    @staticmethod
+    def play(size:int, backend:type[Board | BitBoard], black:tuple[type[AutoPlayer], dict[str, Any]], white:tuple[type[AutoPlayer], dict[str, Any]], max_moves:int, seed:int, rules:dict[str, Any]=Game.AUTOPLAY_RULES) -> dict[str, Any] :
+        """
+        Joue une partie complète entre deux joueurs automatiques.
+
+        Un joueur qui n'a aucun coup passe son tour, et la partie est arbitrée si aucun des deux ne peut jouer (voir `Game.is_finished`).
+        La partie est nulle si les deux joueurs passent l'un après l'autre ou si `max_moves` coups sont joués. Un joueur qui propose un coup refusé par le jeu perd la partie.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+        backend : type[Board | BitBoard]
+            La représentation du plateau de jeu.
+        black : tuple[type[AutoPlayer], dict[str, Any]]
+            La classe et les paramètres du joueur bleu.
+        white : tuple[type[AutoPlayer], dict[str, Any]]
+            La classe et les paramètres du joueur rouge.
+        max_moves : int
+            Le nombre maximal de coups.
+        seed : int
+            La graine du générateur aléatoire du module `random`, pour que chaque partie soit différente d'un processus à l'autre.
+        rules : dict[str, Any], optional
+            Les règles de fin de partie (voir `Game.get_rules`).
+
+        Returns:
+        --------
+        dict[str, Any]
+            Le gagnant (`winner`, `Pawn.DRAW` pour une nulle déclarée par le jeu, `Pawn.VOID` pour une partie bloquée ou trop longue), la raison de la fin de partie (`reason` : "finished", "blocked", "limit" ou "illegal"),
+            le nombre de coups joués, passes comprises (`moves`), la durée de réflexion de chaque coup, en secondes, par joueur (`times`),
+            la position de départ (`start`, voir `Game.to_bytes`), les coups joués, refusés exclus (`shots`, None pour un passe-tour)
+            et le nom des joueurs (`black`, `white`).
+        """
+
+        random.seed(seed)
+
+        game = Game(size, backend=backend, **rules)
+        players = {
+            Pawn.BLACK: black[0](game, **black[1]),
+            Pawn.WHITE: white[0](game, **white[1]),
+        }
+        times = {Pawn.BLACK: [], Pawn.WHITE: []}
+        start = game.to_bytes()
+        shots = []
+
+        winner = Pawn.VOID
+        reason = "limit"
+        passes = 0
+
+        for _ in range(max_moves) :
+            player = game.get_current_player()
+
+            begin = perf_counter()
+            move = players[player].choose()
+            times[player].append(perf_counter() - begin)
+
+            if move == MoveCode.PASS : # Le joueur passe son tour
+                passes += 1
+                if passes == 2 : # Les deux joueurs passent l'un après l'autre
+                    reason = "blocked"
+                    break
+                game.pass_turn()
+                shots.append(None)
+            else :
+                passes = 0
+
+                if move is None or not game.play_code(move) :
+                    winner = Pawn.WHITE if player == Pawn.BLACK else Pawn.BLACK
+                    reason = "illegal"
+                    break
+
+                players[player].played()
+                shots.append(MoveCode.decode(move))
+
+            winner = game.is_finished()
+
+            if winner != Pawn.VOID :
+                reason = "finished"
+                break
+
+        return {
+            "winner": winner,
+            "reason": reason,
+            "moves": len(times[Pawn.BLACK]) + len(times[Pawn.WHITE]),
+            "times": times,
+            "start": start,
+            "shots": shots,
+            "black": players[Pawn.BLACK].get_name(),
+            "white": players[Pawn.WHITE].get_name(),
+        }
+
+    @staticmethod
+    def summary(results:list[dict[str, Any]]) -> dict[str, float] :
+        """
+        Résume les résultats de plusieurs parties.
+
+        Parameters:
+        -----------
+        results : list[dict[str, Any]]
+            Les résultats des parties (voir `Runner.play`).
+
+        Returns:
+        --------
+        dict[str, float]
+            Le nombre de parties (`games`), de victoires de chaque joueur (`black`, `white`) et de nulles (`draws`),
+            la longueur moyenne des parties en coups (`length`), la durée moyenne d'un coup de chaque joueur (`time_black`, `time_white`)
+            et la durée du coup le plus long (`time_max`), en secondes.
+        """
+
+        black = [t for result in results for t in result["times"][Pawn.BLACK]]
+        white = [t for result in results for t in result["times"][Pawn.WHITE]]
+
+        return {
+            "games": len(results),
+            "black": sum(result["winner"] == Pawn.BLACK for result in results),
+            "white": sum(result["winner"] == Pawn.WHITE for result in results),
+            "draws": sum(result["winner"] in (Pawn.VOID, Pawn.DRAW) for result in results),
+            "length": sum(result["moves"] for result in results) / len(results) if results != [] else 0.0,
+            "time_black": sum(black) / len(black) if black != [] else 0.0,
+            "time_white": sum(white) / len(white) if white != [] else 0.0,
+            "time_max": max(black + white, default=0.0),
+        }
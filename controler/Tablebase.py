@@ -0,0 +1,530 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from heapq import heappop, heappush
+from itertools import combinations
+from math import comb
+from typing import Callable, Optional
+
+from controler.Game import Game
+from controler.Parallel import Parallel
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+
+class Tablebase :
+    # Début de tout fichier de tables de finales, suivi du numéro de version du format
+    MAGIC = b"ARTB"
+    VERSION = 1
+
+    # Taille de l'en-tête : MAGIC, version, taille du plateau, nombre maximal de pions et règle du joueur bloqué, 1 octet chacun
+    HEADER_SIZE = len(MAGIC) + 4
+
+    # Nombre maximal de pions par défaut, par taille de plateau (au plus quelques centaines de milliers de positions)
+    PIECES = {3: 9, 4: 5, 5: 4}
+
+    # Coefficients binomiaux C(n, k), pour numéroter les ensembles de cases
+    BINOMIAL = [[comb(n, k) for k in range(10)] for n in range(82)]
+
+    # Tables déjà ouvertes, une par fichier (voir `Tablebase.get`)
+    TABLES = {}
+
+    def __init__(self, path:str) :
+        """
+        Prépare la consultation d'une table de finales écrite par `Tablebase.generate`.
+
+        Le fichier n'est ouvert qu'à la première consultation, puis projeté en mémoire (mmap) :
+        seules les pages des positions consultées sont lues, et les processus qui consultent la même table partagent ces pages.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier.
+        """
+
+        self.path = path
+        self.data = None # Contenu du fichier projeté en mémoire, None tant que la table n'a pas été consultée
+        self.size = 0
+        self.pieces = 0
+        self.no_move_loses = False
+        self.offsets = {} # Position de chaque classe de matériel dans le fichier (voir `Tablebase.classes`)
+
+    @staticmethod
+    def get(path:str) -> "Tablebase" :
+        """
+        Retourne la table de finales d'un fichier, ouverte une seule fois par processus.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier.
+
+        Returns:
+        --------
+        Tablebase
+            La table de finales.
+        """
+
+        if path not in Tablebase.TABLES :
+            Tablebase.TABLES[path] = Tablebase(path)
+
+        return Tablebase.TABLES[path]
+
+    def __reduce__(self) -> tuple :
+        """
+        Envoie la table à un autre processus par son seul chemin : le processus qui la reçoit la projette lui-même en mémoire.
+
+        Returns:
+        --------
+        tuple
+            De quoi retrouver la table dans l'autre processus (voir `Tablebase.get`).
+        """
+
+        return Tablebase.get, (self.path,)
+
+    @staticmethod
+    def classes(size:int, pieces:int) -> list[tuple[int, int, int]] :
+        """
+        Retourne les classes de matériel d'une table, dans l'ordre du fichier.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+        pieces : int
+            Le nombre maximal de pions sur le plateau.
+
+        Returns:
+        --------
+        list[tuple[int, int, int]]
+            Pour chaque classe : le nombre de pions bleus, le nombre de pions rouges et le nombre de positions (sans le joueur courant).
+        """
+
+        n = size * size
+
+        return [
+            (black, white, comb(n, black) * comb(n - black, white))
+            for black in range(1, pieces)
+            for white in range(1, pieces - black + 1)
+            if black + white <= n
+        ]
+
+    @staticmethod
+    def index(size:int, black:int, white:int, player:int) -> int :
+        """
+        Retourne le numéro d'une position dans sa classe de matériel.
+
+        Les cases bleues sont numérotées dans l'ordre colexicographique parmi toutes les cases,
+        les cases rouges parmi les cases restantes : deux positions différentes ont toujours deux numéros différents.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+        black : int
+            Le masque des pions bleus (bit `y * taille + x`).
+        white : int
+            Le masque des pions rouges.
+        player : int
+            Le joueur courant : 0 bleu, 1 rouge.
+
+        Returns:
+        --------
+        int
+            Le numéro de la position.
+        """
+
+        binomial = Tablebase.BINOMIAL
+        n = size * size
+
+        rank_black = 0
+        k = 0
+        mask = black
+        while mask :
+            bit = mask & -mask
+            k += 1
+            rank_black += binomial[bit.bit_length() - 1][k]
+            mask ^= bit
+
+        rank_white = 0
+        count = 0
+        mask = white
+        while mask :
+            bit = mask & -mask
+            count += 1
+            rank_white += binomial[bit.bit_length() - 1 - (black & (bit - 1)).bit_count()][count] # Case numérotée sans les cases bleues
+            mask ^= bit
+
+        return (rank_black * comb(n - k, count) + rank_white) << 1 | player
+
+    @staticmethod
+    def generate(path:str, size:int, pieces:Optional[int]=None, no_move_loses:bool=False, workers:int=1, progress:Optional[Callable[[int, int], None]]=None) -> None :
+        """
+        Résout toutes les positions d'au plus `pieces` pions d'une taille de plateau par analyse rétrograde, puis écrit la table.
+
+        Les classes de matériel sont résolues par nombre de pions croissant : une prise mène toujours à une classe déjà résolue.
+        Les classes d'un même nombre de pions sont indépendantes et réparties entre les processus de travail.
+
+        Format : MAGIC, version, taille, nombre maximal de pions, règle du joueur bloqué (1 octet chacun),
+        puis la valeur de chaque position (2 octets, petit-boutiste), classe par classe (voir `Tablebase.classes` et `Tablebase.index`).
+        Valeur : 0 nulle, `2 * d + 1` victoire du joueur courant en `d` tours, `2 * d + 2` défaite en `d` tours.
+
+        Parameters:
+        -----------
+        path : str
+            Le chemin du fichier. Il est écrit à côté puis renommé : une interruption ne laisse pas de table incomplète.
+        size : int
+            La taille du plateau, entre 3 et 5 en pratique (voir `Tablebase.PIECES`).
+        pieces : Optional[int], optional
+            Le nombre maximal de pions sur le plateau. Par défaut, celui de `Tablebase.PIECES`.
+        no_move_loses : bool, optional
+            La règle du joueur bloqué (voir `Game`). La table ne sert qu'aux parties jouées avec la même règle.
+        workers : int, optional
+            Le nombre de processus de calcul. 1 pour calculer dans le processus courant.
+        progress : Optional[Callable[[int, int], None]], optional
+            Appelée après chaque classe résolue avec le nombre de classes résolues et le nombre total de classes.
+        """
+
+        if pieces is None :
+            pieces = Tablebase.PIECES.get(size, 3)
+
+        pieces = max(2, min(pieces, 9))
+        classes = Tablebase.classes(size, pieces)
+        solved = {} # Valeurs de chaque classe résolue, sous forme binaire
+
+        for total in range(2, pieces + 1) :
+            batch = [(black, white) for black, white, _ in classes if black + white == total]
+            args = [
+                (size, black, white, no_move_loses, {key: value for key, value in solved.items() if (key[0] == black and key[1] < white) or (key[1] == white and key[0] < black)})
+                for black, white in batch
+            ]
+
+            if workers <= 1 or len(batch) == 1 :
+                results = [Tablebase.solve(*arg) for arg in args]
+            else :
+                pool = Parallel.pool(workers)
+                results = [future.result() for future in [pool.submit(Parallel.tablebase, *arg) for arg in args]]
+
+            for key, result in zip(batch, results) :
+                solved[key] = result
+                if progress is not None :
+                    progress(len(solved), len(classes))
+
+        temp = path + ".tmp"
+
+        with open(temp, "wb") as f :
+            f.write(Tablebase.MAGIC + bytes((Tablebase.VERSION, size, pieces, int(no_move_loses))))
+            for black, white, _ in classes :
+                f.write(solved[(black, white)])
+
+        os.replace(temp, path)
+
+    @staticmethod
+    def solve(size:int, black:int, white:int, no_move_loses:bool, lower:dict[tuple[int, int], bytes]) -> bytes :
+        """
+        Résout une classe de matériel par analyse rétrograde.
+
+        Un tour est un déplacement simple, une chaîne de prises menée jusqu'au bout (comme dans `Game.generate_moves`),
+        ou un passe-tour lorsque le joueur est bloqué. Les positions perdues et gagnées sont fixées par distance croissante,
+        en remontant les déplacements simples (seuls coups qui restent dans la classe) : les distances sont donc optimales.
+        Les positions jamais fixées sont nulles (les règles de répétition et de coups sans prise de `Game` sont ignorées).
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+        black : int
+            Le nombre de pions bleus.
+        white : int
+            Le nombre de pions rouges.
+        no_move_loses : bool
+            La règle du joueur bloqué (voir `Game`).
+        lower : dict[tuple[int, int], bytes]
+            Les valeurs des classes atteintes par une prise (voir `Tablebase.generate`).
+
+        Returns:
+        --------
+        bytes
+            Les valeurs des positions de la classe, dans l'ordre de `Tablebase.index`.
+        """
+
+        n = size * size
+        full = (1 << n) - 1
+        neighbours, jumps, _, _ = BitBoard._tables(size)
+        tables = {}
+        for key, value in lower.items() :
+            tables[key] = array("H")
+            tables[key].frombytes(value)
+            if sys.byteorder != "little" :
+                tables[key].byteswap()
+
+        count = comb(n, black) * comb(n - black, white)
+        blacks = array("Q", [0]) * count # Masques de chaque position
+        whites = array("Q", [0]) * count
+
+        for squares in combinations(range(n), black) :
+            b = sum(1 << sq for sq in squares)
+            free = [sq for sq in range(n) if not b >> sq & 1]
+            for others in combinations(free, white) :
+                w = sum(1 << sq for sq in others)
+                position = Tablebase.index(size, b, w, 0) >> 1
+                blacks[position] = b
+                whites[position] = w
+
+        values = array("H", [0]) * (2 * count)
+        done = bytearray(2 * count)
+        remaining = array("H", [0]) * (2 * count) # Tours restant dans la classe non encore réfutés
+        outside = array("i", [-1]) * (2 * count) # Meilleure défaite par une prise (distance), -1 si aucune prise, -2 si une prise fait au moins nulle
+        heap = [] # (distance, valeur, position) à fixer
+
+        def can_move(own:int, opponent:int) -> bool :
+            empty = full & ~(own | opponent)
+            mask = own
+            while mask :
+                bit = mask & -mask
+                sq = bit.bit_length() - 1
+                if neighbours[sq] & empty :
+                    return True
+                for dest, over in jumps[sq].items() :
+                    if dest & empty and over & opponent :
+                        return True
+                mask ^= bit
+            return False
+
+        def chains(sq:int, own:int, opponent:int, result:list[tuple[int, int]]) -> None :
+            empty = full & ~(own | opponent)
+            ended = True
+            for dest, over in jumps[sq].items() :
+                if dest & empty and over & opponent :
+                    ended = False
+                    chains(dest.bit_length() - 1, own ^ (1 << sq) ^ dest, opponent ^ over, result)
+            if ended :
+                result.append((own, opponent))
+
+        for index in range(2 * count) : # Valeurs connues sans chercher dans la classe : fins de partie, prises et joueurs bloqués
+            b, w = blacks[index >> 1], whites[index >> 1]
+            player = index & 1
+            own, opponent = (b, w) if player == 0 else (w, b)
+            empty = full & ~(b | w)
+            steps = 0
+            takes = []
+
+            mask = own
+            while mask :
+                bit = mask & -mask
+                sq = bit.bit_length() - 1
+                steps += (neighbours[sq] & empty).bit_count()
+                for dest, over in jumps[sq].items() :
+                    if dest & empty and over & opponent :
+                        chains(dest.bit_length() - 1, own ^ bit ^ dest, opponent ^ over, takes)
+                mask ^= bit
+
+            if steps == 0 and takes == [] : # Joueur bloqué
+                if no_move_loses :
+                    heappush(heap, (0, 2, index))
+                elif not can_move(opponent, own) : # Aucun des deux camps ne peut jouer : arbitrage au nombre de pions
+                    mine, theirs = (black, white) if player == 0 else (white, black)
+                    if mine != theirs :
+                        heappush(heap, (0, 1 if mine > theirs else 2, index))
+                    else :
+                        done[index] = 1
+                else :
+                    remaining[index] = 1 # Passe-tour
+                continue
+
+            remaining[index] = steps
+            win = None
+
+            for own2, opponent2 in takes :
+                if opponent2 == 0 : # L'adversaire n'a plus de pions
+                    win = 1
+                    break
+
+                b2, w2 = (own2, opponent2) if player == 0 else (opponent2, own2)
+                value = tables[(b2.bit_count(), w2.bit_count())][Tablebase.index(size, b2, w2, 1 - player)]
+
+                if value == 0 :
+                    outside[index] = -2
+                elif value % 2 == 0 : # L'adversaire perd
+                    d = value // 2
+                    win = d if win is None else min(win, d)
+                elif outside[index] != -2 : # L'adversaire gagne
+                    outside[index] = max(outside[index], (value + 1) // 2)
+
+            if win is not None :
+                heappush(heap, (win, 2 * win + 1, index))
+            elif steps == 0 and outside[index] >= 0 : # Toutes les prises perdent
+                heappush(heap, (outside[index], 2 * outside[index] + 2, index))
+
+        while heap :
+            d, value, index = heappop(heap)
+
+            if done[index] :
+                continue
+
+            done[index] = 1
+            values[index] = value
+
+            b, w = blacks[index >> 1], whites[index >> 1]
+            previous = 1 - (index & 1) # Joueur qui a joué le tour menant à la position
+            own, opponent = (b, w) if previous == 0 else (w, b)
+            empty = full & ~(b | w)
+            predecessors = []
+
+            mask = own
+            while mask : # Déplacements simples joués à l'envers
+                bit = mask & -mask
+                sq = bit.bit_length() - 1
+                origins = neighbours[sq] & empty
+                while origins :
+                    origin = origins & -origins
+                    own2 = own ^ bit ^ origin
+                    b2, w2 = (own2, opponent) if previous == 0 else (opponent, own2)
+                    predecessors.append(Tablebase.index(size, b2, w2, previous))
+                    origins ^= origin
+                mask ^= bit
+
+            if not no_move_loses and not can_move(own, opponent) and can_move(opponent, own) : # Passe-tour forcé du joueur précédent (sinon, fin de partie)
+                predecessors.append(index ^ 1)
+
+            for predecessor in predecessors :
+                if done[predecessor] :
+                    continue
+
+                if value % 2 == 0 : # Le joueur courant perd : le joueur précédent gagne en un tour de plus
+                    heappush(heap, (d + 1, 2 * (d + 1) + 1, predecessor))
+                else :
+                    remaining[predecessor] -= 1
+                    if remaining[predecessor] == 0 and outside[predecessor] != -2 : # Tous les tours perdent
+                        loss = max(d + 1, outside[predecessor])
+                        heappush(heap, (loss, 2 * loss + 2, predecessor))
+
+        if sys.byteorder != "little" :
+            values.byteswap()
+
+        return values.tobytes()
+
+    def probe(self, game:Game) -> Optional[tuple[Pawn, int]] :
+        """
+        Cherche la position courante d'une partie dans la table, en temps constant.
+
+        Parameters:
+        -----------
+        game : Game
+            La partie.
+
+        Returns:
+        --------
+        Optional[tuple[Pawn, int]]
+            Le gagnant avec un jeu parfait (`Pawn.DRAW` si la partie est nulle) et le nombre de tours avant sa victoire (0 pour une nulle),
+            ou None si la position n'est pas dans la table (autre taille, trop de pions, prise à continuer, partie terminée ou autre règle du joueur bloqué).
+        """
+
+        if self.data is None :
+            self._open()
+
+        black = game.count(Pawn.BLACK)
+        white = game.count(Pawn.WHITE)
+
+        if game.get_size() != self.size or black == 0 or white == 0 or black + white > self.pieces or game.no_move_loses != self.no_move_loses :
+            return None
+
+        data = game.to_bytes()
+
+        if data[2] != 255 : # Prise à continuer : seuls les débuts de tour sont dans la table
+            return None
+
+        length = (self.size * self.size + 7) // 8
+        b = int.from_bytes(data[3 : 3 + length], "little")
+        w = int.from_bytes(data[3 + length : 3 + 2*length], "little")
+
+        value, = struct.unpack_from("<H", self.data, self.offsets[(black, white)] + 2 * Tablebase.index(self.size, b, w, data[1]))
+
+        if value == 0 :
+            return Pawn.DRAW, 0
+
+        player = game.get_current_player()
+
+        if value % 2 == 1 :
+            return player, (value - 1) // 2
+
+        return Pawn.WHITE if player == Pawn.BLACK else Pawn.BLACK, (value - 2) // 2
+
+    def best(self, game:Game) -> Optional[tuple[tuple[int, int, int, int], ...]] :
+        """
+        Retourne le meilleur tour du joueur courant d'après la table : la victoire la plus rapide, sinon une nulle, sinon la défaite la plus lente.
+
+        Parameters:
+        -----------
+        game : Game
+            La partie. Elle est restaurée après l'examen des tours.
+
+        Returns:
+        --------
+        Optional[tuple[tuple[int, int, int, int], ...]]
+            Le meilleur tour (suite de coups), ou None si la position n'est pas dans la table ou si le joueur n'a aucun coup.
+        """
+
+        if self.probe(game) is None :
+            return None
+
+        player = game.get_current_player()
+        best = None
+        best_key = None
+
+        for chain in game.generate_moves(chains=True) :
+            undos = [game.make(*move) for move in chain]
+
+            if game.count(Pawn.WHITE if player == Pawn.BLACK else Pawn.BLACK) == 0 : # Dernier pion adverse pris
+                key = (2, -1)
+            else :
+                entry = self.probe(game)
+                if entry is None :
+                    key = None
+                elif entry[0] == player :
+                    key = (2, -entry[1] - 1)
+                elif entry[0] == Pawn.DRAW :
+                    key = (1, 0)
+                else :
+                    key = (0, entry[1] + 1)
+
+            for undo in reversed(undos) :
+                game.unmake(undo)
+
+            if key is None :
+                return None
+
+            if best_key is None or key > best_key :
+                best = chain
+                best_key = key
+
+        return best
+
+    def _open(self) -> None :
+        """
+        Ouvre le fichier, projette son contenu en mémoire et lit l'en-tête.
+
+        Raises:
+        -------
+        ValueError
+            Si le fichier n'est pas une table de finales, ou d'une version inconnue.
+        """
+
+        with open(self.path, "rb") as f :
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) # La projection reste valable après la fermeture du fichier
+
+        magic, (version, size, pieces, no_move_loses) = data[:len(Tablebase.MAGIC)], data[len(Tablebase.MAGIC) : Tablebase.HEADER_SIZE]
+
+        if magic != Tablebase.MAGIC or version != Tablebase.VERSION :
+            raise ValueError(f"{self.path} n'est pas une table de finales (version {Tablebase.VERSION}).")
+
+        offset = Tablebase.HEADER_SIZE
+        for black, white, count in Tablebase.classes(size, pieces) :
+            self.offsets[(black, white)] = offset
+            offset += 4 * count # 2 octets par position et par joueur courant
+
+        self.size = size
+        self.pieces = pieces
+        self.no_move_loses = bool(no_move_loses)
+        self.data = data
@@ -0,0 +1,395 @@
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, wait
+from math import exp, log, sqrt
+from typing import Any, Callable, Optional
+
+from controler.AutoPlayer import AutoPlayer
+from controler.Game import Game
+from controler.Parallel import Parallel
+from controler.Runner import Runner
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+
+class Tournament :
+    # Joueurs automatiques inscrits par défaut : nom -> (classe, paramètres du constructeur hors jeu) (voir `Tournament.register`)
+    REGISTRY = {}
+
+    # Score d'une partie pour le joueur bleu
+    SCORES = {Pawn.BLACK: 1.0, Pawn.WHITE: 0.0, Pawn.DRAW: 0.5, Pawn.VOID: 0.5}
+
+    def __init__(self, players:Optional[dict[str, tuple[type[AutoPlayer], dict[str, Any]]]]=None, sizes:list[int]=list(range(3, 10)), rounds:int=1,
+                 backend:type[Board | BitBoard]=BitBoard, max_moves:int=500, workers:int=1, checkpoint:Optional[str]=None, seed:int=0, save_every:int=100,
+                 rules:dict[str, Any]=Game.AUTOPLAY_RULES) :
+        """
+        Construit un tournoi toutes rondes entre joueurs automatiques.
+
+        Chaque joueur affronte chaque autre joueur sur chaque taille de plateau, avec les deux couleurs, `rounds` fois.
+        Les parties sont jouées sans affichage (voir `Runner.play`) et réparties entre les processus de travail.
+        Les résultats sont sauvegardés régulièrement dans un fichier JSON : un tournoi interrompu reprend là où il s'était arrêté.
+
+        Parameters:
+        -----------
+        players : Optional[dict[str, tuple[type[AutoPlayer], dict[str, Any]]]], optional
+            Les joueurs, par nom (sans ":", voir `Tournament.schedule`). Par défaut, les joueurs inscrits dans `REGISTRY`.
+        sizes : list[int], optional
+            Les tailles de plateau.
+        rounds : int, optional
+            Le nombre de parties par paire de joueurs, par taille et par couleur.
+        backend : type[Board | BitBoard], optional
+            La représentation du plateau de jeu.
+        max_moves : int, optional
+            Le nombre maximal de coups d'une partie. Au-delà, la partie est nulle.
+        workers : int, optional
+            Le nombre de processus jouant les parties. 1 pour jouer les parties dans le processus courant.
+        checkpoint : Optional[str], optional
+            Le chemin du fichier de sauvegarde des résultats. None pour ne pas sauvegarder.
+        seed : int, optional
+            La graine du tournoi. Chaque partie a sa propre graine, qui ne dépend que de celle-ci et de sa place dans le calendrier.
+        save_every : int, optional
+            Le nombre de parties terminées entre deux sauvegardes.
+        rules : dict[str, Any], optional
+            Les règles de fin de partie (voir `Game.get_rules`). Par défaut, nulle par répétition et arbitrage des parties sans prise (`Game.AUTOPLAY_RULES`).
+
+        Raises:
+        -------
+        ValueError
+            Si le nom d'un joueur contient ":".
+        """
+
+        self.players = dict(players if players is not None else Tournament.REGISTRY)
+
+        for name in self.players :
+            Tournament._check(name)
+        self.sizes = list(sizes)
+        self.rounds = rounds
+        self.backend = backend
+        self.max_moves = max_moves
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.seed = seed
+        self.save_every = save_every
+        self.rules = rules
+
+        self.results = {} # Résultats des parties jouées : clé de la partie (voir `Tournament.schedule`) -> (score du joueur bleu, nombre de coups)
+
+        if checkpoint is not None and os.path.exists(checkpoint) :
+            self.load()
+
+    @staticmethod
+    def register(name:str, cls:type[AutoPlayer], **options:Any) -> None :
+        """
+        Inscrit un joueur automatique aux tournois.
+
+        Parameters:
+        -----------
+        name : str
+            Le nom du joueur dans le tournoi, unique.
+        cls : type[AutoPlayer]
+            La classe du joueur.
+        **options : Any
+            Les paramètres du constructeur, hors jeu.
+
+        Raises:
+        -------
+        ValueError
+            Si le nom contient ":".
+        """
+
+        Tournament._check(name)
+        Tournament.REGISTRY[name] = (cls, options)
+
+    @staticmethod
+    def _check(name:str) -> None :
+        """
+        Vérifie qu'un nom de joueur peut figurer dans les clés des parties (voir `Tournament.schedule`), séparées par ":".
+
+        Parameters:
+        -----------
+        name : str
+            Le nom du joueur.
+
+        Raises:
+        -------
+        ValueError
+            Si le nom contient ":" : la sauvegarde des résultats ne pourrait pas être relue.
+        """
+
+        if ":" in name :
+            raise ValueError(f"Le nom de joueur {name!r} ne doit pas contenir \":\".")
+
+    def schedule(self) -> list[tuple[str, int, str, str, int]] :
+        """
+        Retourne le calendrier complet du tournoi.
+
+        Returns:
+        --------
+        list[tuple[str, int, str, str, int]]
+            Pour chaque partie : sa clé, la taille du plateau, le nom du joueur bleu, celui du joueur rouge et le numéro de la ronde.
+        """
+
+        names = sorted(self.players)
+
+        return [
+            (f"{size}:{black}:{white}:{i}", size, black, white, i)
+            for i in range(self.rounds)
+            for size in self.sizes
+            for black in names
+            for white in names
+            if black != white
+        ]
+
+    def run(self, progress:Optional[Callable[[int, int], None]]=None) -> None :
+        """
+        Joue les parties du calendrier qui n'ont pas encore de résultat.
+
+        Au plus deux parties par processus sont soumises à la fois, pour ne pas garder en mémoire tout le calendrier.
+        En cas d'interruption (Ctrl+C), les résultats déjà obtenus sont sauvegardés avant de propager l'interruption.
+
+        Parameters:
+        -----------
+        progress : Optional[Callable[[int, int], None]], optional
+            Appelée après chaque partie avec le nombre de parties jouées et le nombre total de parties.
+        """
+
+        games = self.schedule()
+        pending = [(index, game) for index, game in enumerate(games) if game[0] not in self.results]
+        total = len(games)
+        unsaved = 0
+
+        try :
+            if self.workers <= 1 :
+                for index, game in pending :
+                    self._record(game[0], Runner.play(*self._args(index, game)))
+                    unsaved = self._progress(unsaved, total, progress)
+            else :
+                pool = Parallel.pool(self.workers)
+                queue = iter(pending)
+                running = {}
+
+                while True :
+                    while len(running) < 2 * self.workers : # Garde les processus occupés
+                        item = next(queue, None)
+                        if item is None :
+                            break
+                        index, game = item
+                        running[pool.submit(Runner.play, *self._args(index, game))] = game[0]
+
+                    if running == {} :
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                    for future in done :
+                        self._record(running.pop(future), future.result())
+                        unsaved = self._progress(unsaved, total, progress)
+        finally :
+            self.save()
+
+    def _args(self, index:int, game:tuple[str, int, str, str, int]) -> tuple :
+        """
+        Retourne les paramètres de `Runner.play` pour une partie du calendrier.
+
+        Parameters:
+        -----------
+        index : int
+            La place de la partie dans le calendrier.
+        game : tuple[str, int, str, str, int]
+            La partie (voir `Tournament.schedule`).
+
+        Returns:
+        --------
+        tuple
+            Les paramètres de `Runner.play`.
+        """
+
+        _, size, black, white, _ = game
+
+        return size, self.backend, self.players[black], self.players[white], self.max_moves, self.seed + index, self.rules
+
+    def _record(self, key:str, result:dict[str, Any]) -> None :
+        """
+        Enregistre le résultat d'une partie.
+
+        Parameters:
+        -----------
+        key : str
+            La clé de la partie.
+        result : dict[str, Any]
+            Le résultat de la partie (voir `Runner.play`).
+        """
+
+        self.results[key] = (Tournament.SCORES[result["winner"]], result["moves"])
+
+    def _progress(self, unsaved:int, total:int, progress:Optional[Callable[[int, int], None]]) -> int :
+        """
+        Signale l'avancement du tournoi et sauvegarde les résultats toutes les `save_every` parties.
+
+        Parameters:
+        -----------
+        unsaved : int
+            Le nombre de parties terminées depuis la dernière sauvegarde, partie courante exclue.
+        total : int
+            Le nombre total de parties.
+        progress : Optional[Callable[[int, int], None]]
+            La fonction de suivi de l'avancement.
+
+        Returns:
+        --------
+        int
+            Le nouveau nombre de parties non sauvegardées.
+        """
+
+        if progress is not None :
+            progress(len(self.results), total)
+
+        unsaved += 1
+
+        if unsaved >= self.save_every :
+            self.save()
+            unsaved = 0
+
+        return unsaved
+
+    def save(self) -> None :
+        """
+        Sauvegarde les résultats dans le fichier `checkpoint`.
+
+        Le fichier est écrit à côté puis renommé : une interruption pendant l'écriture ne corrompt pas la sauvegarde précédente.
+        """
+
+        if self.checkpoint is None :
+            return
+
+        data = {"seed": self.seed, "results": self.results}
+        temp = self.checkpoint + ".tmp"
+
+        with open(temp, "w") as f :
+            json.dump(data, f)
+
+        os.replace(temp, self.checkpoint)
+
+    def load(self) -> None :
+        """
+        Charge les résultats sauvegardés dans le fichier `checkpoint`.
+
+        Raises:
+        -------
+        ValueError
+            Si la sauvegarde a été faite avec une autre graine : les parties restantes ne seraient pas celles prévues.
+        """
+
+        with open(self.checkpoint, "r") as f :
+            data = json.load(f)
+
+        if data["seed"] != self.seed :
+            raise ValueError(f"La sauvegarde {self.checkpoint} a été faite avec la graine {data['seed']}, pas {self.seed}.")
+
+        self.results = {key: tuple(value) for key, value in data["results"].items()}
+
+    def ratings(self, sizes:Optional[list[int]]=None, prior:float=1.0, iterations:int=1000) -> dict[str, tuple[float, float]] :
+        """
+        Calcule le classement Elo des joueurs d'après les parties jouées.
+
+        Les forces sont estimées par maximum de vraisemblance (modèle de Bradley-Terry, une nulle comptant pour une demi-victoire),
+        avec l'algorithme MM. Comme dans BayesElo, `prior` nulles virtuelles entre chaque paire de joueurs
+        évitent les classements infinis d'un joueur qui gagne (ou perd) toutes ses parties.
+        Les classements sont centrés sur 0.
+
+        L'intervalle de confiance à 95 % est calculé à partir de l'information de Fisher de chaque joueur, les autres classements étant supposés exacts.
+
+        Parameters:
+        -----------
+        sizes : Optional[list[int]], optional
+            Les tailles de plateau prises en compte. Par défaut, toutes.
+        prior : float, optional
+            Le nombre de nulles virtuelles entre chaque paire de joueurs.
+        iterations : int, optional
+            Le nombre maximal d'itérations.
+
+        Returns:
+        --------
+        dict[str, tuple[float, float]]
+            Pour chaque joueur, son classement Elo et la demi-largeur de son intervalle de confiance à 95 %.
+        """
+
+        names = sorted(self.players)
+        games = {(a, b): prior for a in names for b in names if a != b} # Parties entre chaque paire, comptées dans les deux sens
+        scores = {name: prior * (len(names) - 1) / 2 for name in names} # Score total de chaque joueur
+
+        for key, (score, _) in self.results.items() :
+            size, black, white, _ = key.split(":")
+
+            if black not in self.players or white not in self.players or (sizes is not None and int(size) not in sizes) :
+                continue
+
+            games[(black, white)] += 1
+            games[(white, black)] += 1
+            scores[black] += score
+            scores[white] += 1 - score
+
+        gamma = {name: 1.0 for name in names} # Force de chaque joueur : 10 ** (Elo / 400)
+
+        for _ in range(iterations) :
+            previous = gamma
+            gamma = {
+                a: scores[a] / sum(games[(a, b)] / (gamma[a] + gamma[b]) for b in names if b != a) if len(names) > 1 else 1.0
+                for a in names
+            }
+            mean = sum(log(g) for g in gamma.values()) / len(names) # Centre les classements
+            gamma = {name: g / exp(mean) for name, g in gamma.items()}
+
+            if max(abs(gamma[name] - previous[name]) / previous[name] for name in names) < 1e-9 :
+                break
+
+        elo = {name: 400 * log(g, 10) for name, g in gamma.items()}
+        scale = log(10) / 400 # Dérivée du logarithme de la force par point Elo
+
+        result = {}
+
+        for a in names :
+            information = sum(
+                games[(a, b)] * gamma[a] * gamma[b] / (gamma[a] + gamma[b]) ** 2
+                for b in names if b != a
+            ) * scale ** 2
+
+            result[a] = (elo[a], 1.96 / sqrt(information) if information > 0 else float("inf"))
+
+        return result
+
+    def table(self, sizes:Optional[list[int]]=None) -> list[tuple[str, int, float, float, float]] :
+        """
+        Retourne le classement du tournoi, du meilleur au moins bon joueur.
+
+        Parameters:
+        -----------
+        sizes : Optional[list[int]], optional
+            Les tailles de plateau prises en compte. Par défaut, toutes.
+
+        Returns:
+        --------
+        list[tuple[str, int, float, float, float]]
+            Pour chaque joueur : son nom, son nombre de parties, son score moyen, son classement Elo et la demi-largeur de son intervalle de confiance.
+        """
+
+        ratings = self.ratings(sizes)
+        played = {name: [0, 0.0] for name in self.players}
+
+        for key, (score, _) in self.results.items() :
+            size, black, white, _ = key.split(":")
+
+            if black not in self.players or white not in self.players or (sizes is not None and int(size) not in sizes) :
+                continue
+
+            played[black][0] += 1
+            played[black][1] += score
+            played[white][0] += 1
+            played[white][1] += 1 - score
+
+        rows = [
+            (name, count, total / count if count > 0 else 0.0, ratings[name][0], ratings[name][1])
+            for name, (count, total) in played.items()
+        ]
+
+        return sorted(rows, key=lambda row : row[3], reverse=True)
@@ -0,0 +1,186 @@
+from array import array
+from typing import Optional
+
+class TranspositionTable :
+    # Types de borne d'un score
+    EXACT = 0 # Le score est exact
+    LOWER = 1 # Le score est une borne inférieure (coupure beta)
+    UPPER = 2 # Le score est une borne supérieure (aucun coup n'a dépassé alpha)
+
+    # Taille d'une entrée en octets : clé (8), coup (8), score (4), profondeur (2) et borne (1)
+    ENTRY_SIZE = 23
+
+    # Nombre maximal de cases d'un tour pouvant être codées dans un coup
+    MAX_SQUARES = 7
+
+    def __init__(self, size_mb:float=16) :
+        """
+        Construit une table de transposition de taille fixe, indexée par la clé de Zobrist des positions.
+
+        Chaque entrée retient la profondeur de recherche, le score, le type de borne et le meilleur tour d'une position.
+        La table est divisée en paires de cases : la première garde l'entrée la plus profonde, la seconde la plus récente.
+        Les tableaux sont alloués une fois pour toutes : la mémoire utilisée ne dépend pas du nombre de positions rangées.
+
+        Parameters:
+        -----------
+        size_mb : float, optional
+            La mémoire allouée à la table, en mégaoctets.
+        """
+
+        self.size_mb = size_mb
+        self.buckets = max(1, int(size_mb * 2**20) // (2 * TranspositionTable.ENTRY_SIZE)) # Nombre de paires de cases
+        slots = 2 * self.buckets
+
+        self.keys = array("Q", [0]) * slots
+        self.moves = array("Q", [0]) * slots
+        self.scores = array("i", [0]) * slots
+        self.depths = array("h", [-1]) * slots # -1 : case vide
+        self.flags = array("B", [0]) * slots
+
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+
+    def probe(self, key:int) -> Optional[tuple[int, int, int, Optional[tuple[tuple[int, int, int, int], ...]]]] :
+        """
+        Cherche une position dans la table.
+
+        Parameters:
+        -----------
+        key : int
+            La clé de Zobrist de la position.
+
+        Returns:
+        --------
+        Optional[tuple[int, int, int, Optional[tuple[tuple[int, int, int, int], ...]]]]
+            La profondeur, le score, le type de borne et le meilleur tour de la position, ou None si elle n'est pas dans la table.
+        """
+
+        slot = 2 * (key % self.buckets)
+
+        for i in (slot, slot + 1) :
+            if self.depths[i] >= 0 and self.keys[i] == key :
+                self.hits += 1
+                return self.depths[i], self.scores[i], self.flags[i], TranspositionTable._unpack(self.moves[i])
+
+        self.misses += 1
+
+        if self.depths[slot] >= 0 or self.depths[slot + 1] >= 0 : # Les cases sont occupées par d'autres positions
+            self.collisions += 1
+
+        return None
+
+    def store(self, key:int, depth:int, score:int, flag:int, move:Optional[tuple[tuple[int, int, int, int], ...]]=None) -> None :
+        """
+        Range une position dans la table.
+
+        La première case de la paire est remplacée si la nouvelle entrée est au moins aussi profonde (ou concerne la même position),
+        sinon l'entrée va dans la seconde case, qui est toujours remplacée.
+
+        Parameters:
+        -----------
+        key : int
+            La clé de Zobrist de la position.
+        depth : int
+            La profondeur de recherche du score.
+        score : int
+            Le score de la position.
+        flag : int
+            Le type de borne du score (`EXACT`, `LOWER` ou `UPPER`).
+        move : Optional[tuple[tuple[int, int, int, int], ...]], optional
+            Le meilleur tour de la position.
+        """
+
+        slot = 2 * (key % self.buckets)
+
+        if not (self.keys[slot] == key or depth >= self.depths[slot]) : # L'entrée la plus profonde est gardée
+            slot += 1
+
+        self.keys[slot] = key
+        self.depths[slot] = depth
+        self.scores[slot] = score
+        self.flags[slot] = flag
+        self.moves[slot] = TranspositionTable._pack(move)
+        self.stores += 1
+
+    def clear(self) -> None :
+        """
+        Vide la table et remet ses statistiques à zéro.
+        """
+
+        self.depths = array("h", [-1]) * len(self.depths)
+
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+
+    def get_stats(self) -> dict[str, int] :
+        """
+        Retourne les statistiques d'utilisation de la table.
+
+        Returns:
+        --------
+        dict[str, int]
+            Le nombre de positions trouvées (`hits`), non trouvées (`misses`),
+            non trouvées alors que leurs cases étaient occupées par d'autres positions (`collisions`),
+            et le nombre d'entrées rangées (`stores`).
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+            "stores": self.stores,
+        }
+
+    @staticmethod
+    def _pack(move:Optional[tuple[tuple[int, int, int, int], ...]]) -> int :
+        """
+        Code un tour en entier : le nombre de cases, puis chaque case sur un octet (x sur 4 bits, y sur 4 bits).
+
+        Parameters:
+        -----------
+        move : Optional[tuple[tuple[int, int, int, int], ...]]
+            Le tour à coder.
+
+        Returns:
+        --------
+        int
+            Le tour codé, 0 si aucun tour n'est donné ou s'il est trop long pour être codé.
+        """
+
+        if move is None or len(move) + 1 > TranspositionTable.MAX_SQUARES :
+            return 0
+
+        squares = [(move[0][0], move[0][1])] + [(x2, y2) for _, _, x2, y2 in move] # Case de départ puis cases d'arrivée successives
+        code = len(squares)
+
+        for i, (x, y) in enumerate(squares) :
+            code |= (x | y << 4) << (8 * (i + 1))
+
+        return code
+
+    @staticmethod
+    def _unpack(code:int) -> Optional[tuple[tuple[int, int, int, int], ...]] :
+        """
+        Décode un tour codé par `_pack`.
+
+        Parameters:
+        -----------
+        code : int
+            Le tour codé.
+
+        Returns:
+        --------
+        Optional[tuple[tuple[int, int, int, int], ...]]
+            Le tour, ou None si aucun tour n'est codé.
+        """
+
+        if code == 0 :
+            return None
+
+        squares = [((code >> (8 * (i + 1))) & 0xF, (code >> (8 * (i + 1) + 4)) & 0xF) for i in range(code & 0xFF)]
+
+        return tuple((x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(squares, squares[1:]))
\ No newline at end of file
@@ -0,0 +1,464 @@
+import time
+from typing import Optional
+
+from controler.Game import Game
+from controler.AutoPlayer import AutoPlayer
+from controler.TranspositionTable import TranspositionTable
+from controler.OpeningBook import OpeningBook
+from controler.Parallel import Parallel
+from controler.Tablebase import Tablebase
+from utils.Pawn import Pawn
+
+class AlphaBetaIA(AutoPlayer) :
+    # Score d'une partie gagnée, diminué du nombre de tours pour préférer les victoires rapides
+    WIN = 100000
+
+    def __init__(self, game:Game, time_limit:Optional[float]=1.0, node_limit:Optional[int]=None, max_depth:int=64, tt:Optional[TranspositionTable]=None, workers:int=1, tablebase:Optional[Tablebase]=None, book:Optional[OpeningBook]=None) :
+        """
+        Construit un joueur automatique basé sur une recherche negamax avec élagage alpha-bêta.
+
+        La recherche est faite en approfondissement itératif : profondeur 1, puis 2, etc. jusqu'à épuisement du budget.
+        Le meilleur coup de la dernière profondeur terminée est alors joué.
+        Un tour complet (déplacement simple ou chaîne de prises) compte pour une profondeur.
+
+        Parameters:
+        -----------
+        game : Game
+            Le jeu.
+        time_limit : Optional[float], optional
+            Le temps de réflexion maximal par coup, en secondes. None pour ne pas limiter le temps.
+        node_limit : Optional[int], optional
+            Le nombre maximal de positions visitées par coup. None pour ne pas limiter le nombre de positions.
+        max_depth : int, optional
+            La profondeur maximale de recherche.
+        tt : Optional[TranspositionTable], optional
+            La table de transposition utilisée pour ne pas rechercher deux fois la même position. None pour ne pas en utiliser.
+        workers : int, optional
+            Le nombre de processus de recherche. Au-delà de 1, les tours de la racine sont répartis entre les processus,
+            qui cherchent chacun avec le même budget de temps (le budget de positions est partagé) et leur propre table de transposition.
+        tablebase : Optional[Tablebase], optional
+            La table de finales consultée pendant la recherche : les positions qu'elle contient ont un score exact.
+            À la racine, son meilleur tour est joué sans chercher. None pour ne pas en utiliser.
+        book : Optional[OpeningBook], optional
+            Le livre d'ouvertures : le tour du livre est joué sans chercher. None pour ne pas en utiliser.
+        """
+
+        super().__init__(game)
+        self.name = "AlphaBetaIA"
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.max_depth = max_depth
+        self.tt = tt
+        self.workers = workers
+        self.tablebase = tablebase
+        self.book = book
+
+        self.deadline = None
+        self.stopped = False
+        self.nodes = 0 # Statistiques de la dernière recherche
+        self.depth = 0
+        self.score = 0
+        self.elapsed = 0.0
+
+    def choose(self) -> int :
+        """
+        Retourne le prochain coup du meilleur tour trouvé.
+
+        Returns:
+        --------
+        int
+            Le coup codé (voir `MoveCode`), ou `MoveCode.PASS` si le joueur n'a aucun coup.
+        """
+
+        return self._code(self._follow(self.search))
+
+    def get_stats(self) -> dict[str, float] :
+        """
+        Retourne les statistiques de la dernière recherche.
+
+        Returns:
+        --------
+        dict[str, float]
+            La profondeur atteinte (`depth`), le nombre de positions visitées (`nodes`),
+            la durée en secondes (`time`) et le nombre de positions par seconde (`nps`).
+        """
+
+        return {
+            "depth": self.depth,
+            "nodes": self.nodes,
+            "time": self.elapsed,
+            "nps": self.nodes / self.elapsed if self.elapsed > 0 else 0.0,
+        }
+
+    def search(self, moves:Optional[list[tuple[tuple[int, int, int, int], ...]]]=None) -> Optional[tuple[tuple[int, int, int, int], ...]] :
+        """
+        Cherche le meilleur tour du joueur courant en approfondissement itératif.
+
+        Parameters:
+        -----------
+        moves : Optional[list[tuple[tuple[int, int, int, int], ...]]], optional
+            Les tours de la racine à chercher. Par défaut, tous les tours du joueur courant.
+
+        Returns:
+        --------
+        Optional[tuple[tuple[int, int, int, int], ...]]
+            Le meilleur tour trouvé (suite de coups), ou None si le joueur n'a aucun coup.
+        """
+
+        start = time.perf_counter()
+        self.deadline = start + self.time_limit if self.time_limit is not None else None
+        self.stopped = False
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+
+        if moves is None and self.book is not None : # Position du livre d'ouvertures
+            chain = self.book.lookup(self.game)
+
+            if chain is not None :
+                self.elapsed = time.perf_counter() - start
+                return chain
+
+        if moves is None and self.tablebase is not None : # Position résolue : le meilleur tour est connu
+            chain = self.tablebase.best(self.game)
+
+            if chain is not None :
+                self.score = self._exact(self.tablebase.probe(self.game), 0)
+                self.elapsed = time.perf_counter() - start
+                return chain
+
+        if moves is None :
+            moves = self._ordered(list(self.game.generate_moves(chains=True)))
+            forced = len(moves) == 1 # Un seul tour possible : inutile de chercher
+
+            if self.workers > 1 and len(moves) > 1 :
+                return self._search_parallel(moves)
+        else :
+            moves = list(moves)
+            forced = False
+
+        best = moves[0] if moves != [] else None
+
+        for depth in range(1, self.max_depth + 1) :
+            if best is None or forced : # Rien à chercher
+                break
+
+            alpha = -AlphaBetaIA.WIN - 1
+            iteration_best = None
+
+            for chain in moves :
+                score = -self._play_and_search(chain, depth - 1, -AlphaBetaIA.WIN - 1, -alpha, 1)
+
+                if self.stopped :
+                    break
+
+                if score > alpha :
+                    alpha = score
+                    iteration_best = chain
+
+            if iteration_best is not None : # Un coup entièrement évalué à cette profondeur est gardé, même si elle n'est pas terminée
+                best = iteration_best
+                self.score = alpha
+
+            if self.stopped :
+                break
+
+            self.depth = depth
+            moves.remove(best) # Le meilleur coup est cherché en premier à la profondeur suivante
+            moves.insert(0, best)
+
+            if abs(alpha) >= AlphaBetaIA.WIN - self.max_depth : # Victoire ou défaite forcée trouvée
+                break
+
+        self.elapsed = time.perf_counter() - start
+
+        return best
+
+    def _search_parallel(self, moves:list[tuple[tuple[int, int, int, int], ...]]) -> tuple[tuple[int, int, int, int], ...] :
+        """
+        Répartit les tours de la racine entre les processus de travail et garde le meilleur résultat.
+
+        La position est envoyée sous forme sérialisée (voir `Game.to_bytes`), pas la partie entière.
+
+        Parameters:
+        -----------
+        moves : list[tuple[tuple[int, int, int, int], ...]]
+            Les tours de la racine, triés.
+
+        Returns:
+        --------
+        tuple[tuple[int, int, int, int], ...]
+            Le meilleur tour trouvé.
+        """
+
+        start = time.perf_counter()
+        parts = Parallel.split(moves, self.workers)
+        options = {
+            "time_limit": self.time_limit,
+            "deadline": time.time() + self.deadline - start if self.deadline is not None else None, # Temps restant de la recherche, pas tout `time_limit`
+            "node_limit": self.node_limit // len(parts) if self.node_limit is not None else None,
+            "max_depth": self.max_depth,
+            "tt": self.tt.size_mb if self.tt is not None else None,
+            "tablebase": self.tablebase.path if self.tablebase is not None else None,
+        }
+
+        data = self.game.to_bytes()
+        pool = Parallel.pool(self.workers)
+        futures = [pool.submit(Parallel.alphabeta, data, type(self.game.board), options, part, self.game.get_rules()) for part in parts]
+        results = Parallel.results(futures, self.workers, self.cancelled)
+
+        best, self.score, _, _ = max(results, key=lambda result : result[1]) # À égalité, le tour le mieux classé (premier processus) est gardé
+        self.depth = min(result[2] for result in results) # Profondeur terminée par tous les processus
+        self.nodes = sum(result[3] for result in results)
+        self.elapsed = time.perf_counter() - start
+
+        return best
+
+    def _play_and_search(self, chain:tuple[tuple[int, int, int, int], ...], depth:int, alpha:int, beta:int, ply:int) -> int :
+        """
+        Joue un tour, évalue la position obtenue puis annule le tour.
+
+        Parameters:
+        -----------
+        chain : tuple[tuple[int, int, int, int], ...]
+            Le tour à jouer.
+        depth : int
+            La profondeur restante après ce tour.
+        alpha : int
+            La borne inférieure de la fenêtre de recherche.
+        beta : int
+            La borne supérieure de la fenêtre de recherche.
+        ply : int
+            Le nombre de tours depuis la racine.
+
+        Returns:
+        --------
+        int
+            Le score de la position obtenue, du point de vue du joueur qui doit y jouer.
+        """
+
+        undos = [self.game.make(*move) for move in chain]
+        score = self._negamax(depth, alpha, beta, ply)
+
+        for undo in reversed(undos) :
+            self.game.unmake(undo)
+
+        return score
+
+    def _negamax(self, depth:int, alpha:int, beta:int, ply:int) -> int :
+        """
+        Évalue la position courante par une recherche negamax avec élagage alpha-bêta.
+
+        Parameters:
+        -----------
+        depth : int
+            La profondeur restante.
+        alpha : int
+            La borne inférieure de la fenêtre de recherche.
+        beta : int
+            La borne supérieure de la fenêtre de recherche.
+        ply : int
+            Le nombre de tours depuis la racine.
+
+        Returns:
+        --------
+        int
+            Le score de la position du point de vue du joueur courant.
+        """
+
+        self.nodes += 1
+
+        if ((self.deadline is not None and time.perf_counter() >= self.deadline) or
+            (self.node_limit is not None and self.nodes >= self.node_limit) or
+            (self.nodes & 1023 == 0 and self.cancelled.is_set())) : # Budget épuisé, ou réflexion annulée (voir `AutoPlayer.think`), vérifiée toutes les 1024 positions
+            self.stopped = True
+            return 0
+
+        winner = self.game.is_finished()
+
+        if winner == Pawn.DRAW :
+            return 0
+
+        if winner != Pawn.VOID :
+            return AlphaBetaIA.WIN - ply if winner == self.game.get_current_player() else -AlphaBetaIA.WIN + ply
+
+        if self.tablebase is not None :
+            entry = self.tablebase.probe(self.game)
+
+            if entry is not None : # Position résolue : score exact, quelle que soit la profondeur restante
+                return self._exact(entry, ply)
+
+        if depth == 0 :
+            return self._evaluate()
+
+        key = self.game.get_hash()
+        tt_move = None
+        alpha_origin = alpha
+
+        if self.tt is not None :
+            entry = self.tt.probe(key)
+
+            if entry is not None :
+                tt_depth, tt_score, tt_flag, tt_move = entry
+                tt_score = AlphaBetaIA._from_tt(tt_score, ply)
+
+                if tt_depth >= depth : # Le score rangé a été cherché au moins aussi profondément
+                    if tt_flag == TranspositionTable.EXACT :
+                        return tt_score
+                    if tt_flag == TranspositionTable.LOWER :
+                        alpha = max(alpha, tt_score)
+                    elif tt_flag == TranspositionTable.UPPER :
+                        beta = min(beta, tt_score)
+                    if alpha >= beta :
+                        return tt_score
+
+        moves = self._ordered(list(self.game.generate_moves(chains=True)))
+
+        if moves == [] : # Aucun coup possible : le joueur passe son tour (s'il perdait, ou si l'adversaire était lui aussi bloqué, la partie serait terminée)
+            possible_moves = self.game.pass_turn()
+            score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            self.game.unpass_turn(possible_moves)
+            return score
+
+        if tt_move in moves : # Le meilleur tour connu est cherché en premier
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        best_score = -AlphaBetaIA.WIN - 1
+        best_move = None
+
+        for chain in moves :
+            score = -self._play_and_search(chain, depth - 1, -beta, -alpha, ply + 1)
+
+            if self.stopped :
+                return 0
+
+            if score > best_score :
+                best_score = score
+                best_move = chain
+
+            if score >= beta : # Coupure : l'adversaire évitera cette position
+                break
+
+            if score > alpha :
+                alpha = score
+
+        if self.tt is not None :
+            if best_score <= alpha_origin :
+                flag = TranspositionTable.UPPER
+            elif best_score >= beta :
+                flag = TranspositionTable.LOWER
+            else :
+                flag = TranspositionTable.EXACT
+
+            self.tt.store(key, depth, AlphaBetaIA._to_tt(best_score, ply), flag, best_move)
+
+        return best_score
+
+    @staticmethod
+    def _to_tt(score:int, ply:int) -> int :
+        """
+        Convertit un score de fin de partie pour la table de transposition : la distance est comptée depuis la position et non depuis la racine.
+
+        Parameters:
+        -----------
+        score : int
+            Le score, relatif à la racine.
+        ply : int
+            Le nombre de tours depuis la racine.
+
+        Returns:
+        --------
+        int
+            Le score relatif à la position.
+        """
+
+        if score >= AlphaBetaIA.WIN - 1000 :
+            return score + ply
+        if score <= -AlphaBetaIA.WIN + 1000 :
+            return score - ply
+        return score
+
+    @staticmethod
+    def _from_tt(score:int, ply:int) -> int :
+        """
+        Convertit un score de fin de partie lu dans la table de transposition (inverse de `_to_tt`).
+
+        Parameters:
+        -----------
+        score : int
+            Le score, relatif à la position.
+        ply : int
+            Le nombre de tours depuis la racine.
+
+        Returns:
+        --------
+        int
+            Le score relatif à la racine.
+        """
+
+        if score >= AlphaBetaIA.WIN - 1000 :
+            return score - ply
+        if score <= -AlphaBetaIA.WIN + 1000 :
+            return score + ply
+        return score
+
+    def _exact(self, entry:tuple[Pawn, int], ply:int) -> int :
+        """
+        Convertit le résultat d'une position de la table de finales en score, comme une fin de partie.
+
+        Parameters:
+        -----------
+        entry : tuple[Pawn, int]
+            Le gagnant et le nombre de tours avant sa victoire (voir `Tablebase.probe`).
+        ply : int
+            Le nombre de tours depuis la racine.
+
+        Returns:
+        --------
+        int
+            Le score de la position du point de vue du joueur courant.
+        """
+
+        winner, distance = entry
+
+        if winner == Pawn.DRAW :
+            return 0
+
+        if winner == self.game.get_current_player() :
+            return AlphaBetaIA.WIN - ply - distance
+
+        return -AlphaBetaIA.WIN + ply + distance
+
+    def _evaluate(self) -> int :
+        """
+        Évalue la position courante par la différence de matériel.
+
+        Returns:
+        --------
+        int
+            Le score de la position du point de vue du joueur courant.
+        """
+
+        player = self.game.get_current_player()
+        opponent = Pawn.WHITE if player == Pawn.BLACK else Pawn.BLACK
+
+        return 100 * (self.game.count(player) - self.game.count(opponent))
+
+    @staticmethod
+    def _ordered(moves:list[tuple[tuple[int, int, int, int], ...]]) -> list[tuple[tuple[int, int, int, int], ...]] :
+        """
+        Trie les tours pour améliorer l'élagage : les chaînes de prises les plus longues d'abord.
+
+        Parameters:
+        -----------
+        moves : list[tuple[tuple[int, int, int, int], ...]]
+            Les tours à trier.
+
+        Returns:
+        --------
+        list[tuple[tuple[int, int, int, int], ...]]
+            Les tours triés.
+        """
+
+        return sorted(moves, key=lambda chain : -len(chain) - (abs(chain[0][2] - chain[0][0]) == 2 or abs(chain[0][3] - chain[0][1]) == 2))
\ No newline at end of file
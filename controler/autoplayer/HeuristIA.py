@@ -2,14 +2,15 @@ from typing import Optional
 
 from controler.Game import Game
 from controler.AutoPlayer import AutoPlayer
+from controler.OpeningBook import OpeningBook
+from controler.TranspositionTable import TranspositionTable
+from controler.Parallel import Parallel
 from utils.Move import Move
+from utils.MoveCode import MoveCode
 from utils.Pawn import Pawn
-from copy import deepcopy
-from boundary.Keyboard import Keyboard
-from utils.terminal import clear
 
 class HeuristIA(AutoPlayer) :
-    def __init__(self, game:Game, validation:bool=True) :
+    def __init__(self, game:Game, validation:bool=True, tt:Optional[TranspositionTable]=None, workers:int=1, book:Optional[OpeningBook]=None) :
         """
         Construit un joueur automatique basé sur une heuristique simple.
 
@@ -22,44 +23,52 @@ class HeuristIA(AutoPlayer) :
         game : Game
             Le jeu.
         validation : bool, optional
-            Si True, attend une validation pour jouer le coup.
+            Si True, l'interface attend une validation avant de jouer le coup (voir `View._validate`). Le choix du coup n'attend jamais.
+        tt : Optional[TranspositionTable], optional
+            La table de transposition utilisée pour mémoriser l'évaluation des positions déjà rencontrées. None pour ne pas en utiliser.
+        workers : int, optional
+            Le nombre de processus d'évaluation. Au-delà de 1, les coups sont répartis entre les processus,
+            chacun avec sa propre table de transposition de même taille.
+        book : Optional[OpeningBook], optional
+            Le livre d'ouvertures : dans les positions du livre, son tour est joué sans évaluer les coups. None pour ne pas en utiliser.
         """
 
         super().__init__(game)
         self.name = "HeuristIA"
         self.validation = validation
+        self.tt = tt
+        self.workers = workers
+        self.book = book
 
-    def input(self) -> str :
+    def choose(self) -> int :
         """
-        Retourne un coup basé sur une heuristique.
+        Retourne un coup basé sur une heuristique, sans attendre de validation.
 
         Returns:
         --------
-        str
-            Le coup sélectionné.
+        int
+            Le coup codé (voir `MoveCode`), ou `MoveCode.PASS` si le joueur n'a aucun coup.
         """
 
         player = self.game.get_current_player()
+        opening = self._follow(lambda : self.book.lookup(self.game)) if self.book is not None else None # Tour du livre, ou suite d'une chaîne du livre
 
-        best_move = self._get_best(self.game, player)
+        if opening is not None :
+            best_move = ((opening[0], opening[1]), (opening[2], opening[3], None))
+        elif self.workers > 1 :
+            best_move = self._get_best_parallel(player)
+        else :
+            best_move = self._get_best(self.game, player, self.tt)
 
         if best_move is None :
-            return "pass"
+            return MoveCode.PASS
 
         pawn, move = best_move
-        move_string = f"{chr(97 + pawn[0])}{pawn[1] + 1}{chr(97 + move[0])}{move[1] + 1}"
-        
-        self.last_shot = move_string
-
-        while self.validation : # Attend une validation
-            ch = Keyboard.getch()
-            if ch == Keyboard.NL :
-                break
 
-        return move_string
+        return MoveCode.encode(pawn[0], pawn[1], move[0], move[1])
     
     @staticmethod
-    def _get_best(game:Game, player:Pawn) -> Optional[tuple[tuple[int, int], tuple[int, int, Move]]] :
+    def _get_best(game:Game, player:Pawn, tt:Optional[TranspositionTable]=None) -> Optional[tuple[tuple[int, int], tuple[int, int, Move]]] :
         """
         Retourne le meilleur coup pour un joueur donné.
 
@@ -69,6 +78,8 @@ class HeuristIA(AutoPlayer) :
             Le jeu.
         player : Pawn
             Le joueur.
+        tt : Optional[TranspositionTable], optional
+            La table de transposition mémorisant les évaluations.
 
         Returns:
         --------
@@ -81,12 +92,59 @@ class HeuristIA(AutoPlayer) :
         if len(possibles) == 0 :
             return None
 
-        best_move = HeuristIA._get_best_move(game, player, possibles)
+        best_move = HeuristIA._get_best_move(game, player, possibles, tt)
 
         return best_move
     
+    def _get_best_parallel(self, player:Pawn) -> Optional[tuple[tuple[int, int], tuple[int, int, Move]]] :
+        """
+        Retourne le meilleur coup du joueur courant, en répartissant l'évaluation des coups entre les processus de travail.
+
+        Le coup choisi est le même qu'avec `_get_best` : à score égal, le premier coup dans l'ordre de `_get_possibles`.
+        Si la réflexion est annulée (voir `AutoPlayer.think`), le meilleur des coups déjà évalués est retourné.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur courant.
+
+        Returns:
+        --------
+        Optional[tuple[tuple[int, int], tuple[int, int, Move]]]
+            Le meilleur coup.
+        """
+
+        possibles = HeuristIA._get_possibles(self.game, player)
+
+        if len(possibles) == 0 :
+            return None
+
+        parts = Parallel.split(possibles, self.workers)
+        data = self.game.to_bytes()
+        size_mb = self.tt.size_mb if self.tt is not None else None
+        pool = Parallel.pool(self.workers)
+        futures = [pool.submit(Parallel.heurist, data, type(self.game.board), part, size_mb, self.game.get_rules()) for part in parts]
+
+        scores = [None] * len(possibles) # None : coup non évalué, la réflexion ayant été annulée
+
+        for i, part in enumerate(Parallel.results(futures, self.workers, self.cancelled)) : # Remet les scores dans l'ordre des coups
+            for j, score in enumerate(part) :
+                scores[i + j * self.workers] = score
+
+        evaluated = [i for i in range(len(possibles)) if scores[i] is not None]
+
+        if evaluated == [] : # Annulée avant toute évaluation : le premier coup est joué
+            return possibles[0]
+
+        best = max(evaluated, key=lambda i : scores[i])
+
+        if scores[best] == -float("inf") :
+            return None
+
+        return possibles[best]
+
     @staticmethod
-    def _get_best_move(game:Game, player:Pawn, possibles:list[tuple[tuple[int, int], tuple[int, int, Move]]]) -> Optional[tuple[tuple[int, int], tuple[int, int, Move]]] :
+    def _get_best_move(game:Game, player:Pawn, possibles:list[tuple[tuple[int, int], tuple[int, int, Move]]], tt:Optional[TranspositionTable]=None) -> Optional[tuple[tuple[int, int], tuple[int, int, Move]]] :
         """
         Retourne les coups possibles pour un pion donné en fonction des coups possibles.
 
@@ -98,6 +156,8 @@ class HeuristIA(AutoPlayer) :
             Le joueur.
         possibles : list[tuple[tuple[int, int], tuple[int, int, Move]]]
             Les coups possibles.
+        tt : Optional[TranspositionTable], optional
+            La table de transposition mémorisant les évaluations.
 
         Returns:
         --------
@@ -109,7 +169,7 @@ class HeuristIA(AutoPlayer) :
         best_score = -float("inf")
 
         for pawn, move in possibles : # Parcourir tous les coups
-            score = HeuristIA._evaluate_move(game, player, pawn, move)
+            score = HeuristIA._evaluate_move(game, player, pawn, move, tt)
 
             if score > best_score : # Garder le meilleur coup
                 best_score = score
@@ -137,25 +197,27 @@ class HeuristIA(AutoPlayer) :
 
         return [
             ((x1, y1), (x2, y2, m))
-            for x1, y1, p in game.get_pawns() if p == player # Pour chaque pion du joueur
+            for x1, y1 in game.get_player_pawns(player) # Pour chaque pion du joueur
             for x2, y2, m in game.get_possible_moves(x1, y1) # Pour chaque coup possible du pion
         ]
 
     @staticmethod
-    def _evaluate_move(game:Game, player:Pawn, pawn:tuple[int, int], move:Optional[tuple[int, int, Move]]) -> int :
+    def _evaluate_move(game:Game, player:Pawn, pawn:tuple[int, int], move:Optional[tuple[int, int, Move]], tt:Optional[TranspositionTable]=None) -> int :
         """
         Évalue un coup en fonction d'une heuristique simple.
 
         Parameters:
         -----------
         game : Game
-            Le jeu réel ou simulé.
+            Le jeu. Il est modifié pendant l'évaluation puis restauré à l'identique.
         player : Pawn
             Le joueur courant.
         pawn : tuple[int, int]
             La position du pion actuel.
         move : Optional[tuple[int, int, Move]]
             La position de destination.
+        tt : Optional[TranspositionTable], optional
+            La table de transposition mémorisant l'évaluation des positions obtenues.
 
         Returns:
         --------
@@ -173,22 +235,37 @@ class HeuristIA(AutoPlayer) :
         if mov == None : # Vérifier si le mouvement existe
             return -float("inf")
 
-        game_copy = deepcopy(game) # Crée une simulation du jeu
+        undo = game.make(x1, y1, x2, y2) # Joue le coup sur le jeu, il sera annulé après l'évaluation
 
-        if not game_copy.play(x1, y1, x2, y2) : # Joue le coup sur la simulation
+        if undo is None :
             return -float("inf")
     
-        if player == game_copy.get_current_player() : # Vérifie si le joueur peut rejouer dans la simulation
-            score += 10
-            best_move = HeuristIA._get_best_move(game_copy, player, [((x2, y2), (x, y, m)) for x, y, m in game_copy.get_possible_moves(x2, y2)])
-            if best_move is not None :
-                score += HeuristIA._evaluate_move(game_copy, player, best_move[0], best_move[1]) # Évalue la meilleure prise suivante dans la simulation
-
-        opp = Pawn.BLACK if player == Pawn.WHITE else Pawn.WHITE
-        opp_moves = HeuristIA._get_possibles(game_copy, opp)
-        opp_takes = [move for move in opp_moves if move[1][2] == Move.TAKE]
-        
-        score += len(opp_takes) * -3 # Malus pour les captures adverses
-        score += len(opp_moves) * -1 # Malus pour les options adverses
+        key = game.get_hash() # La suite de l'évaluation ne dépend que de la position obtenue
+        entry = tt.probe(key) if tt is not None else None
+
+        if entry is not None : # Position déjà évaluée
+            score += entry[1]
+        else :
+            position_score = 0
+
+            if player == game.get_current_player() : # Vérifie si le joueur peut rejouer après le coup
+                position_score += 10
+                best_move = HeuristIA._get_best_move(game, player, [((x2, y2), (x, y, m)) for x, y, m in game.get_possible_moves(x2, y2)], tt)
+                if best_move is not None :
+                    position_score += HeuristIA._evaluate_move(game, player, best_move[0], best_move[1], tt) # Évalue la meilleure prise suivante
+
+            opp = Pawn.BLACK if player == Pawn.WHITE else Pawn.WHITE
+            opp_moves = HeuristIA._get_possibles(game, opp)
+            opp_takes = [move for move in opp_moves if move[1][2] == Move.TAKE]
+            
+            position_score += len(opp_takes) * -3 # Malus pour les captures adverses
+            position_score += len(opp_moves) * -1 # Malus pour les options adverses
+
+            if tt is not None :
+                tt.store(key, 0, position_score, TranspositionTable.EXACT)
+
+            score += position_score
+
+        game.unmake(undo) # Restaure le jeu
         
         return score
\ No newline at end of file
@@ -1,7 +1,12 @@
+import asyncio
 from random import choice
+from typing import Optional
 
 from controler.Game import Game
 from controler.AutoPlayer import AutoPlayer
+from utils.MoveCode import MoveCode
+from boundary.Keyboard import Keyboard
+from utils.terminal import write, flush
 
 class HumanIA(AutoPlayer) :
     def __init__(self, game:Game) :
@@ -17,19 +22,117 @@ class HumanIA(AutoPlayer) :
         super().__init__(game) # Appel du constructeur de la classe mère
         
         self.name = "HumanIA"
+        self.line = "" # Saisie en cours pendant une session clavier (voir `_key`)
 
     def input(self) -> str :
         """
         Retourne un coup 
 
+        Pendant une session clavier (voir `Keyboard.start`), le terminal ne fait plus l'écho des touches : la saisie est affichée ici,
+        touche par touche, et s'arrête à Entrée.
+
         Returns:
         --------
         str
             Le coup aléatoire.
         """
 
-        itp = input()
+        if not Keyboard.active :
+            itp = input()
+        else :
+            while not self._key(Keyboard.getch()) :
+                pass
+
+            itp, self.line = self.line, ""
 
         self.last_shot = itp # Enregistre
 
-        return itp
\ No newline at end of file
+        return itp
+
+    def choose(self) -> Optional[int] :
+        """
+        Retourne le coup saisi, converti en coup codé (voir `MoveCode.from_text`).
+
+        Returns:
+        --------
+        Optional[int]
+            Le coup codé, `MoveCode.PASS` pour passer son tour, `MoveCode.QUIT` pour quitter la partie,
+            ou None si la saisie n'est pas reconnue.
+        """
+
+        return MoveCode.from_text(self.input(), self.game.get_size())
+
+    async def think(self, game:Game, deadline:Optional[float]=None) -> Optional[int] :
+        """
+        Attend la saisie du coup sans bloquer la boucle d'événements (voir `AutoPlayer.think`).
+
+        Pendant une session clavier, les touches sont lues au fur et à mesure qu'elles arrivent. Sinon, `input` est exécuté dans un fil à part.
+
+        Parameters:
+        -----------
+        game : Game
+            La partie.
+        deadline : Optional[float], optional
+            Ignoré : un joueur humain prend son temps.
+
+        Returns:
+        --------
+        Optional[int]
+            Le coup codé, ou None si la saisie n'est pas reconnue.
+        """
+
+        if not Keyboard.active :
+            return await super().think(game, None)
+
+        while True :
+            ch = Keyboard.poll(0)
+
+            if ch is None :
+                await asyncio.sleep(Keyboard.POLL_INTERVAL)
+            elif self._key(ch) :
+                break
+
+        itp, self.line = self.line, ""
+        self.last_shot = itp # Enregistre
+
+        return MoveCode.from_text(itp, game.get_size())
+
+    def _key(self, ch:str) -> bool :
+        """
+        Ajoute une touche à la saisie en cours (`line`) et l'affiche : le terminal brut ne fait plus l'écho des touches.
+
+        Parameters:
+        -----------
+        ch : str
+            La touche (voir `Keyboard`).
+
+        Returns:
+        --------
+        bool
+            True si la saisie est validée (Entrée).
+
+        Raises:
+        -------
+        KeyboardInterrupt
+            Sur Ctrl+C : le terminal brut n'envoie plus d'interruption.
+        """
+
+        if ch in (Keyboard.NL, Keyboard.ctrl_J) : # Valide la saisie
+            write("\n")
+            flush()
+            return True
+
+        if ch == Keyboard.ctrl_C :
+            raise KeyboardInterrupt
+
+        if ch in (Keyboard.BS, Keyboard.ctrl_BS) : # Efface le dernier caractère
+            if self.line != "" :
+                self.line = self.line[:-1]
+                write("\b \b")
+        elif len(ch) == 1 and ch.isprintable() :
+            self.line += ch
+            write(ch)
+
+        flush()
+
+        return False
\ No newline at end of file
@@ -0,0 +1,326 @@
+from math import log, sqrt
+from random import Random
+import time
+from typing import Optional
+
+from controler.Game import Game
+from controler.AutoPlayer import AutoPlayer
+from controler.Parallel import Parallel
+from utils.Pawn import Pawn
+
+class MCTSNode :
+    def __init__(self, game:Game, move:Optional[tuple[tuple[int, int, int, int], ...]]=None, parent:Optional["MCTSNode"]=None) :
+        """
+        Construit un nœud de l'arbre de recherche, pour la position courante du jeu.
+
+        Parameters:
+        -----------
+        game : Game
+            Le jeu, dans la position du nœud.
+        move : Optional[tuple[tuple[int, int, int, int], ...]], optional
+            Le tour qui mène à ce nœud depuis son parent.
+        parent : Optional[MCTSNode], optional
+            Le nœud parent.
+        """
+
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.key = game.get_hash() # Permet de retrouver la position lors de la réutilisation de l'arbre
+        self.player = Pawn.WHITE if game.get_current_player() == Pawn.BLACK else Pawn.BLACK # Joueur qui vient de jouer le tour menant au nœud
+        self.untried = list(game.generate_moves(chains=True)) if game.is_finished() == Pawn.VOID else [] # Tours pas encore explorés
+        self.visits = 0
+        self.wins = 0.0 # Victoires du joueur `player` (une nulle compte pour moitié)
+
+    def select(self, exploration:float) -> "MCTSNode" :
+        """
+        Retourne l'enfant qui maximise le score UCT.
+
+        Parameters:
+        -----------
+        exploration : float
+            La constante d'exploration.
+
+        Returns:
+        --------
+        MCTSNode
+            L'enfant sélectionné.
+        """
+
+        ln = log(self.visits)
+
+        return max(self.children, key=lambda child : child.wins / child.visits + exploration * sqrt(ln / child.visits))
+
+class MCTSIA(AutoPlayer) :
+    def __init__(self, game:Game, time_limit:Optional[float]=1.0, playout_limit:Optional[int]=None, max_length:int=60, bias:float=0.5, exploration:float=1.4, seed:Optional[int]=None, workers:int=1) :
+        """
+        Construit un joueur automatique basé sur une recherche arborescente Monte-Carlo (UCT).
+
+        Chaque itération descend dans l'arbre, l'étend d'un tour, puis termine la partie au hasard sur le jeu lui-même (avec `make`/`unmake`),
+        sans affichage. Le sous-arbre de la position atteinte est réutilisé d'un coup à l'autre.
+
+        Parameters:
+        -----------
+        game : Game
+            Le jeu.
+        time_limit : Optional[float], optional
+            Le temps de réflexion maximal par coup, en secondes. None pour ne pas limiter le temps.
+        playout_limit : Optional[int], optional
+            Le nombre maximal de parties simulées par coup. None pour ne pas limiter le nombre de parties.
+            Une partie au moins est simulée, même avec un budget nul.
+        max_length : int, optional
+            Le nombre maximal de coups d'une partie simulée. Au-delà, la partie est arbitrée au nombre de pions.
+        bias : float, optional
+            La probabilité de choisir une prise plutôt qu'un coup quelconque lorsqu'une prise est possible pendant une partie simulée.
+        exploration : float, optional
+            La constante d'exploration de UCT.
+        seed : Optional[int], optional
+            La graine du générateur aléatoire.
+        workers : int, optional
+            Le nombre de processus de recherche. Au-delà de 1, chaque processus construit son propre arbre
+            (le budget de parties est partagé) et les visites des tours de la racine sont additionnées.
+            L'arbre n'est alors pas réutilisé d'un coup à l'autre.
+        """
+
+        super().__init__(game)
+        self.name = "MCTSIA"
+        self.time_limit = time_limit
+        self.playout_limit = playout_limit
+        self.max_length = max_length
+        self.bias = bias
+        self.exploration = exploration
+        self.random = Random(seed)
+        self.workers = workers
+
+        self.root = None # Racine de la dernière recherche
+        self.last = None # Nœud atteint après le dernier tour joué, réutilisé à la recherche suivante
+
+        self.playouts = 0 # Statistiques de la dernière recherche
+        self.visits = 0
+        self.elapsed = 0.0
+
+    def choose(self) -> int :
+        """
+        Retourne le prochain coup du tour le plus exploré.
+
+        Returns:
+        --------
+        int
+            Le coup codé (voir `MoveCode`), ou `MoveCode.PASS` si le joueur n'a aucun coup.
+        """
+
+        return self._code(self._follow(self.search))
+
+    def get_stats(self) -> dict[str, float] :
+        """
+        Retourne les statistiques de la dernière recherche.
+
+        Returns:
+        --------
+        dict[str, float]
+            Le nombre de parties simulées (`playouts`), la durée en secondes (`time`),
+            le nombre de parties simulées par seconde (`pps`) et le nombre de visites de la racine (`visits`), parties réutilisées comprises.
+        """
+
+        return {
+            "playouts": self.playouts,
+            "time": self.elapsed,
+            "pps": self.playouts / self.elapsed if self.elapsed > 0 else 0.0,
+            "visits": self.visits,
+        }
+
+    def search(self) -> Optional[tuple[tuple[int, int, int, int], ...]] :
+        """
+        Cherche le meilleur tour du joueur courant.
+
+        Returns:
+        --------
+        Optional[tuple[tuple[int, int, int, int], ...]]
+            Le tour le plus visité, ou None si le joueur n'a aucun coup.
+        """
+
+        if self.workers > 1 :
+            return self._search_parallel()
+
+        start = time.perf_counter()
+        deadline = start + self.time_limit if self.time_limit is not None else None
+        self.root = self._reuse()
+        self.playouts = 0
+
+        if self.root.untried == [] and self.root.children == [] :
+            return None
+
+        while True : # Au moins une itération, même si le budget est déjà épuisé : la racine a alors un tour à retourner
+            self._iterate()
+            self.playouts += 1
+
+            if ((deadline is not None and time.perf_counter() >= deadline) or
+                (self.playout_limit is not None and self.playouts >= self.playout_limit)) : # Budget épuisé
+                break
+
+            if self.time_limit is None and self.playout_limit is None : # Sans budget, une seule itération
+                break
+
+            if self.cancelled.is_set() : # Réflexion annulée (voir `AutoPlayer.think`)
+                break
+
+        self.elapsed = time.perf_counter() - start
+        self.visits = self.root.visits
+
+        best = max(self.root.children, key=lambda child : child.visits)
+        self.last = best
+
+        return best.move
+
+    def _search_parallel(self) -> Optional[tuple[tuple[int, int, int, int], ...]] :
+        """
+        Lance une recherche indépendante par processus de travail et additionne les visites des tours de la racine.
+
+        La position est envoyée sous forme sérialisée (voir `Game.to_bytes`), pas la partie entière.
+
+        Returns:
+        --------
+        Optional[tuple[tuple[int, int, int, int], ...]]
+            Le tour le plus visité sur l'ensemble des processus, ou None si le joueur n'a aucun coup.
+        """
+
+        start = time.perf_counter()
+        self.root = None
+        self.last = None
+
+        if next(self.game.generate_moves(), None) is None :
+            return None
+
+        options = {
+            "time_limit": self.time_limit,
+            "deadline": time.time() + self.time_limit if self.time_limit is not None else None, # Le temps passé dans la file d'attente est décompté
+            "playout_limit": -(-self.playout_limit // self.workers) if self.playout_limit is not None else None,
+            "max_length": self.max_length,
+            "bias": self.bias,
+            "exploration": self.exploration,
+        }
+
+        data = self.game.to_bytes()
+        pool = Parallel.pool(self.workers)
+        seed = self.random.getrandbits(32)
+        futures = [pool.submit(Parallel.mcts, data, type(self.game.board), options, seed + i, self.game.get_rules()) for i in range(self.workers)]
+
+        visits = {}
+        self.playouts = 0
+
+        for children, playouts in Parallel.results(futures, self.workers, self.cancelled) :
+            self.playouts += playouts
+
+            for move, count, _ in children :
+                visits[move] = visits.get(move, 0) + count
+
+        self.visits = sum(visits.values())
+        self.elapsed = time.perf_counter() - start
+
+        return max(visits, key=lambda move : visits[move])
+
+    def _reuse(self) -> MCTSNode :
+        """
+        Retourne le nœud de la position courante dans l'arbre du coup précédent, ou un nouvel arbre.
+
+        Returns:
+        --------
+        MCTSNode
+            La racine de la recherche.
+        """
+
+        key = self.game.get_hash()
+
+        if self.last is not None :
+            for node in [self.last] + self.last.children : # Position après notre tour, ou après le tour adverse qui a suivi
+                if node.key == key :
+                    node.parent = None # Libère le reste de l'ancien arbre
+                    return node
+
+        return MCTSNode(self.game)
+
+    def _iterate(self) -> None :
+        """
+        Effectue une itération : sélection, expansion, partie simulée puis rétropropagation du résultat.
+        """
+
+        node = self.root
+        undos = []
+
+        while node.untried == [] and node.children != [] : # Sélection
+            node = node.select(self.exploration)
+            undos += [self.game.make(*move) for move in node.move]
+
+        if node.untried != [] : # Expansion
+            move = node.untried.pop(self.random.randrange(len(node.untried)))
+            undos += [self.game.make(*step) for step in move]
+            child = MCTSNode(self.game, move, node)
+            node.children.append(child)
+            node = child
+
+        winner = self.playout()
+
+        while node is not None : # Rétropropagation
+            node.visits += 1
+            if winner == node.player :
+                node.wins += 1
+            elif winner == Pawn.VOID :
+                node.wins += 0.5
+            node = node.parent
+
+        for undo in reversed(undos) :
+            self.game.unmake(undo)
+
+    def playout(self) -> Pawn :
+        """
+        Termine la partie au hasard depuis la position courante, puis restaure la position.
+
+        Les prises sont favorisées selon `bias`. Un joueur qui n'a aucun coup passe son tour (voir `Game.is_finished`).
+        Une partie terminée selon `Game.is_finished` garde son résultat (une nulle compte comme une égalité).
+        Sinon, si aucun camp n'a gagné après `max_length` coups, le camp qui a le plus de pions l'emporte.
+
+        Returns:
+        --------
+        Pawn
+            Le gagnant de la partie simulée, `Pawn.VOID` en cas d'égalité.
+        """
+
+        game = self.game
+        undos = []
+
+        for _ in range(self.max_length) :
+            if game.is_finished() != Pawn.VOID :
+                break
+
+            moves = list(game.generate_moves())
+
+            if moves == [] : # Le joueur est bloqué mais la partie continue : il passe son tour
+                undos.append((False, game.pass_turn()))
+                continue
+
+            if self.bias > 0 and self.random.random() < self.bias :
+                takes = [move for move in moves if abs(move[2] - move[0]) == 2 or abs(move[3] - move[1]) == 2]
+                if takes != [] :
+                    moves = takes
+
+            undos.append((True, game.make(*moves[self.random.randrange(len(moves))])))
+
+        result = game.is_finished()
+        black = game.count(Pawn.BLACK)
+        white = game.count(Pawn.WHITE)
+
+        for made, undo in reversed(undos) :
+            if made :
+                game.unmake(undo)
+            else :
+                game.unpass_turn(undo)
+
+        if result == Pawn.DRAW :
+            return Pawn.VOID
+        if result != Pawn.VOID : # Partie terminée : le résultat peut différer du nombre de pions (joueur bloqué qui perd)
+            return result
+        if black > white :
+            return Pawn.BLACK
+        if white > black :
+            return Pawn.WHITE
+        return Pawn.VOID
\ No newline at end of file
@@ -2,6 +2,7 @@ from random import choice
 
 from controler.Game import Game
 from controler.AutoPlayer import AutoPlayer
+from utils.MoveCode import MoveCode
 
 class RandomIA(AutoPlayer) :
     def __init__(self, game:Game) :
@@ -18,29 +19,19 @@ class RandomIA(AutoPlayer) :
         
         self.name = "RandomIA"
 
-    def input(self) -> str :
+    def choose(self) -> int :
         """
         Retourne un coup aléatoire autorisé par le jeu.
 
         Returns:
         --------
-        str
-            Le coup aléatoire.
+        int
+            Le coup aléatoire codé (voir `MoveCode`), ou `MoveCode.PASS` si le joueur n'a aucun coup.
         """
 
-        while True : # Continue jusqu'à ce qu'un pion ait un coup possible
-            player = self.game.get_current_player() # Récupère le joueur courant
+        moves = list(self.game.generate_moves()) # Récupère tous les coups autorisés du joueur courant
 
-            pawns = [(x, y) for x, y, p in self.game.get_pawns() if p == player] # Récupère les coordonnées des pions du joueur courant
-            pawn = choice(pawns) # Sélectionne un pion aléatoire
+        if len(moves) == 0 : # Aucun coup possible
+            return MoveCode.PASS
 
-            moves = self.game.get_possible_moves(*pawn) # Récupère les coups possibles pour le pion sélectionné
-            if len(moves) > 0 :
-                break
-
-        move = choice(moves) # Sélectionne un coup aléatoire
-
-        move_string = f"{chr(97 + pawn[0])}{pawn[1] + 1}{chr(97 + move[0])}{move[1] + 1}" # Convertit les coordonnées en chaîne de caractères
-        self.last_shot = move_string # Enregistre
-
-        return move_string
\ No newline at end of file
+        return MoveCode.encode(*choice(moves)) # Sélectionne un coup aléatoire
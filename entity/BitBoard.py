@@ -0,0 +1,463 @@
+from utils.Pawn import Pawn
+from utils.Move import Move
+from entity.Board import Board
+from entity.MoveTable import MoveTable
+from utils.Zobrist import Zobrist
+
+class BitBoard :
+    # Directions de déplacement (horizontale, verticale et diagonale)
+    DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+    # Tables précalculées par taille de plateau (voir `BitBoard._tables`)
+    TABLES = {}
+
+    def __init__(self, size:int, config:list[tuple[int, int, Pawn]]=None) :
+        """
+        Initialise un nouveau plateau de jeu représenté par deux masques de bits, un par couleur.
+
+        La case (x, y) correspond au bit d'indice `y * size + x`. Les déplacements et les prises
+        sont calculés à partir de masques de voisinage et de saut précalculés pour chaque taille.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau. Automatiquement compris entre 3 et 9.
+        config : list[tuple[int, int, Pawn]], optional
+            La configuration initiale du plateau de jeu. Par défaut, le plateau est initialisé avec une configuration standard.
+            Configuration : liste de tuples contenant les coordonnées et la valeur des pions.
+        """
+
+        # Si la taille n'est pas comprise entre 3 et 9, on l'ajuste
+        if size <= 1 :
+            size = 3
+        if size >= 10 :
+            size = 9
+
+        self.size = size
+        self.full = (1 << size*size) - 1 # Masque de toutes les cases du plateau
+        self.black = 0 # Masque des pions bleus
+        self.white = 0 # Masque des pions rouges
+        self.neighbours, self.jumps, self.shifts, self.targets = BitBoard._tables(size)
+        self.zobrist = Zobrist.get(size) # Clés de Zobrist de la taille du plateau
+        self.hash = 0 # Clé de Zobrist du plateau, mise à jour à chaque modification
+
+        if config is None : # Si aucune configuration n'est spécifiée, on utilise la configuration standard (voir README.md)
+            config = Board.default_config(size)
+
+        for x, y, p in config :
+            self.set(x, y, p)
+
+    @staticmethod
+    def _tables(size:int) -> tuple[list[int], list[dict[int, int]], list[tuple[int, int]], dict[tuple[int, int, int, int], tuple[int, int, int]]] :
+        """
+        Retourne les tables précalculées pour une taille de plateau, en les construisant au premier appel.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+
+        Returns:
+        --------
+        tuple[list[int], list[dict[int, int]], list[tuple[int, int]], dict[tuple[int, int, int, int], tuple[int, int, int]]]
+            - Pour chaque case, le masque des cases adjacentes.
+            - Pour chaque case, un dictionnaire associant le bit d'arrivée d'un saut au bit de la case sautée.
+            - Pour chaque direction, le décalage en bits et le masque des cases pouvant se déplacer dans cette direction.
+            - Pour chaque déplacement possible sur le plateau vide (x1, y1, x2, y2), le bit de départ, le bit d'arrivée
+              et le bit de la case sautée (0 pour un déplacement simple).
+        """
+
+        if size not in BitBoard.TABLES :
+            table = MoveTable.get(size)
+            neighbours = []
+            jumps = []
+            targets = {}
+
+            for y in range(size) :
+                for x in range(size) :
+                    neighbours.append(sum(1 << (j*size + i) for i, j in table.steps[(x, y)]))
+                    jumps.append({1 << (j*size + i): 1 << (oy*size + ox) for (ox, oy), (i, j) in table.jumps[(x, y)]})
+
+                    for (i, j), over in table.targets[(x, y)].items() :
+                        targets[(x, y, i, j)] = (1 << (y*size + x), 1 << (j*size + i), 1 << (over[1]*size + over[0]) if over is not None else 0)
+
+            shifts = []
+
+            for dx, dy in BitBoard.DIRECTIONS :
+                mask = 0 # Cases dont le voisin dans la direction (dx, dy) existe
+                for y in range(size) :
+                    for x in range(size) :
+                        if 0 <= x+dx < size and 0 <= y+dy < size :
+                            mask |= 1 << (y*size + x)
+                shifts.append((dy*size + dx, mask))
+
+            BitBoard.TABLES[size] = (neighbours, jumps, shifts, targets)
+
+        return BitBoard.TABLES[size]
+
+    def _shift(self, mask:int, direction:int) -> int :
+        """
+        Décale toutes les cases d'un masque d'une case dans une direction, sans déborder sur les bords.
+
+        Parameters:
+        -----------
+        mask : int
+            Le masque à décaler.
+        direction : int
+            L'indice de la direction dans `BitBoard.DIRECTIONS`.
+
+        Returns:
+        --------
+        int
+            Le masque décalé.
+        """
+
+        shift, valid = self.shifts[direction]
+        mask &= valid # Retire les cases qui sortiraient du plateau
+
+        return mask << shift if shift > 0 else mask >> -shift
+
+    def get(self, x:int, y:int) -> Pawn :
+        """
+        Retourne la valeur du pion à la position spécifiée.
+
+        Parameters:
+        -----------
+        x : int
+            Coordonnée en abscisse (colonne) du pion.
+        y : int
+            Coordonnée en ordonnée (ligne) du pion.
+
+        Returns:
+        --------
+        Pawn
+            La valeur du pion à la position spécifiée.
+        """
+
+        bit = 1 << (y*self.size + x)
+
+        if self.black & bit :
+            return Pawn.BLACK
+        if self.white & bit :
+            return Pawn.WHITE
+        return Pawn.VOID
+
+    def get_pawns(self) -> list[tuple[int, int, Pawn]] :
+        """
+        Retourne les pions du plateau de jeu. Chaque pion est représenté par un tuple contenant ses coordonnées et sa valeur.
+
+        Returns:
+        --------
+        list[tuple[int, int, Pawn]]
+            Les pions du plateau de jeu.
+        """
+
+        result = []
+
+        for mask, p in ((self.black, Pawn.BLACK), (self.white, Pawn.WHITE)) :
+            while mask : # Parcourt uniquement les bits à 1
+                bit = mask & -mask # Bit de poids faible
+                sq = bit.bit_length() - 1
+                result.append((sq % self.size, sq // self.size, p))
+                mask ^= bit
+
+        return result
+
+    def get_player_pawns(self, player:Pawn) -> list[tuple[int, int]] :
+        """
+        Retourne les positions des pions d'un joueur.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
+
+        Returns:
+        --------
+        list[tuple[int, int]]
+            Les positions des pions du joueur.
+        """
+
+        mask = self.black if player == Pawn.BLACK else self.white
+        result = []
+
+        while mask : # Parcourt uniquement les bits à 1
+            bit = mask & -mask
+            sq = bit.bit_length() - 1
+            result.append((sq % self.size, sq // self.size))
+            mask ^= bit
+
+        return result
+
+    def count(self, player:Pawn) -> int :
+        """
+        Retourne le nombre de pions d'un joueur.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
+
+        Returns:
+        --------
+        int
+            Le nombre de pions du joueur.
+        """
+
+        return (self.black if player == Pawn.BLACK else self.white).bit_count()
+
+    def set(self, x:int, y:int, value:Pawn) -> None :
+        """
+        Modifie la valeur du pion à la position spécifiée.
+
+        Parameters:
+        -----------
+        x : int
+            Coordonnée en abscisse (colonne) du pion.
+        y : int
+            Coordonnée en ordonnée (ligne) du pion.
+        value : Pawn
+            La nouvelle valeur du pion.
+        """
+
+        cell = self.zobrist.cells[(x, y)]
+        self.hash ^= cell[self.get(x, y)] ^ cell[value] # Retire l'ancien pion de la clé et ajoute le nouveau
+
+        bit = 1 << (y*self.size + x)
+
+        self.black &= ~bit
+        self.white &= ~bit
+
+        match value :
+            case Pawn.BLACK :
+                self.black |= bit
+            case Pawn.WHITE :
+                self.white |= bit
+
+    def get_hash(self) -> int :
+        """
+        Retourne la clé de Zobrist du plateau (64 bits), tenue à jour à chaque modification.
+
+        Returns:
+        --------
+        int
+            La clé de Zobrist du plateau.
+        """
+
+        return self.hash
+
+    def get_size(self) -> int :
+        """
+        Retourne la taille du plateau de jeu.
+
+        Returns:
+        --------
+        int
+            La taille du plateau de jeu.
+        """
+
+        return self.size
+
+    def move_type(self, x1:int, y1:int, x2:int, y2:int) -> Move :
+        """
+        Vérifie si un déplacement est valide (voir `Board.move_type`).
+
+        Parameters:
+        -----------
+        x1 : int
+            Coordonnée en abscisse (colonne) de la position initiale.
+        y1 : int
+            Coordonnée en ordonnée (ligne) de la position initiale.
+        x2 : int
+            Coordonnée en abscisse (colonne) de la position de destination.
+        y2 : int
+            Coordonnée en ordonnée (ligne) de la position de destination.
+
+        Returns:
+        --------
+        Move
+            Le type du déplacement.
+        """
+
+        target = self.targets.get((x1, y1, x2, y2)) # Une seule recherche, sans test de bord
+
+        if target is None : # Position hors du plateau, surplace ou destination trop éloignée
+            return Move.INVALID
+
+        bit, dest, over = target
+
+        if dest & (self.black | self.white) : # La destination doit être vide
+            return Move.INVALID
+
+        if self.black & bit :
+            opponent = self.white
+        elif self.white & bit :
+            opponent = self.black
+        else : # On essaie de déplacer un pion d'une case vide
+            return Move.INVALID
+
+        if not over : # Déplacement simple
+            return Move.SIMPLE
+
+        if over & opponent : # Saut par-dessus un pion adverse
+            return Move.TAKE
+
+        return Move.INVALID
+
+    def get_moves(self, x:int, y:int) -> list[tuple[int, int, Move]] :
+        """
+        Retourne les déplacements valides d'un pion.
+
+        Parameters:
+        -----------
+        x : int
+            Coordonnée en abscisse (colonne) du pion.
+        y : int
+            Coordonnée en ordonnée (ligne) du pion.
+
+        Returns:
+        --------
+        list[tuple[int, int, Move]]
+            Les déplacements valides du pion, sous forme de tuples (x, y, type de déplacement).
+        """
+
+        sq = y*self.size + x
+        bit = 1 << sq
+
+        if self.black & bit :
+            opponent = self.white
+        elif self.white & bit :
+            opponent = self.black
+        else :
+            return []
+
+        empty = self.full & ~(self.black | self.white)
+        result = []
+
+        steps = self.neighbours[sq] & empty # Cases adjacentes vides
+        while steps :
+            dest = steps & -steps
+            d = dest.bit_length() - 1
+            result.append((d % self.size, d // self.size, Move.SIMPLE))
+            steps ^= dest
+
+        if not self.neighbours[sq] & opponent : # Aucun voisin adverse : aucune prise
+            return result
+
+        takes = 0
+        for shift, valid in self.shifts : # Voisin adverse dans chaque direction, puis case suivante, sans test de bord (voir `_shift`)
+            if shift > 0 :
+                takes |= ((bit & valid) << shift & opponent & valid) << shift
+            else :
+                takes |= ((bit & valid) >> -shift & opponent & valid) >> -shift
+        takes &= empty
+
+        while takes :
+            dest = takes & -takes
+            d = dest.bit_length() - 1
+            result.append((d % self.size, d // self.size, Move.TAKE))
+            takes ^= dest
+
+        return result
+
+    def get_movable(self, player:Pawn) -> tuple[int, int] :
+        """
+        Retourne les masques des pions d'un joueur pouvant se déplacer et de ceux pouvant prendre.
+
+        Le calcul se fait en décalant les masques complets dans les 8 directions, sans parcourir les pions.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
+
+        Returns:
+        --------
+        tuple[int, int]
+            Le masque des pions pouvant faire un déplacement simple et le masque des pions pouvant prendre.
+        """
+
+        own, opponent = (self.black, self.white) if player == Pawn.BLACK else (self.white, self.black)
+        empty = self.full & ~(own | opponent)
+        steps = 0
+        takes = 0
+
+        for d in range(len(BitBoard.DIRECTIONS)) :
+            back = len(BitBoard.DIRECTIONS) - 1 - d # Direction opposée (les directions sont symétriques)
+            steps |= own & self._shift(empty, back) # Pions dont le voisin est vide
+            takes |= own & self._shift(opponent & self._shift(empty, back), back) # Pions dont le voisin est adverse et la case suivante vide
+
+        return steps, takes
+
+    def can_move(self, player:Pawn) -> bool :
+        """
+        Vérifie si un joueur a au moins un déplacement, simple ou avec prise.
+
+        Comme `get_movable`, mais s'arrête à la première direction où un pion peut se déplacer.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
+
+        Returns:
+        --------
+        bool
+            True si un pion du joueur peut se déplacer, False sinon.
+        """
+
+        own, opponent = (self.black, self.white) if player == Pawn.BLACK else (self.white, self.black)
+        empty = self.full & ~(own | opponent)
+
+        for d in range(len(BitBoard.DIRECTIONS)) :
+            back = len(BitBoard.DIRECTIONS) - 1 - d
+            if own & self._shift(empty | opponent & self._shift(empty, back), back) : # Voisin vide, ou voisin adverse suivi d'une case vide
+                return True
+
+        return False
+
+    def move(self, x1:int, y1:int, x2:int, y2:int) -> None :
+        """
+        Déplace un pion sur le plateau de jeu.
+
+        Parameters:
+        -----------
+        x1 : int
+            Coordonnée en abscisse (colonne) de la position initiale.
+        y1 : int
+            Coordonnée en ordonnée (ligne) de la position initiale.
+        x2 : int
+            Coordonnée en abscisse (colonne) de la position de destination.
+        y2 : int
+            Coordonnée en ordonnée (ligne) de la position de destination.
+        """
+
+        swap = (1 << (y1*self.size + x1)) | (1 << (y2*self.size + x2)) # Inverse les deux cases
+
+        if self.black & swap :
+            self.black ^= swap
+            p = Pawn.BLACK
+        else :
+            self.white ^= swap
+            p = Pawn.WHITE
+
+        self.hash ^= self.zobrist.cells[(x1, y1)][p] ^ self.zobrist.cells[(x2, y2)][p]
+
+    def take(self, x1:int, y1:int, x2:int, y2:int) -> None :
+        """
+        Retire le pion adverse lors d'un saut et déplace le pion courant à sa nouvelle position.
+
+        Parameters:
+        -----------
+        x1 : int
+            Coordonnée en abscisse (colonne) de la position initiale.
+        y1 : int
+            Coordonnée en ordonnée (ligne) de la position initiale.
+        x2 : int
+            Coordonnée en abscisse (colonne) de la position de destination.
+        y2 : int
+            Coordonnée en ordonnée (ligne) de la position de destination.
+        """
+
+        self.move(x1, y1, x2, y2)
+        self.set((x1+x2)//2, (y1+y2)//2, Pawn.VOID) # Retire le pion adverse
\ No newline at end of file
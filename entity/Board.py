@@ -1,7 +1,7 @@
-from math import sqrt
-
 from utils.Pawn import Pawn
 from utils.Move import Move
+from entity.MoveTable import MoveTable
+from utils.Zobrist import Zobrist
 
 class Board :
     def __init__(self, size:int, config:list[tuple[int, int, Pawn]]=None) :
@@ -33,22 +33,53 @@ class Board :
 
         board = [[Pawn.VOID for i in range(size)] for j in range(size)] # Crée un plateau de jeu vide grâce à une liste en compréhension (voir README.md)
 
-        if config is not None : # Si une configuration est spécifiée, on place les pions selon cette configuration
-            for x, y, p in config :
-                board[y][x] = p
-
-        else : # Sinon, on initialise le plateau avec une configuration standard (voir README.md)
-            for i in range(size) :
-                if i < (size-2)/2 :
-                    board[-i-1][i] = Pawn.BLACK
-                    board[i][-i-1] = Pawn.WHITE
-                for j in range(size) :
-                    if j < i :
-                        board[-i-1][j] = Pawn.BLACK
-                        board[i][-j-1] = Pawn.WHITE
+        if config is None : # Si aucune configuration n'est spécifiée, on utilise la configuration standard (voir README.md)
+            config = Board.default_config(size)
+
+        for x, y, p in config : # On place les pions selon la configuration
+            board[y][x] = p
         
         self.board = board
         self.size = size
+        self.table = MoveTable.get(size) # Table des déplacements précalculée
+        self.zobrist = Zobrist.get(size) # Clés de Zobrist de la taille du plateau
+        self.hash = 0 # Clé de Zobrist du plateau, mise à jour à chaque modification (voir `Board.set`)
+        self.pawns = {Pawn.BLACK: set(), Pawn.WHITE: set()} # Positions des pions de chaque couleur, mises à jour à chaque modification
+
+        for y in range(size) :
+            for x in range(size) :
+                self.hash ^= self.zobrist.cells[(x, y)][board[y][x]]
+                if board[y][x] != Pawn.VOID :
+                    self.pawns[board[y][x]].add((x, y))
+
+    @staticmethod
+    def default_config(size:int) -> list[tuple[int, int, Pawn]] :
+        """
+        Retourne la configuration standard d'un plateau de la taille spécifiée.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+
+        Returns:
+        --------
+        list[tuple[int, int, Pawn]]
+            Les pions de la configuration standard, sous forme de tuples (x, y, pion).
+        """
+
+        config = []
+
+        for i in range(size) :
+            if i < (size-2)/2 :
+                config.append((i, size-i-1, Pawn.BLACK))
+                config.append((size-i-1, i, Pawn.WHITE))
+            for j in range(size) :
+                if j < i :
+                    config.append((j, size-i-1, Pawn.BLACK))
+                    config.append((size-j-1, i, Pawn.WHITE))
+
+        return config
     
     def get(self, x:int, y:int) -> Pawn :
         """
@@ -79,16 +110,41 @@ class Board :
             Les pions du plateau de jeu.
         """
 
-        # NOTE: On pourrait utiliser le yield pour optimiser la mémoire et avoir un code plus propre, mais cela empièterait sur la lisibilité
+        return [(x, y, p) for p, pawns in self.pawns.items() for x, y in pawns] # Parcourt uniquement les pions, pas tout le plateau
 
-        result = []
+    def get_player_pawns(self, player:Pawn) -> list[tuple[int, int]] :
+        """
+        Retourne les positions des pions d'un joueur.
 
-        for i in range(self.size) : # On parcourt chaque case du plateau
-            for j in range(self.size) :
-                if self.board[i][j] != Pawn.VOID :
-                    result.append((j, i, self.board[i][j]))  # On ajoute le pion à la liste
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
 
-        return result
+        Returns:
+        --------
+        list[tuple[int, int]]
+            Les positions des pions du joueur.
+        """
+
+        return list(self.pawns[player]) # Copie : le plateau peut être modifié pendant le parcours
+
+    def count(self, player:Pawn) -> int :
+        """
+        Retourne le nombre de pions d'un joueur.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
+
+        Returns:
+        --------
+        int
+            Le nombre de pions du joueur.
+        """
+
+        return len(self.pawns[player])
 
     def set(self, x:int, y:int, value:Pawn) -> None :
         """
@@ -104,8 +160,28 @@ class Board :
             La nouvelle valeur du pion.
         """
 
+        cell = self.zobrist.cells[(x, y)]
+        self.hash ^= cell[self.board[y][x]] ^ cell[value] # Retire l'ancien pion de la clé et ajoute le nouveau
+
+        if self.board[y][x] != Pawn.VOID :
+            self.pawns[self.board[y][x]].discard((x, y))
+        if value != Pawn.VOID :
+            self.pawns[value].add((x, y))
+
         self.board[y][x] = value
     
+    def get_hash(self) -> int :
+        """
+        Retourne la clé de Zobrist du plateau (64 bits), tenue à jour à chaque modification.
+
+        Returns:
+        --------
+        int
+            La clé de Zobrist du plateau.
+        """
+
+        return self.hash
+
     def get_size(self) -> int :
         """
         Retourne la taille du plateau de jeu.
@@ -146,34 +222,29 @@ class Board :
             `True` si le déplacement est valide, sinon `False`.
         """
 
-        if (not (0 <= x1 < self.size) or
-            not (0 <= y1 < self.size) or
-            not (0 <= x2 < self.size) or
-            not (0 <= y2 < self.size)) : # Si les coordonnées ne sont pas dans le plateau de jeu
+        targets = self.table.targets.get((x1, y1)) # Destinations atteignables depuis la position initiale
+
+        if targets is None or (x2, y2) not in targets : # Position hors du plateau, surplace ou destination trop éloignée
             return Move.INVALID
 
         # Récupère le pion et la destination
-        p1 = self.get(x1, y1)
-        p2 = self.get(x2, y2)
-        d = sqrt((x2-x1)**2 + (y2-y1)**2) # Calcule la distance entre les deux positions
+        p1 = self.board[y1][x1]
+        p2 = self.board[y2][x2]
 
-        if p1 == Pawn.VOID : # On essaie de déplacer un pion d'une case vide
+        if p1 == Pawn.VOID or p2 != Pawn.VOID : # On essaie de déplacer un pion d'une case vide ou vers une case occupée
             return Move.INVALID
-        
-        if d == 0 : # Le surplace est invalide
-            return Move.INVALID
-        
-        if d == 1 or d == sqrt(2) : # Déplacement simple
-            if p2 == Pawn.VOID :
-                return Move.SIMPLE
-        
-        if d == 2 or d == sqrt(8) : # Saut avec prise
-            p3 = self.get((x1+x2)//2, (y1+y2)//2) # Récupère le pion sauté
 
-            if p2 == Pawn.VOID and p3 != Pawn.VOID and p3 != p1 : # Prise d'un pion adverse et arrivée sur une case vide
-                return Move.TAKE
+        over = targets[(x2, y2)]
+
+        if over is None : # Déplacement simple
+            return Move.SIMPLE
+
+        p3 = self.board[over[1]][over[0]] # Récupère le pion sauté
 
-        return Move.INVALID # Déplacement invalide (par défaut, ne devrait pas être atteint)s
+        if p3 != Pawn.VOID and p3 != p1 : # Prise d'un pion adverse
+            return Move.TAKE
+
+        return Move.INVALID
 
     def move(self, x1:int, y1:int, x2:int, y2:int) -> None :
         """
@@ -212,4 +283,57 @@ class Board :
 
         self.set(x2, y2, self.get(x1, y1))
         self.set(x1, y1, Pawn.VOID)
-        self.set((x1+x2)//2, (y1+y2)//2, Pawn.VOID) # Retire le pion adverse
\ No newline at end of file
+        self.set((x1+x2)//2, (y1+y2)//2, Pawn.VOID) # Retire le pion adverse
+
+    def can_move(self, player:Pawn) -> bool :
+        """
+        Vérifie si un joueur a au moins un déplacement, simple ou avec prise.
+
+        Les pions sont parcourus jusqu'au premier qui peut se déplacer.
+
+        Parameters:
+        -----------
+        player : Pawn
+            Le joueur.
+
+        Returns:
+        --------
+        bool
+            True si un pion du joueur peut se déplacer, False sinon.
+        """
+
+        return any(self.get_moves(x, y) for x, y in self.pawns[player]) # Aucune copie : le plateau n'est pas modifié pendant le parcours
+
+    def get_moves(self, x:int, y:int) -> list[tuple[int, int, Move]] :
+        """
+        Retourne les déplacements valides d'un pion.
+
+        Parameters:
+        -----------
+        x : int
+            Coordonnée en abscisse (colonne) du pion.
+        y : int
+            Coordonnée en ordonnée (ligne) du pion.
+
+        Returns:
+        --------
+        list[tuple[int, int, Move]]
+            Les déplacements valides du pion, sous forme de tuples (x, y, type de déplacement).
+        """
+
+        if (x, y) not in self.table.steps : # Position hors du plateau
+            return []
+
+        board = self.board
+        p = board[y][x]
+
+        if p == Pawn.VOID :
+            return []
+
+        result = [(x2, y2, Move.SIMPLE) for x2, y2 in self.table.steps[(x, y)] if board[y2][x2] == Pawn.VOID] # Déplacements simples
+
+        for (ox, oy), (x2, y2) in self.table.jumps[(x, y)] : # Sauts avec prise
+            if board[y2][x2] == Pawn.VOID and board[oy][ox] != Pawn.VOID and board[oy][ox] != p :
+                result.append((x2, y2, Move.TAKE))
+
+        return result
\ No newline at end of file
@@ -0,0 +1,64 @@
+class MoveTable :
+    # Tables déjà construites, une par taille de plateau (voir `MoveTable.get`)
+    TABLES = {}
+
+    def __init__(self, size:int) :
+        """
+        Construit la table des déplacements d'un plateau de taille spécifiée.
+
+        Pour chaque case (x, y), la table liste :
+        - `steps[(x, y)]` : les cases adjacentes (horizontale, verticale ou diagonale), cibles d'un déplacement simple.
+        - `jumps[(x, y)]` : les couples (case sautée, case d'arrivée) d'un saut avec prise.
+        - `targets[(x, y)]` : un dictionnaire associant chaque destination à la case sautée (`None` pour un déplacement simple).
+
+        Les cases en dehors du plateau n'apparaissent jamais dans la table : aucun test de bord n'est nécessaire à l'utilisation.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+        """
+
+        self.size = size
+        self.steps = {}
+        self.jumps = {}
+        self.targets = {}
+
+        for y in range(size) :
+            for x in range(size) :
+                steps = []
+                jumps = []
+
+                for dx in range(-1, 2) :
+                    for dy in range(-1, 2) :
+                        if dx == 0 and dy == 0 : # Le surplace est invalide
+                            continue
+                        if 0 <= x+dx < size and 0 <= y+dy < size :
+                            steps.append((x+dx, y+dy))
+                        if 0 <= x+2*dx < size and 0 <= y+2*dy < size :
+                            jumps.append(((x+dx, y+dy), (x+2*dx, y+2*dy)))
+
+                self.steps[(x, y)] = steps
+                self.jumps[(x, y)] = jumps
+                self.targets[(x, y)] = {dest: None for dest in steps} | {dest: over for over, dest in jumps}
+
+    @staticmethod
+    def get(size:int) -> "MoveTable" :
+        """
+        Retourne la table des déplacements d'une taille de plateau, construite une seule fois par taille.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+
+        Returns:
+        --------
+        MoveTable
+            La table des déplacements.
+        """
+
+        if size not in MoveTable.TABLES :
+            MoveTable.TABLES[size] = MoveTable(size)
+
+        return MoveTable.TABLES[size]
\ No newline at end of file
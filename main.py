@@ -4,16 +4,25 @@
 from controler.Game import Game
 from controler.autoplayer.RandomIA import RandomIA
 from controler.autoplayer.HeuristIA import HeuristIA
+from controler.autoplayer.AlphaBetaIA import AlphaBetaIA
+from controler.autoplayer.MCTSIA import MCTSIA
 from controler.Menu import Menu
 from boundary.MenuView import MenuView
+from boundary.Keyboard import Keyboard
 
 if __name__ == "__main__" :
     game = Game(7)
     randomIA = RandomIA(game)
     heuristIA = HeuristIA(game)
-    menu = Menu(game, [randomIA, heuristIA])
+    alphaBetaIA = AlphaBetaIA(game)
+    mctsIA = MCTSIA(game)
+    menu = Menu(game, [randomIA, heuristIA, alphaBetaIA, mctsIA])
     menuview = MenuView(menu)
 
-    menuview.start()
+    Keyboard.start() # Le terminal reste en mode brut pendant tout le jeu
 
-    menuview.end()
\ No newline at end of file
+    try :
+        menuview.start()
+    finally :
+        menuview.end()
+        Keyboard.stop()
\ No newline at end of file
@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+
+from controler.OpeningBook import OpeningBook
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description="Construction du livre d'ouvertures, par des recherches alpha-bêta profondes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(range(3, 10)), help="tailles de plateau")
+    parser.add_argument("--plies", type=int, default=2, help="nombre de tours couverts par le livre")
+    parser.add_argument("--time", type=float, default=5.0, help="temps de recherche par position, en secondes")
+    parser.add_argument("--workers", type=int, default=1, help="nombre de processus")
+    parser.add_argument("--path", default="openings.bin", help="fichier du livre")
+    args = parser.parse_args()
+
+    count = OpeningBook.build(args.path, args.sizes, args.plies, args.time, workers=args.workers, progress=lambda done, total : print(f"\r{done}/{total} positions", end="", flush=True))
+
+    print(f"\n{count} positions ->", args.path)
@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+
+from controler.Tablebase import Tablebase
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description="Génération des tables de finales des petits plateaux, par analyse rétrograde.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 4, 5], help="tailles de plateau")
+    parser.add_argument("--pieces", type=int, default=None, help="nombre maximal de pions (par défaut, selon la taille)")
+    parser.add_argument("--no-move-loses", action="store_true", help="un joueur bloqué perd la partie (voir Game)")
+    parser.add_argument("--workers", type=int, default=1, help="nombre de processus")
+    parser.add_argument("--path", default="tablebase{size}.bin", help="fichier de chaque table, {size} étant remplacé par la taille")
+    args = parser.parse_args()
+
+    for size in args.sizes :
+        path = args.path.format(size=size)
+        Tablebase.generate(path, size, args.pieces, args.no_move_loses, args.workers, lambda done, total : print(f"\r{size}x{size} : {done}/{total} classes", end="", flush=True))
+        print(" ->", path)
@@ -0,0 +1,66 @@
+from controler.Game import Game
+from controler.autoplayer.AlphaBetaIA import AlphaBetaIA
+from entity.BitBoard import BitBoard
+from utils.MoveCode import MoveCode
+from utils.Pawn import Pawn
+
+def state(game:Game) -> tuple :
+    """
+    Retourne la position complète d'une partie.
+    """
+
+    return sorted(game.get_pawns(), key=str), game.get_current_player(), list(game.possible_moves), game.get_hash()
+
+def test_winning_chain() :
+    game = Game(5, [(0, 0, Pawn.BLACK), (1, 1, Pawn.WHITE), (3, 3, Pawn.WHITE), (4, 0, Pawn.BLACK)], BitBoard)
+    before = state(game)
+    player = AlphaBetaIA(game, time_limit=None, max_depth=4)
+
+    assert player.search() == ((0, 0, 2, 2), (2, 2, 4, 4)) # La chaîne qui prend les deux derniers pions
+    assert state(game) == before # La recherche joue les coups sur la partie puis les annule
+
+def test_plays_whole_chain() :
+    game = Game(5, [(0, 0, Pawn.BLACK), (1, 1, Pawn.WHITE), (3, 3, Pawn.WHITE), (4, 0, Pawn.BLACK)], BitBoard)
+    player = AlphaBetaIA(game, time_limit=None, max_depth=4)
+
+    assert player.choose() == MoveCode.encode(0, 0, 2, 2)
+    assert game.play_code(MoveCode.encode(0, 0, 2, 2))
+    assert player.choose() == MoveCode.encode(2, 2, 4, 4) # Suite de la chaîne choisie, sans nouvelle recherche
+    assert game.play_code(MoveCode.encode(2, 2, 4, 4))
+    assert game.is_finished() == Pawn.BLACK
+
+def test_avoids_loss() :
+    game = Game(5, [(0, 0, Pawn.BLACK), (4, 4, Pawn.BLACK), (2, 2, Pawn.WHITE), (4, 2, Pawn.WHITE)], BitBoard)
+    game.pass_turn()
+    player = AlphaBetaIA(game, time_limit=None, max_depth=3)
+    chain = player.search()
+
+    for move in chain :
+        assert game.play(*move)
+
+    reply = AlphaBetaIA(game, time_limit=None, max_depth=1).search() # Aucune réponse ne gagne aussitôt
+    for move in reply or () :
+        assert game.play(*move)
+
+    assert game.is_finished() != Pawn.BLACK
+
+def test_budget() :
+    game = Game(7, backend=BitBoard)
+    player = AlphaBetaIA(game, time_limit=None, node_limit=500)
+    chain = player.search()
+
+    assert chain in list(game.generate_moves(chains=True))
+    assert player.get_stats()["nodes"] <= 500
+
+    player = AlphaBetaIA(game, time_limit=0.2)
+    player.search()
+
+    assert player.get_stats()["time"] < 1.0
+
+def test_no_move() :
+    game = Game(3, [(0, 0, Pawn.BLACK), (1, 0, Pawn.WHITE), (0, 1, Pawn.WHITE), (1, 1, Pawn.WHITE), (2, 0, Pawn.WHITE), (0, 2, Pawn.WHITE), (2, 2, Pawn.WHITE)], BitBoard)
+    player = AlphaBetaIA(game, time_limit=None, max_depth=2)
+
+    assert player.search() is None
+    assert player.choose() == MoveCode.PASS
+    assert player.input() == "pass"
@@ -0,0 +1,28 @@
+import pytest
+
+from boundary.Keyboard import Keyboard
+from controler.AutoPlayer import AutoPlayer
+from controler.Game import Game
+from controler.autoplayer.HeuristIA import HeuristIA
+from utils.MoveCode import MoveCode
+
+def test_choose_abstract() :
+    class Silent(AutoPlayer) : # Ne définit ni `choose` ni `input`
+        pass
+
+    with pytest.raises(TypeError) :
+        Silent(Game(5))
+
+def test_choose_never_waits(monkeypatch) :
+    def unexpected(*args) :
+        raise AssertionError("choose ne doit pas lire le clavier")
+
+    monkeypatch.setattr(Keyboard, "getch", unexpected)
+    monkeypatch.setattr(Keyboard, "poll", unexpected)
+    game = Game(5)
+    player = HeuristIA(game) # Validation activée par défaut : elle est attendue par l'interface, pas par `choose`
+
+    code = player.choose()
+
+    assert MoveCode.decode(code) in set(game.generate_moves())
+    assert player.input() == MoveCode.to_text(code)
@@ -0,0 +1,160 @@
+from random import Random
+
+import pytest
+
+from controler.Game import Game
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+from entity.MoveTable import MoveTable
+from utils.Move import Move
+from utils.Pawn import Pawn
+
+def random_config(size:int, rng:Random) -> list[tuple[int, int, Pawn]] :
+    """
+    Tire une configuration au hasard : chaque case est vide, bleue ou rouge.
+    """
+
+    return [(x, y, p) for y in range(size) for x in range(size) if (p := rng.choice((Pawn.VOID, Pawn.VOID, Pawn.BLACK, Pawn.WHITE))) != Pawn.VOID]
+
+def reference_move_type(board:Board, x1:int, y1:int, x2:int, y2:int) -> Move :
+    """
+    Type d'un déplacement calculé directement à partir des règles (voir `Board.move_type`), sans table.
+    """
+
+    size = board.get_size()
+    dx, dy = abs(x2 - x1), abs(y2 - y1)
+
+    if not all(0 <= c < size for c in (x1, y1, x2, y2)) or board.get(x1, y1) == Pawn.VOID or board.get(x2, y2) != Pawn.VOID :
+        return Move.INVALID
+
+    if max(dx, dy) == 1 :
+        return Move.SIMPLE
+
+    if max(dx, dy) == 2 and dx in (0, 2) and dy in (0, 2) :
+        over = board.get((x1 + x2) // 2, (y1 + y2) // 2)
+        if over not in (Pawn.VOID, board.get(x1, y1)) :
+            return Move.TAKE
+
+    return Move.INVALID
+
+@pytest.mark.parametrize("size", range(3, 10))
+def test_move_table(size) :
+    table = MoveTable.get(size)
+
+    assert MoveTable.get(size) is table # Construite une seule fois par taille
+
+    for y in range(size) :
+        for x in range(size) :
+            steps = {(x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0) and 0 <= x + dx < size and 0 <= y + dy < size}
+            jumps = {((x + dx, y + dy), (x + 2*dx, y + 2*dy)) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0) and 0 <= x + 2*dx < size and 0 <= y + 2*dy < size}
+
+            assert set(table.steps[(x, y)]) == steps
+            assert set(table.jumps[(x, y)]) == jumps
+
+    rng = Random(size)
+    board = Board(size, random_config(size, rng))
+
+    for x1 in range(-1, size + 1) :
+        for y1 in range(-1, size + 1) :
+            for x2 in range(x1 - 3, x1 + 4) :
+                for y2 in range(y1 - 3, y1 + 4) :
+                    assert board.move_type(x1, y1, x2, y2) == reference_move_type(board, x1, y1, x2, y2), (x1, y1, x2, y2)
+
+@pytest.mark.parametrize("size", range(3, 10))
+def test_backends_agree(size) :
+    rng = Random(size)
+
+    for i in range(20) :
+        if i < 5 :
+            config = random_config(size, rng)
+        else : # Plateaux plus ou moins remplis : beaucoup de prises, sur les bords compris
+            empty = rng.choice((0.1, 0.3, 0.6))
+            config = [(x, y, rng.choice((Pawn.BLACK, Pawn.WHITE))) for y in range(size) for x in range(size) if rng.random() >= empty]
+
+        board = Board(size, config)
+        bitboard = BitBoard(size, config)
+
+        assert sorted(board.get_pawns(), key=str) == sorted(bitboard.get_pawns(), key=str)
+
+        for player in (Pawn.BLACK, Pawn.WHITE) :
+            assert board.can_move(player) == bitboard.can_move(player)
+
+        for y in range(size) :
+            for x in range(size) :
+                assert board.get(x, y) == bitboard.get(x, y)
+                assert sorted(board.get_moves(x, y), key=str) == sorted(bitboard.get_moves(x, y), key=str)
+
+        cells = range(-1, size + 1) # Cases du plateau et cases voisines hors du plateau
+
+        for x1 in cells :
+            for y1 in cells :
+                for x2 in range(x1 - 3, x1 + 4) :
+                    for y2 in range(y1 - 3, y1 + 4) :
+                        assert board.move_type(x1, y1, x2, y2) == bitboard.move_type(x1, y1, x2, y2), (x1, y1, x2, y2)
+
+@pytest.mark.parametrize("size", [3, 5, 7, 9])
+def test_games_agree(size) :
+    rng = Random(size)
+
+    for _ in range(5) :
+        games = [Game(size, backend=Board), Game(size, backend=BitBoard)]
+
+        for _ in range(80) :
+            game = games[0]
+            moves = [
+                (x1, y1, x2, y2)
+                for x1, y1, p in game.get_pawns() if p == game.get_current_player()
+                for x2, y2, _ in game.get_possible_moves(x1, y1)
+                if game.possible_moves == [] or (x1, y1, x2, y2) in game.possible_moves
+            ]
+
+            if moves == [] or game.is_finished() != Pawn.VOID :
+                break
+
+            move = rng.choice(moves)
+
+            assert all(g.play(*move) for g in games)
+            assert sorted(games[0].get_pawns(), key=str) == sorted(games[1].get_pawns(), key=str)
+            assert games[0].get_current_player() == games[1].get_current_player()
+            assert sorted(games[0].possible_moves) == sorted(games[1].possible_moves)
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_pawn_sets(backend) :
+    rng = Random(0)
+
+    for size in (3, 6, 9) :
+        board = backend(size, random_config(size, rng))
+
+        for _ in range(200) : # Modifications au hasard, puis comparaison avec un parcours complet du plateau
+            x, y = rng.randrange(size), rng.randrange(size)
+            moves = board.get_moves(x, y)
+
+            if moves != [] and rng.random() < 0.7 :
+                x2, y2, move = rng.choice(moves)
+                if move == Move.TAKE :
+                    board.take(x, y, x2, y2)
+                else :
+                    board.move(x, y, x2, y2)
+            else :
+                board.set(x, y, rng.choice((Pawn.VOID, Pawn.BLACK, Pawn.WHITE)))
+
+            for player in (Pawn.BLACK, Pawn.WHITE) :
+                cells = sorted((i, j) for j in range(size) for i in range(size) if board.get(i, j) == player)
+
+                assert sorted(board.get_player_pawns(player)) == cells
+                assert board.count(player) == len(cells)
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_can_move(backend) :
+    rng = Random(2)
+
+    for _ in range(300) :
+        size = rng.randint(3, 9)
+        empty = rng.choice((0.0, 0.05, 0.2, 0.5)) # Plateaux pleins ou presque : beaucoup de pions bloqués
+        config = [(x, y, rng.choice((Pawn.BLACK, Pawn.WHITE))) for y in range(size) for x in range(size) if rng.random() >= empty]
+        board = backend(size, config)
+
+        for player in (Pawn.BLACK, Pawn.WHITE) :
+            expected = any(board.get_moves(x, y) != [] for x, y, p in board.get_pawns() if p == player)
+
+            assert board.can_move(player) == expected
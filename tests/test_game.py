@@ -0,0 +1,309 @@
+from random import Random
+
+import pytest
+
+from controler.Game import Game
+from controler.autoplayer.HeuristIA import HeuristIA
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+
+def legal_moves(game:Game) -> list[tuple[int, int, int, int]] :
+    """
+    Liste les coups autorisés du joueur courant à partir des déplacements de chaque pion.
+    """
+
+    return [
+        (x1, y1, x2, y2)
+        for x1, y1, p in game.get_pawns() if p == game.get_current_player()
+        for x2, y2, _ in game.get_possible_moves(x1, y1)
+        if game.possible_moves == [] or (x1, y1, x2, y2) in game.possible_moves
+    ]
+
+def state(game:Game) -> tuple :
+    """
+    Retourne tout ce que `unmake` doit restaurer.
+    """
+
+    return (
+        sorted(game.get_pawns(), key=str),
+        game.get_current_player(),
+        list(game.possible_moves),
+        game.get_hash(),
+        sorted(game.get_player_pawns(Pawn.BLACK)),
+        sorted(game.get_player_pawns(Pawn.WHITE)),
+        game.count(Pawn.BLACK),
+        game.count(Pawn.WHITE),
+        dict(game.history),
+        game.quiet,
+    )
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+@pytest.mark.parametrize("size", [3, 5, 7, 9])
+def test_make_unmake(backend, size) :
+    rng = Random(size)
+
+    for _ in range(10) :
+        game = Game(size, backend=backend)
+        stack = []
+
+        for _ in range(60) :
+            moves = legal_moves(game)
+
+            if moves == [] or game.is_finished() != Pawn.VOID :
+                break
+
+            before = state(game)
+            assert game.make(0, 0, 0, 0) is None # Coup refusé (surplace) : la partie n'est pas modifiée
+            assert state(game) == before
+
+            stack.append((before, game.make(*rng.choice(moves))))
+
+        while stack != [] : # Annule les coups un à un, dans l'ordre inverse
+            before, undo = stack.pop()
+            game.unmake(undo)
+
+            assert state(game) == before
+
+        assert state(game) == state(Game(size, backend=backend))
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_heuristic_in_place(backend) :
+    rng = Random(0)
+    game = Game(7, backend=backend)
+
+    for _ in range(30) :
+        before = state(game)
+        best = HeuristIA._get_best(game, game.get_current_player())
+
+        assert state(game) == before # L'évaluation joue les coups sur la partie puis les annule
+
+        if best is None :
+            break
+
+        (x1, y1), (x2, y2, _) = best
+        assert game.play(x1, y1, x2, y2)
+
+        moves = legal_moves(game) # Coup au hasard pour varier les positions
+        if moves == [] or game.is_finished() != Pawn.VOID :
+            break
+        assert game.play(*rng.choice(moves))
+
+def copy(game:Game) -> Game :
+    """
+    Copie une partie en début de tour (aucune prise à continuer).
+    """
+
+    result = Game(game.get_size(), game.get_pawns(), type(game.board))
+
+    if game.get_current_player() == Pawn.WHITE :
+        result.pass_turn()
+
+    return result
+
+def reference_chains(game:Game, prefix:tuple = ()) -> set :
+    """
+    Énumère les tours complets en rejouant chaque préfixe sur une copie de la partie, sans `make` ni `unmake`.
+    """
+
+    current = copy(game)
+    player = current.get_current_player()
+
+    for move in prefix :
+        assert current.play(*move)
+
+    if prefix != () and current.get_current_player() != player : # Tour terminé
+        return {prefix}
+
+    return set().union(*[reference_chains(game, prefix + (move,)) for move in legal_moves(current)])
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+@pytest.mark.parametrize("size", [3, 5, 7])
+def test_generate_moves(backend, size) :
+    rng = Random(size)
+
+    for _ in range(5) :
+        game = Game(size, backend=backend)
+
+        for _ in range(40) :
+            moves = legal_moves(game)
+
+            if moves == [] or game.is_finished() != Pawn.VOID :
+                break
+
+            before = state(game)
+
+            assert sorted(game.generate_moves()) == sorted(moves)
+
+            if game.possible_moves == [] :
+                assert set(game.generate_moves(chains=True)) == reference_chains(game)
+
+            assert state(game) == before # Les chaînes sont énumérées sur la partie puis annulées
+
+            game.make(*rng.choice(moves))
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_legal_moves(backend) :
+    rng = Random(1)
+
+    for _ in range(5) :
+        game = Game(7, backend=backend)
+
+        for _ in range(60) :
+            moves = legal_moves(game)
+
+            if moves == [] or game.is_finished() != Pawn.VOID :
+                break
+
+            legal = game.get_legal_moves()
+
+            assert sorted(legal) == sorted(moves)
+            assert all(game.board.move_type(*move) == kind for move, kind in legal.items())
+            assert not game.is_legal(0, 0, 0, 0)
+
+            undo = game.make(*rng.choice(moves))
+            game.unmake(undo)
+
+            assert game.get_legal_moves() is legal # Le cache est restauré avec la position
+
+            game.make(*rng.choice(moves))
+
+def test_legal_cache() :
+    game = Game(7, [(1, 1, Pawn.BLACK), (5, 1, Pawn.BLACK), (3, 5, Pawn.BLACK), (3, 3, Pawn.WHITE)])
+    calls = []
+    get_moves = game.board.get_moves
+    game.board.get_moves = lambda x, y : calls.append((x, y)) or get_moves(x, y)
+
+    game.get_legal_moves()
+    count = len(calls)
+
+    assert game.make(0, 0, 0, 0) is None
+    assert game.is_legal(1, 1, 0, 2)
+    assert sorted(game.generate_moves()) == sorted(game.get_legal_moves())
+    assert len(calls) == count # Les coups de la position ne sont calculés qu'une fois
+
+def test_generate_moves_lazy() :
+    game = Game(7, [(1, 1, Pawn.BLACK), (5, 1, Pawn.BLACK), (3, 5, Pawn.BLACK), (3, 3, Pawn.WHITE)])
+    calls = []
+    get_moves = game.board.get_moves
+    game.board.get_moves = lambda x, y : calls.append((x, y)) or get_moves(x, y)
+
+    assert next(game.generate_moves()) is not None
+    assert len(calls) == 1 # Seuls les déplacements du premier pion ont été calculés
+    assert game.legal is None # Parcours interrompu : rien n'est gardé
+
+    moves = list(game.generate_moves())
+
+    assert len(calls) == 4
+    assert list(game.legal) == moves # Parcours complet : les coups sont gardés pour la position
+    assert list(game.generate_moves()) == moves
+    assert game.is_legal(*moves[-1])
+    assert len(calls) == 4
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_repetition(backend) :
+    game = Game(5, [(0, 0, Pawn.BLACK), (4, 4, Pawn.WHITE)], backend, repetitions=3, quiet_limit=None)
+    shuffle = [(0, 0, 0, 1), (4, 4, 4, 3), (0, 1, 0, 0), (4, 3, 4, 4)] # Chaque camp fait un aller-retour
+    undos = []
+
+    for move in shuffle * 2 :
+        assert game.is_finished() == Pawn.VOID
+        undos.append(game.make(*move))
+
+    assert game.is_finished() == Pawn.DRAW # Position de départ atteinte pour la troisième fois
+
+    game.unmake(undos.pop())
+
+    assert game.is_finished() == Pawn.VOID # L'historique est restauré par unmake
+
+    relaxed = Game(5, [(0, 0, Pawn.BLACK), (4, 4, Pawn.WHITE)], backend, repetitions=4, quiet_limit=None)
+    default = Game(5, [(0, 0, Pawn.BLACK), (4, 4, Pawn.WHITE)], backend) # Règle désactivée par défaut
+
+    for move in shuffle * 4 :
+        assert relaxed.play(*move)
+        assert default.play(*move)
+
+    assert relaxed.is_finished() == Pawn.DRAW
+    assert default.is_finished() == Pawn.VOID
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_quiet_limit(backend) :
+    config = [(0, 0, Pawn.BLACK), (0, 4, Pawn.BLACK), (4, 4, Pawn.WHITE)]
+    moves = [(0, 0, 1, 0), (4, 4, 4, 3), (1, 0, 2, 0), (4, 3, 4, 2)]
+    game = Game(5, config, backend, quiet_limit=4)
+    unlimited = Game(5, config, backend) # Règle désactivée par défaut
+
+    for move in moves :
+        assert game.is_finished() == Pawn.VOID
+        assert game.play(*move)
+        assert unlimited.play(*move)
+
+    assert game.is_finished() == Pawn.BLACK # Arbitrage : les noirs ont plus de pions
+    assert unlimited.is_finished() == Pawn.VOID
+
+    game = Game(5, [(0, 0, Pawn.BLACK), (4, 4, Pawn.WHITE)], backend, quiet_limit=2)
+    assert game.play(0, 0, 1, 0) and game.play(4, 4, 4, 3)
+    assert game.is_finished() == Pawn.DRAW # Arbitrage à égalité de pions
+
+def test_capture_resets_quiet() :
+    game = Game(5, [(0, 0, Pawn.BLACK), (1, 1, Pawn.WHITE), (4, 4, Pawn.WHITE), (4, 0, Pawn.BLACK)], quiet_limit=3)
+
+    assert game.play(4, 0, 4, 1) and game.play(4, 4, 4, 3)
+    assert game.quiet == 2
+    assert game.play(0, 0, 2, 2)
+    assert game.quiet == 0
+    assert game.is_finished() == Pawn.VOID
+
+def blocked_config() -> list[tuple[int, int, Pawn]] :
+    """
+    Retourne une configuration de 3x3 où le pion bleu est encerclé alors que les pions rouges peuvent se déplacer.
+    """
+
+    return [(0, 0, Pawn.BLACK), (1, 0, Pawn.WHITE), (0, 1, Pawn.WHITE), (1, 1, Pawn.WHITE), (2, 0, Pawn.WHITE), (0, 2, Pawn.WHITE), (2, 2, Pawn.WHITE)]
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_no_move(backend) :
+    game = Game(3, blocked_config(), backend, no_move_loses=True)
+
+    assert not game.has_legal_move()
+    assert game.is_finished() == Pawn.WHITE # Le joueur bloqué perd
+
+    game = Game(3, blocked_config(), backend, no_move_loses=False)
+
+    assert not game.has_legal_move()
+    assert game.is_finished() == Pawn.VOID # Le joueur bloqué passe son tour
+
+    game.pass_turn()
+
+    assert game.has_legal_move()
+    assert game.is_finished() == Pawn.VOID
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_both_blocked(backend) :
+    full = [(x, y, Pawn.BLACK if (x + y * 3) % 2 == 0 else Pawn.WHITE) for y in range(3) for x in range(3)] # Plateau plein : 5 bleus, 4 rouges
+
+    assert Game(3, full, backend).is_finished() == Pawn.BLACK # Aucun camp ne peut jouer : arbitrage au nombre de pions
+    assert Game(3, full, backend, no_move_loses=True).is_finished() == Pawn.WHITE
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_has_legal_move(backend) :
+    rng = Random(3)
+
+    for _ in range(200) :
+        size = rng.randint(3, 7)
+        empty = rng.choice((0.05, 0.2, 0.5))
+        config = [(x, y, rng.choice((Pawn.BLACK, Pawn.WHITE))) for y in range(size) for x in range(size) if rng.random() >= empty]
+        game = Game(size, config, backend)
+
+        if rng.random() < 0.5 :
+            game.pass_turn()
+
+        assert game.has_legal_move() == bool(list(game.generate_moves()))
+        assert game.has_legal_move() == (game.get_legal_moves() != {}) # Même réponse une fois les coups calculés
+
+def test_autoplay_rules() :
+    game = Game(5, [(0, 0, Pawn.BLACK), (4, 4, Pawn.WHITE)], **Game.AUTOPLAY_RULES)
+    copy = Game.from_bytes(game.to_bytes(), Board, Game.AUTOPLAY_RULES)
+
+    assert (copy.repetitions, copy.quiet_limit) == (game.repetitions, game.quiet_limit) == (3, 100)
+    assert (Game(5).repetitions, Game(5).quiet_limit) == (None, None)
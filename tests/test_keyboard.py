@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+from boundary.Keyboard import Keyboard
+
+pty = pytest.importorskip("pty") # Lecture du clavier propre à Linux
+termios = pytest.importorskip("termios")
+
+@pytest.fixture(autouse=True)
+def reset() :
+    Keyboard.events.clear()
+    Keyboard.buffer = ""
+    yield
+    Keyboard.events.clear()
+    Keyboard.buffer = ""
+
+def parse(text:str, final:bool=False) -> list[str] :
+    """
+    Découpe des caractères lus en touches.
+    """
+
+    Keyboard.buffer += text
+    Keyboard.since = 0.0
+    Keyboard._parse(final)
+    events = list(Keyboard.events)
+    Keyboard.events.clear()
+
+    return events
+
+def test_parse() :
+    assert parse("ab\r") == ["a", "b", Keyboard.NL]
+    assert parse("\x1b[A\x1b[1;5Cx") == [Keyboard.TOP, Keyboard.ctrl_RIGHT, "x"]
+    assert parse("\x1b[3~") == [Keyboard.DEL]
+    assert parse("\x1bq") == ["^[q"] # Alt + caractère
+
+def test_split_sequence() :
+    assert parse("a\x1b[") == ["a"] # Séquence incomplète : gardée pour la lecture suivante
+    assert Keyboard.buffer == "\x1b["
+    assert parse("B") == [Keyboard.DOWN]
+    assert Keyboard.buffer == ""
+
+def test_escape_alone() :
+    assert parse("\x1b") == []
+    assert parse("", final=True) == ["\x1b"] # Aucune suite : Échap frappée seule
+
+@pytest.fixture
+def terminal(monkeypatch) :
+    master, slave = pty.openpty()
+    stdin = os.fdopen(slave, "r")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    Keyboard.start()
+    yield master
+    Keyboard.stop()
+    stdin.close()
+    os.close(master)
+
+def test_poll(terminal) :
+    assert Keyboard.poll(0.0) is None # Aucune touche : ne bloque pas
+
+    os.write(terminal, "z\x1b[Dé".encode())
+
+    assert Keyboard.poll(1.0) == "z"
+    assert Keyboard.poll(0.0) == Keyboard.LEFT
+    assert Keyboard.poll(0.0) == "é"
+    assert Keyboard.poll(0.0) is None
+
+def test_session(terminal) :
+    attributes = termios.tcgetattr(sys.stdin.fileno())
+    Keyboard.start() # Session déjà ouverte : rien ne change
+
+    assert Keyboard.active
+    assert termios.tcgetattr(sys.stdin.fileno()) == attributes
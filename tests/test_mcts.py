@@ -0,0 +1,97 @@
+from controler.Game import Game
+from controler.autoplayer.MCTSIA import MCTSIA
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+from utils.MoveCode import MoveCode
+from utils.Pawn import Pawn
+
+def state(game:Game) -> tuple :
+    """
+    Retourne la position complète d'une partie.
+    """
+
+    return sorted(game.get_pawns(), key=str), game.get_current_player(), list(game.possible_moves), game.get_hash()
+
+def winning_game() -> Game :
+    """
+    Retourne une partie où les noirs gagnent en une chaîne de deux prises.
+    """
+
+    return Game(5, [(0, 0, Pawn.BLACK), (1, 1, Pawn.WHITE), (3, 3, Pawn.WHITE), (4, 0, Pawn.BLACK)], BitBoard)
+
+def test_legal_chain() :
+    for backend in (Board, BitBoard) :
+        game = Game(6, backend=backend)
+        before = state(game)
+        player = MCTSIA(game, time_limit=None, playout_limit=100, seed=0)
+        chain = player.search()
+
+        assert chain in set(game.generate_moves(chains=True))
+        assert state(game) == before # La recherche joue les coups sur la partie puis les annule
+        assert player.get_stats()["playouts"] == 100
+
+def test_winning_chain() :
+    game = winning_game()
+    player = MCTSIA(game, time_limit=None, playout_limit=300, seed=0)
+
+    assert player.search() == ((0, 0, 2, 2), (2, 2, 4, 4))
+
+def test_plays_whole_chain() :
+    game = winning_game()
+    player = MCTSIA(game, time_limit=None, playout_limit=300, seed=0)
+
+    assert player.choose() == MoveCode.encode(0, 0, 2, 2)
+    assert game.play_code(MoveCode.encode(0, 0, 2, 2))
+    assert player.choose() == MoveCode.encode(2, 2, 4, 4) # Suite de la chaîne choisie, sans nouvelle recherche
+    assert game.play_code(MoveCode.encode(2, 2, 4, 4))
+    assert game.is_finished() == Pawn.BLACK
+
+def test_playout_restores() :
+    game = Game(7, backend=BitBoard)
+    before = state(game)
+    player = MCTSIA(game, seed=1)
+
+    for _ in range(20) :
+        assert player.playout() in (Pawn.BLACK, Pawn.WHITE, Pawn.VOID)
+        assert state(game) == before
+
+def test_tree_reuse() :
+    game = Game(6, backend=BitBoard)
+    player = MCTSIA(game, time_limit=None, playout_limit=200, seed=0)
+
+    for move in player.search() :
+        assert game.play(*move)
+
+    player.search()
+
+    assert player.get_stats()["visits"] > 200 # L'arbre du tour précédent est repris
+
+def test_time_limit() :
+    game = Game(7, backend=BitBoard)
+    player = MCTSIA(game, time_limit=0.2, seed=0)
+    player.search()
+
+    assert player.get_stats()["time"] < 1
+    assert player.get_stats()["playouts"] > 0
+
+def test_no_move() :
+    game = Game(3, [(0, 0, Pawn.BLACK), (1, 0, Pawn.WHITE), (0, 1, Pawn.WHITE), (1, 1, Pawn.WHITE), (2, 0, Pawn.WHITE), (0, 2, Pawn.WHITE), (2, 2, Pawn.WHITE)], BitBoard)
+    player = MCTSIA(game, time_limit=None, playout_limit=10)
+
+    assert player.search() is None
+    assert player.choose() == MoveCode.PASS
+    assert player.input() == "pass"
+
+def test_zero_budget() :
+    for options in ({"time_limit": 0.0}, {"time_limit": None, "playout_limit": 0}) :
+        game = Game(6, backend=BitBoard)
+        player = MCTSIA(game, seed=0, **options)
+
+        assert player.search() in set(game.generate_moves(chains=True)) # Une itération au moins : la racine a un tour à retourner
+        assert player.get_stats()["playouts"] == 1
+
+def test_zero_budget_workers() :
+    game = Game(6, backend=BitBoard)
+    player = MCTSIA(game, time_limit=0.0, seed=0, workers=2) # Échéance déjà passée quand les processus reçoivent la recherche
+
+    assert player.search() in set(game.generate_moves(chains=True))
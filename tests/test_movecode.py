@@ -0,0 +1,60 @@
+from itertools import product
+
+from controler.Game import Game
+from entity.BitBoard import BitBoard
+from utils.Move import Move
+from utils.MoveCode import MoveCode
+from utils.Pawn import Pawn
+
+def moves(size:int) -> list[tuple[int, int, int, int]] :
+    """
+    Liste les déplacements simples et les prises géométriquement possibles sur un plateau.
+    """
+
+    return [
+        (x1, y1, x1 + dx, y1 + dy)
+        for x1, y1 in product(range(size), repeat=2)
+        for dx, dy in product(range(-2, 3), repeat=2)
+        if (dx, dy) != (0, 0) and 0 <= x1 + dx < size and 0 <= y1 + dy < size
+    ]
+
+def test_round_trip() :
+    for move in moves(9) :
+        code = MoveCode.encode(*move)
+        text = MoveCode.to_text(code)
+
+        assert code > 0 # Aucun coup réel ne se confond avec PASS ou QUIT
+        assert MoveCode.decode(code) == move
+        assert MoveCode.kind(code) == (Move.TAKE if 2 in (abs(move[2] - move[0]), abs(move[3] - move[1])) else Move.SIMPLE)
+        assert MoveCode.from_text(text) == code
+        assert MoveCode.from_text(text.upper()) == code
+
+def test_special_codes() :
+    assert (MoveCode.PASS, MoveCode.QUIT) == (0, -1)
+    assert MoveCode.to_text(MoveCode.PASS) == "pass"
+    assert MoveCode.to_text(MoveCode.QUIT) == "quit"
+    assert MoveCode.kind(MoveCode.PASS) == MoveCode.kind(MoveCode.QUIT) == Move.INVALID
+
+    for text in ("", "pass", " PASS ") :
+        assert MoveCode.from_text(text) == MoveCode.PASS
+
+    for text in ("exit", "quit", "q", "Q") :
+        assert MoveCode.from_text(text) == MoveCode.QUIT
+
+def test_invalid_text() :
+    for text in ("a1b", "a1b2c", "11b2", "a1bb", "hello") :
+        assert MoveCode.from_text(text) is None
+
+    assert MoveCode.from_text("a1e5", 5) is not None
+    assert MoveCode.from_text("a1f6", 5) is None # En dehors du plateau
+    assert MoveCode.from_text("a0b1") is None
+
+def test_play_code() :
+    game = Game(3, backend=BitBoard)
+
+    assert not game.play_code(MoveCode.QUIT)
+    assert not game.play_code(MoveCode.encode(2, 2, 1, 1)) # Pion adverse
+    assert game.play_code(MoveCode.PASS)
+    assert game.get_current_player() == Pawn.WHITE
+    assert game.play_code(MoveCode.encode(2, 2, 1, 1))
+    assert game.get_current_player() == Pawn.BLACK
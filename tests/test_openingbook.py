@@ -0,0 +1,61 @@
+import pytest
+
+from controler.Game import Game
+from controler.OpeningBook import OpeningBook
+from entity.BitBoard import BitBoard
+
+def openings(size:int, plies:int) -> list[Game] :
+    """
+    Retourne les positions atteintes en au plus `plies` tours depuis la position de départ.
+    """
+
+    frontier = [Game(size, backend=BitBoard, **Game.AUTOPLAY_RULES)]
+    games = list(frontier)
+
+    for _ in range(plies) :
+        following = []
+
+        for game in frontier :
+            for chain in game.generate_moves(chains=True) :
+                child = Game.from_bytes(game.to_bytes(), BitBoard, Game.AUTOPLAY_RULES)
+                for move in chain :
+                    assert child.play(*move)
+                following.append(child)
+
+        games += following
+        frontier = following
+
+    return games
+
+@pytest.fixture(scope="module")
+def book(tmp_path_factory) :
+    path = str(tmp_path_factory.mktemp("book") / "book.bin")
+    entries = OpeningBook.build(path, sizes=[3, 4], plies=1, time_limit=0.02, tt_mb=1)
+
+    assert entries == len({game.get_hash() for size in (3, 4) for game in openings(size, 1)})
+
+    return OpeningBook(path)
+
+def test_lookup(book) :
+    for size in (3, 4) :
+        for game in openings(size, 1) :
+            before = (game.to_bytes(), game.get_hash())
+            chain = book.lookup(game)
+
+            assert chain in list(game.generate_moves(chains=True))
+            assert (game.to_bytes(), game.get_hash()) == before # La partie est restaurée après la vérification
+
+def test_missing(book) :
+    assert book.lookup(Game(5, backend=BitBoard)) is None # Autre taille
+
+    for game in openings(4, 3)[-5:] : # Trop loin de la position de départ
+        assert book.lookup(game) is None
+
+def test_foreign_file(tmp_path) :
+    path = str(tmp_path / "book.bin")
+
+    with open(path, "wb") as f :
+        f.write(b"pas un livre d'ouvertures")
+
+    with pytest.raises(ValueError) :
+        OpeningBook(path).lookup(Game(3))
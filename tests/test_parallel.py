@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from random import Random
+
+import pytest
+
+from controler.Game import Game
+from controler.Parallel import Parallel
+from controler.autoplayer.AlphaBetaIA import AlphaBetaIA
+from controler.autoplayer.HeuristIA import HeuristIA
+from controler.autoplayer.MCTSIA import MCTSIA
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+
+def state(game:Game) -> tuple :
+    """
+    Retourne la position complète d'une partie.
+    """
+
+    return sorted(game.get_pawns(), key=str), game.get_current_player(), list(game.possible_moves), game.get_hash()
+
+def random_game(size:int, plies:int, seed:int, backend:type[Board | BitBoard]) -> Game :
+    """
+    Retourne une partie après quelques coups joués au hasard.
+    """
+
+    rng = Random(seed)
+    game = Game(size, backend=backend)
+
+    for _ in range(plies) :
+        moves = sorted(game.generate_moves())
+        if moves == [] or game.is_finished() != Pawn.VOID :
+            break
+        game.make(*rng.choice(moves))
+
+    return game
+
+def test_split() :
+    assert Parallel.split(list(range(7)), 3) == [[0, 3, 6], [1, 4], [2, 5]]
+    assert Parallel.split([1], 4) == [[1]] # Pas de part vide
+
+def test_bytes_round_trip() :
+    for backend in (Board, BitBoard) :
+        for seed in range(5) :
+            game = random_game(7, 15, seed, backend)
+            copy = Game.from_bytes(game.to_bytes(), backend)
+
+            assert state(copy) == state(game)
+
+def test_alphabeta_workers() :
+    game = Game(5, [(0, 0, Pawn.BLACK), (1, 1, Pawn.WHITE), (3, 3, Pawn.WHITE), (4, 0, Pawn.BLACK)], BitBoard)
+    player = AlphaBetaIA(game, time_limit=None, max_depth=4, workers=2)
+
+    assert player.search() == ((0, 0, 2, 2), (2, 2, 4, 4))
+
+def test_mcts_workers() :
+    game = Game(6, backend=BitBoard)
+    before = state(game)
+    player = MCTSIA(game, time_limit=None, playout_limit=100, seed=0, workers=2)
+
+    assert player.search() in set(game.generate_moves(chains=True))
+    assert state(game) == before
+
+def test_heurist_workers() :
+    for seed in range(3) :
+        game = random_game(6, 6, seed, BitBoard)
+        player = HeuristIA(game, validation=False, workers=2)
+
+        assert player._get_best_parallel(game.get_current_player()) == HeuristIA._get_best(game, game.get_current_player())
+
+def test_remaining() :
+    assert Parallel.remaining(None) is None
+    assert Parallel.remaining(time.time() - 1) == 0.0 # Échéance passée pendant l'attente
+    assert 0.5 < Parallel.remaining(time.time() + 1) <= 1
+
+def test_time_budget() :
+    game = Game(9, backend=BitBoard)
+    player = AlphaBetaIA(game, time_limit=0.3, workers=2)
+    player.search() # Lance les processus de travail
+
+    start = time.perf_counter()
+    chain = player.search()
+
+    assert time.perf_counter() - start < 1.5 # Les processus ne cherchent que le temps restant
+    assert chain in set(game.generate_moves(chains=True))
+
+def test_cancel_workers() :
+    game = Game(9, backend=BitBoard)
+    before = state(game)
+    player = AlphaBetaIA(game, time_limit=None, workers=2)
+
+    async def cancel() :
+        task = asyncio.create_task(player.think(game))
+        await asyncio.sleep(0.3)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError) :
+            await task
+
+    start = time.perf_counter()
+    asyncio.run(cancel())
+
+    assert time.perf_counter() - start < 3 # L'annulation arrête aussi les processus de travail
+    assert state(game) == before
+
+def test_heurist_stop(monkeypatch) :
+    game = random_game(6, 6, 0, BitBoard)
+    possibles = HeuristIA._get_possibles(game, game.get_current_player())
+    stop = threading.Event()
+    monkeypatch.setattr(Parallel, "STOP", stop) # Comme dans un processus de travail (voir `Parallel._init`)
+
+    assert len(Parallel.heurist(game.to_bytes(), BitBoard, possibles, None)) == len(possibles)
+
+    stop.set()
+
+    assert Parallel.heurist(game.to_bytes(), BitBoard, possibles, None) == [] # Arrêt demandé : aucun coup n'est évalué
+
+def test_heurist_cancelled() :
+    game = random_game(6, 6, 1, BitBoard)
+    player = HeuristIA(game, validation=False, workers=2)
+    player.cancelled.set() # Réflexion annulée : les processus de travail sont arrêtés, un coup est tout de même retourné
+
+    assert player._get_best_parallel(game.get_current_player()) in HeuristIA._get_possibles(game, game.get_current_player())
+
+    player.cancelled.clear()
+
+    assert player._get_best_parallel(game.get_current_player()) == HeuristIA._get_best(game, game.get_current_player()) # L'arrêt ne touche pas la recherche suivante
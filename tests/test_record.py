@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from controler.Game import Game
+from controler.Record import Record, RecordReader, RecordWriter
+from utils.Pawn import Pawn
+
+GAMES = [
+    (Game(3).to_bytes(), [], "", "", Pawn.VOID),
+    (Game(5).to_bytes(), [(0, 1, 1, 2), None, (4, 3, 3, 2)], "AlphaBetaIA", "RandomIA", Pawn.BLACK),
+    (Game(9).to_bytes(), [(8, 8, 7, 7), (0, 0, 1, 1)] * 40, "Élève", "", Pawn.DRAW),
+]
+
+def test_encode_decode() :
+    for start, moves, black, white, winner in GAMES :
+        data = Record.encode(start, moves, black, white, winner)
+        record = Record.decode(data[4:])
+
+        assert int.from_bytes(data[:4], "little") == len(data) - 4
+        assert record["start"] == start
+        assert record["size"] == start[0]
+        assert sorted(record["config"]) == sorted(Game.from_bytes(start).get_pawns())
+        assert (record["moves"], record["black"], record["white"], record["winner"]) == (moves, black, white, winner)
+
+def test_write_read(tmp_path) :
+    path = str(tmp_path / "games.bin")
+
+    with RecordWriter(path) as writer :
+        for game in GAMES[:2] :
+            writer.write(*game)
+
+    with RecordWriter(path) as writer : # Ajout à un fichier existant
+        writer.write(*GAMES[2])
+
+    records = list(RecordReader(path))
+
+    assert len(RecordReader(path)) == 3
+    assert [(r["start"], r["moves"], r["black"], r["white"], r["winner"]) for r in records] == GAMES
+
+def test_truncated(tmp_path) :
+    path = str(tmp_path / "games.bin")
+
+    with RecordWriter(path) as writer :
+        for game in GAMES :
+            writer.write(*game)
+
+    size = os.path.getsize(path)
+    os.truncate(path, size - 5) # Écriture interrompue au milieu de la dernière partie
+
+    assert len(RecordReader(path)) == 2
+    assert len(list(RecordReader(path))) == 2
+
+    with RecordWriter(path) as writer : # La partie incomplète est retirée avant l'ajout
+        writer.write(*GAMES[0])
+
+    assert [r["moves"] for r in RecordReader(path)] == [GAMES[0][1], GAMES[1][1], GAMES[0][1]]
+
+def test_foreign_file(tmp_path) :
+    path = str(tmp_path / "notes.txt")
+    content = b"Ce fichier n'est pas un fichier de parties.\n"
+
+    with open(path, "wb") as f :
+        f.write(content)
+
+    with pytest.raises(ValueError) :
+        RecordWriter(path)
+
+    with pytest.raises(ValueError) :
+        list(RecordReader(path))
+
+    with open(path, "rb") as f : # Le fichier n'est pas modifié
+        assert f.read() == content
@@ -0,0 +1,60 @@
+import random
+import time
+
+from boundary.Renderer import NullRenderer, Renderer
+from boundary.View import View
+from controler.Game import Game
+from controler.autoplayer.HeuristIA import HeuristIA
+from controler.autoplayer.RandomIA import RandomIA
+from utils.Pawn import Pawn
+
+def test_latest_only() :
+    drawn = []
+    renderer = Renderer(drawn.append, fps=1000)
+    first, second = [(0, 0, Pawn.BLACK)], [(1, 1, Pawn.BLACK)]
+
+    renderer.publish(first)
+    renderer.publish(second) # Remplace la position qui n'a pas été dessinée
+    renderer.stop()
+
+    assert drawn == [second]
+
+    renderer.stop()
+
+    assert drawn == [second] # Position déjà dessinée
+
+def test_thread() :
+    drawn = []
+    renderer = Renderer(drawn.append, fps=50)
+    renderer.start()
+
+    for i in range(200) :
+        renderer.publish([(i % 5, 0, Pawn.BLACK)])
+
+    time.sleep(0.1)
+    last = [(0, 0, Pawn.WHITE)]
+    renderer.publish(last)
+    renderer.stop()
+
+    assert renderer.thread is None
+    assert 1 <= len(drawn) < 200 # Les positions intermédiaires sont sautées
+    assert drawn[-1] is last # La dernière position est toujours dessinée
+
+def test_null_renderer() :
+    renderer = NullRenderer()
+    renderer.start()
+    renderer.publish([(0, 0, Pawn.BLACK)])
+    renderer.stop()
+
+    assert renderer.thread is None
+
+def test_spectate(capsys) :
+    random.seed(0)
+    game = Game(5)
+    black, white = HeuristIA(game), RandomIA(game)
+    winner = View(game, black, white).spectate(fps=None, max_moves=300)
+
+    assert winner in (Pawn.BLACK, Pawn.WHITE, Pawn.DRAW, Pawn.VOID)
+    assert winner == Pawn.VOID or winner == game.is_finished()
+    assert capsys.readouterr().out == "" # Aucun affichage
+    assert black.validation # La validation au clavier est rétablie après la partie
@@ -0,0 +1,83 @@
+from random import Random
+
+import pytest
+
+from controler.Game import Game
+from controler.Replay import Replay
+from controler.Runner import Runner
+from controler.autoplayer.RandomIA import RandomIA
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+
+def record(seed:int) -> dict :
+    """
+    Joue une partie aléatoire et la retourne comme la lirait `RecordReader`.
+    """
+
+    result = Runner.play(7, BitBoard, (RandomIA, {}), (RandomIA, {}), 150, seed)
+
+    return {"start": result["start"], "moves": result["shots"]}
+
+def positions(data:dict) -> list[tuple[bytes, int]] :
+    """
+    Rejoue une partie depuis le début et retourne la position (voir `Game.to_bytes`) et la clé de Zobrist après chaque nombre de coups.
+    """
+
+    game = Game.from_bytes(data["start"])
+    result = [(game.to_bytes(), game.get_hash())]
+
+    for move in data["moves"] :
+        if move is None :
+            game.pass_turn()
+        else :
+            assert game.play(*move)
+
+        result.append((game.to_bytes(), game.get_hash()))
+
+    return result
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+@pytest.mark.parametrize("interval", [1, 5, 32])
+def test_seek(backend, interval) :
+    rng = Random(interval)
+
+    for seed in range(3) :
+        data = record(seed)
+        expected = positions(data)
+        replay = Replay(data, interval, backend)
+
+        assert len(replay) == len(data["moves"])
+        assert replay.get_ply() == len(replay)
+
+        for ply in [0, len(replay), len(replay) + 10, -3] + [rng.randint(0, len(replay)) for _ in range(30)] :
+            game = replay.seek(ply)
+            ply = max(0, min(ply, len(replay)))
+
+            assert replay.get_ply() == ply
+            assert (game.to_bytes(), game.get_hash()) == expected[ply]
+
+@pytest.mark.parametrize("interval", [1, 4])
+def test_forward_backward(interval) :
+    data = record(11)
+    expected = positions(data)
+    replay = Replay(data, interval)
+    replay.seek(0)
+
+    for ply in range(1, len(replay) + 1) :
+        assert replay.forward()
+        assert replay.get_game().to_bytes() == expected[ply][0]
+
+    assert not replay.forward()
+
+    for ply in range(len(replay) - 1, -1, -1) :
+        assert replay.backward()
+        assert replay.get_game().to_bytes() == expected[ply][0]
+
+    assert not replay.backward()
+
+def test_invalid() :
+    data = record(5)
+    data["moves"] = data["moves"][:3] + [(0, 0, 0, 0)]
+
+    with pytest.raises(ValueError) :
+        Replay(data)
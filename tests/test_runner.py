@@ -0,0 +1,40 @@
+from controler.Game import Game
+from controler.Record import RecordReader
+from controler.Runner import Runner
+from controler.autoplayer.HeuristIA import HeuristIA
+from controler.autoplayer.RandomIA import RandomIA
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+
+def test_play() :
+    result = Runner.play(5, BitBoard, (HeuristIA, {}), (RandomIA, {}), 200, 1, Game.AUTOPLAY_RULES) # HeuristIA valide par défaut : la partie ne doit pas attendre de saisie
+
+    assert result["reason"] in ("finished", "blocked", "limit")
+    assert result["moves"] == len(result["shots"])
+    assert (result["black"], result["white"]) == ("HeuristIA", "RandomIA")
+
+    game = Game.from_bytes(result["start"], BitBoard, Game.AUTOPLAY_RULES) # Les coups enregistrés redonnent la même partie
+    for shot in result["shots"] :
+        if shot is None :
+            game.pass_turn()
+        else :
+            assert game.play(*shot)
+
+    if result["reason"] == "finished" :
+        assert game.is_finished() == result["winner"]
+    else :
+        assert game.is_finished() == Pawn.VOID
+
+def test_run(tmp_path) :
+    path = str(tmp_path / "games.bin")
+    runner = Runner((RandomIA, {}), (RandomIA, {}), size=5, max_moves=100)
+
+    results = runner.run(4, seed=7, path=path)
+    again = runner.run(4, seed=7)
+
+    assert [result["shots"] for result in results] == [result["shots"] for result in again] # Même graine, mêmes parties
+    assert [record["moves"] for record in RecordReader(path)] == [result["shots"] for result in results]
+
+    summary = Runner.summary(results)
+    assert summary["games"] == 4
+    assert summary["black"] + summary["white"] + summary["draws"] == 4
@@ -0,0 +1,125 @@
+from random import Random
+
+import pytest
+
+from controler.Game import Game
+from controler.Tablebase import Tablebase
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+
+def search(game:Game, depth:int, memo:dict[tuple[int, int], int]) -> int :
+    """
+    Recherche exhaustive, tour par tour : 1 si le joueur courant gagne en au plus `depth` tours, -1 s'il perd en au plus `depth` tours, 0 sinon.
+    """
+
+    winner = game.is_finished()
+    player = game.get_current_player()
+
+    if winner != Pawn.VOID :
+        return 0 if winner == Pawn.DRAW else 1 if winner == player else -1
+
+    if depth == 0 :
+        return 0
+
+    key = (game.get_hash(), depth)
+
+    if key not in memo :
+        scores = []
+        chains = list(game.generate_moves(chains=True))
+
+        if chains == [] : # Joueur bloqué : il passe son tour
+            possible_moves = game.pass_turn()
+            scores.append(-search(game, depth - 1, memo))
+            game.unpass_turn(possible_moves)
+
+        for chain in chains :
+            undos = [game.make(*move) for move in chain]
+            winner = game.is_finished()
+
+            if winner != Pawn.VOID :
+                scores.append(0 if winner == Pawn.DRAW else 1 if winner == player else -1)
+            else :
+                scores.append(-search(game, depth - 1, memo))
+
+            for undo in reversed(undos) :
+                game.unmake(undo)
+
+        memo[key] = 1 if 1 in scores else -1 if all(score == -1 for score in scores) else 0
+
+    return memo[key]
+
+def positions(size:int, pieces:int, no_move_loses:bool, count:int, seed:int) -> list[Game] :
+    """
+    Tire des positions au hasard, avec au plus `pieces` pions dont au moins un de chaque couleur.
+    """
+
+    rng = Random(seed)
+    cells = [(x, y) for y in range(size) for x in range(size)]
+    games = []
+
+    for _ in range(count) :
+        black = rng.randint(1, pieces - 1)
+        white = rng.randint(1, pieces - black)
+        squares = rng.sample(cells, black + white)
+        config = [(x, y, Pawn.BLACK) for x, y in squares[:black]] + [(x, y, Pawn.WHITE) for x, y in squares[black:]]
+        game = Game(size, config, BitBoard, no_move_loses=no_move_loses)
+
+        if rng.random() < 0.5 :
+            game.pass_turn()
+
+        games.append(game)
+
+    return games
+
+@pytest.mark.parametrize("size, pieces, no_move_loses, horizon", [(3, 4, False, 8), (3, 4, True, 8), (4, 3, False, 6)])
+def test_brute_force(tmp_path, size, pieces, no_move_loses, horizon) :
+    path = str(tmp_path / "tablebase.bin")
+    Tablebase.generate(path, size, pieces, no_move_loses)
+    table = Tablebase(path)
+    memo = {}
+
+    for game in positions(size, pieces, no_move_loses, 40, size) :
+        entry = table.probe(game)
+
+        if game.is_finished() != Pawn.VOID :
+            assert entry is None
+            continue
+
+        winner, d = entry
+
+        if winner == Pawn.DRAW :
+            assert search(game, horizon, memo) == 0
+        else :
+            score = 1 if winner == game.get_current_player() else -1
+
+            assert search(game, d, memo) == score # Le résultat est atteint en `d` tours...
+            assert d == 0 or search(game, d - 1, memo) != score # ... et pas avant
+
+def test_best(tmp_path) :
+    path = str(tmp_path / "tablebase.bin")
+    Tablebase.generate(path, 3, 4)
+    table = Tablebase(path)
+
+    for game in positions(3, 4, False, 40, 1) :
+        entry = table.probe(game)
+
+        if entry is None or entry[0] != game.get_current_player() :
+            continue
+
+        chain = table.best(game)
+
+        for move in chain :
+            assert game.play(*move)
+
+        after = table.probe(game)
+
+        assert (after is None and game.is_finished() == entry[0]) or after == (entry[0], entry[1] - 1) # La victoire se rapproche d'un tour
+
+def test_foreign_position(tmp_path) :
+    path = str(tmp_path / "tablebase.bin")
+    Tablebase.generate(path, 3, 3)
+    table = Tablebase(path)
+
+    assert table.probe(Game(4, [(0, 0, Pawn.BLACK), (3, 3, Pawn.WHITE)], BitBoard)) is None # Autre taille
+    assert table.probe(Game(3, [(0, 0, Pawn.BLACK), (1, 0, Pawn.BLACK), (2, 2, Pawn.WHITE), (2, 1, Pawn.WHITE)], BitBoard)) is None # Trop de pions
+    assert table.probe(Game(3, [(0, 0, Pawn.BLACK), (2, 2, Pawn.WHITE)], BitBoard, no_move_loses=True)) is None # Autre règle
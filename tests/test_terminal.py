@@ -0,0 +1,76 @@
+import os
+import signal
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import utils.terminal as terminal
+
+def test_buffer(capsys) :
+    terminal.write("a")
+    terminal.write("b")
+
+    assert capsys.readouterr().out == "" # Rien n'est affiché avant flush
+
+    terminal.flush()
+
+    assert capsys.readouterr().out == "ab"
+
+    terminal.flush()
+
+    assert capsys.readouterr().out == "" # Le tampon est vidé
+
+def test_clear(capsys) :
+    terminal.clear()
+    terminal.write("x")
+    terminal.flush()
+
+    assert capsys.readouterr().out == "\033[2J\033[3J\033[H" + "x" # Effacement et texte en une seule écriture
+
+def test_size(monkeypatch) :
+    sizes = [os.terminal_size((100, 40)), os.terminal_size((120, 50))]
+    calls = []
+    monkeypatch.setattr(terminal.shutil, "get_terminal_size", lambda : calls.append(1) or sizes[len(calls) - 1])
+    monkeypatch.setattr(terminal, "_size", None)
+    monkeypatch.setattr(terminal, "_watched", True)
+
+    assert terminal.size() == (100, 40)
+    assert (terminal.width(), terminal.height()) == (100, 40)
+    assert len(calls) == 1 # Taille lue une seule fois
+
+    terminal._resized(0, None) # Redimensionnement
+
+    assert terminal.size() == (120, 50)
+    assert len(calls) == 2
+
+def test_wrap() :
+    assert terminal.wrap(["abcdefg", "", "ab"], 3) == ["abc", "def", "g", "", "ab"]
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="Aucun signal de redimensionnement")
+def test_import_keeps_handlers() :
+    code = "import signal; before = signal.getsignal(signal.SIGWINCH); import utils.terminal; assert signal.getsignal(signal.SIGWINCH) == before"
+
+    subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True)
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="Aucun signal de redimensionnement")
+def test_watch_main_thread(monkeypatch) :
+    previous = signal.getsignal(signal.SIGWINCH)
+    monkeypatch.setattr(terminal, "_watched", False)
+    monkeypatch.setattr(terminal, "_size", None)
+
+    try :
+        thread = threading.Thread(target=terminal.size)
+        thread.start()
+        thread.join()
+
+        assert not terminal._watched # Hors du fil principal : pas de gestionnaire
+        assert signal.getsignal(signal.SIGWINCH) == previous
+
+        terminal.size()
+
+        assert terminal._watched
+        assert signal.getsignal(signal.SIGWINCH) == terminal._resized
+    finally :
+        signal.signal(signal.SIGWINCH, previous)
@@ -0,0 +1,93 @@
+import asyncio
+from time import perf_counter
+
+import pytest
+
+from controler.Game import Game
+from controler.autoplayer.AlphaBetaIA import AlphaBetaIA
+from controler.autoplayer.HeuristIA import HeuristIA
+from controler.autoplayer.MCTSIA import MCTSIA
+from entity.BitBoard import BitBoard
+from utils.MoveCode import MoveCode
+
+def state(game:Game) -> tuple :
+    """
+    Retourne la position complète d'une partie.
+    """
+
+    return sorted(game.get_pawns(), key=str), game.get_current_player(), list(game.possible_moves), game.get_hash()
+
+@pytest.mark.parametrize("player", [
+    lambda game : AlphaBetaIA(game, time_limit=None),
+    lambda game : MCTSIA(game, time_limit=None, seed=0),
+])
+def test_deadline(player) :
+    game = Game(9, backend=BitBoard)
+    before = state(game)
+    player = player(game)
+
+    start = perf_counter()
+    code = asyncio.run(player.think(game, perf_counter() + 0.2)) # Sans limite propre, la recherche ne s'arrête qu'à l'échéance
+
+    assert perf_counter() - start < 2
+    assert MoveCode.decode(code) in set(game.generate_moves())
+    assert state(game) == before
+
+def test_cancel() :
+    game = Game(9, backend=BitBoard)
+    before = state(game)
+    player = AlphaBetaIA(game, time_limit=None)
+
+    async def cancel() :
+        task = asyncio.create_task(player.think(game))
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError) :
+            await task
+
+    start = perf_counter()
+    asyncio.run(cancel())
+
+    assert perf_counter() - start < 2 # La recherche s'arrête à l'annulation
+    assert state(game) == before # La partie est restaurée avant de rendre la main
+    assert player.game is game
+
+def test_loop_free() :
+    game = Game(7, backend=BitBoard)
+    player = AlphaBetaIA(game, time_limit=0.3)
+    ticks = []
+
+    async def run() :
+        async def tick() :
+            while True :
+                ticks.append(perf_counter())
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        code = await player.think(game)
+        ticker.cancel()
+
+        return code
+
+    assert asyncio.run(run()) in {MoveCode.encode(*move) for move in game.generate_moves()}
+    assert len(ticks) > 5 # La boucle d'événements tourne pendant la recherche
+
+def test_heuristic_validation() :
+    game = Game(5, backend=BitBoard)
+    player = HeuristIA(game) # Validation au clavier : elle ne doit pas être attendue dans le fil de la recherche
+
+    assert asyncio.run(player.think(game)) == HeuristIA(game, validation=False).choose()
+    assert player.validation # Rétablie après la réflexion
+
+def test_cancel_cleared() :
+    game = Game(9, backend=BitBoard)
+    player = AlphaBetaIA(game, time_limit=None, node_limit=2000)
+
+    asyncio.run(player.think(game, perf_counter())) # Échéance déjà atteinte : arrêt aussitôt demandé
+
+    assert not player.cancelled.is_set()
+
+    player.search() # Une recherche suivante n'est pas arrêtée par l'ancienne demande
+
+    assert player.nodes >= 2000
@@ -0,0 +1,65 @@
+import pytest
+
+from controler.Tournament import Tournament
+from controler.autoplayer.HeuristIA import HeuristIA
+from controler.autoplayer.RandomIA import RandomIA
+
+PLAYERS = {"heuristic": (HeuristIA, {}), "random": (RandomIA, {})}
+
+def test_schedule() :
+    tournament = Tournament(PLAYERS, sizes=[3, 5], rounds=2)
+    keys = [key for key, *_ in tournament.schedule()]
+
+    assert len(keys) == 2 * 2 * 2 == len(set(keys))
+    assert "5:random:heuristic:1" in keys
+
+def test_resume(tmp_path) :
+    checkpoint = str(tmp_path / "tournament.json")
+    full = Tournament(PLAYERS, sizes=[3, 4, 5], max_moves=100, seed=3)
+    full.run()
+
+    def interrupt(played, total) :
+        if played == 2 :
+            raise KeyboardInterrupt
+
+    tournament = Tournament(PLAYERS, sizes=[3, 4, 5], max_moves=100, seed=3, checkpoint=checkpoint)
+
+    with pytest.raises(KeyboardInterrupt) :
+        tournament.run(interrupt)
+
+    resumed = Tournament(PLAYERS, sizes=[3, 4, 5], max_moves=100, seed=3, checkpoint=checkpoint) # Les résultats sauvegardés sont relus
+
+    assert len(resumed.results) == 2
+
+    resumed.run()
+
+    assert resumed.results == full.results
+
+    with pytest.raises(ValueError) : # Une autre graine donnerait d'autres parties
+        Tournament(PLAYERS, sizes=[3, 4, 5], seed=4, checkpoint=checkpoint)
+
+def test_names() :
+    with pytest.raises(ValueError) :
+        Tournament.register("alpha:beta", RandomIA)
+
+    with pytest.raises(ValueError) :
+        Tournament({"a:b": (RandomIA, {}), "c": (RandomIA, {})})
+
+    assert "alpha:beta" not in Tournament.REGISTRY
+
+def test_ratings() :
+    tournament = Tournament({"a": (RandomIA, {}), "b": (RandomIA, {}), "c": (RandomIA, {})}, sizes=[5])
+    tournament.results = {
+        "5:a:b:0": (1.0, 10), "5:b:a:0": (0.0, 10),
+        "5:a:c:0": (1.0, 10), "5:c:a:0": (0.0, 10),
+        "5:b:c:0": (0.5, 10), "5:c:b:0": (0.5, 10),
+    }
+
+    ratings = tournament.ratings()
+
+    assert sum(elo for elo, _ in ratings.values()) == pytest.approx(0, abs=1e-6)
+    assert ratings["a"][0] > ratings["b"][0]
+    assert ratings["b"][0] == pytest.approx(ratings["c"][0])
+    assert all(0 < interval < float("inf") for _, interval in ratings.values())
+    assert [row[0] for row in tournament.table()][0] == "a"
+    assert all(elo == pytest.approx(0) for elo, _ in tournament.ratings(sizes=[3]).values()) # Aucune partie sur cette taille
@@ -0,0 +1,99 @@
+from random import Random
+
+from controler.Game import Game
+from controler.TranspositionTable import TranspositionTable
+from controler.autoplayer.AlphaBetaIA import AlphaBetaIA
+from controler.autoplayer.HeuristIA import HeuristIA
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+
+def test_store_probe() :
+    table = TranspositionTable(1)
+    move = ((0, 0, 2, 2), (2, 2, 4, 0))
+
+    assert table.probe(12345) is None
+
+    table.store(12345, 4, -17, TranspositionTable.LOWER, move)
+
+    assert table.probe(12345) == (4, -17, TranspositionTable.LOWER, move)
+    assert table.get_stats() == {"hits": 1, "misses": 1, "collisions": 0, "stores": 1}
+
+def test_replacement() :
+    table = TranspositionTable(0) # Une seule paire de cases : toutes les positions se partagent les mêmes cases
+
+    table.store(1, 6, 10, TranspositionTable.EXACT)
+    table.store(2, 3, 20, TranspositionTable.EXACT) # Moins profonde : va dans la seconde case
+
+    assert table.probe(1) == (6, 10, TranspositionTable.EXACT, None)
+    assert table.probe(2) == (3, 20, TranspositionTable.EXACT, None)
+
+    table.store(3, 2, 30, TranspositionTable.UPPER) # La seconde case est toujours remplacée
+
+    assert table.probe(1) is not None
+    assert table.probe(2) is None
+    assert table.probe(3) == (2, 30, TranspositionTable.UPPER, None)
+
+    table.store(1, 1, 11, TranspositionTable.LOWER) # Même position : la première case est remplacée même si moins profonde
+
+    assert table.probe(1) == (1, 11, TranspositionTable.LOWER, None)
+
+    table.store(4, 1, 40, TranspositionTable.EXACT) # Aussi profonde : remplace la première case
+
+    assert table.probe(1) is None
+    assert table.probe(4) == (1, 40, TranspositionTable.EXACT, None)
+    assert table.get_stats()["collisions"] > 0
+
+def test_pack() :
+    moves = [
+        ((0, 0, 1, 1),),
+        ((8, 8, 6, 6), (6, 6, 4, 8), (4, 8, 2, 6)),
+        tuple((x, 0, x + 2, 0) for x in range(0, 2 * (TranspositionTable.MAX_SQUARES - 1), 2)),
+    ]
+
+    for move in moves :
+        assert TranspositionTable._unpack(TranspositionTable._pack(move)) == move
+
+    assert TranspositionTable._pack(None) == 0
+    assert TranspositionTable._unpack(0) is None
+    assert TranspositionTable._pack(moves[2] + ((12, 0, 14, 0),)) == 0 # Trop long pour être codé
+
+def test_clear() :
+    table = TranspositionTable(1)
+    table.store(7, 2, 5, TranspositionTable.EXACT)
+    table.probe(7)
+    table.clear()
+
+    assert table.probe(7) is None
+    assert table.get_stats() == {"hits": 0, "misses": 1, "collisions": 0, "stores": 0}
+
+def test_alphabeta_table() :
+    game = Game(5, [(0, 0, Pawn.BLACK), (1, 1, Pawn.WHITE), (3, 3, Pawn.WHITE), (4, 0, Pawn.BLACK)], BitBoard)
+    table = TranspositionTable(1)
+
+    assert AlphaBetaIA(game, time_limit=None, max_depth=4, tt=table).search() == ((0, 0, 2, 2), (2, 2, 4, 4))
+
+    game = Game(6, backend=BitBoard)
+    first = AlphaBetaIA(game, time_limit=None, max_depth=3, tt=table)
+    chain = first.search()
+    second = AlphaBetaIA(game, time_limit=None, max_depth=3, tt=table)
+
+    assert second.search() in list(game.generate_moves(chains=True))
+    assert chain in list(game.generate_moves(chains=True))
+    assert table.get_stats()["stores"] > 0
+    assert second.get_stats()["nodes"] < first.get_stats()["nodes"] # Les positions déjà cherchées ne le sont pas à nouveau
+
+def test_heuristic_table() :
+    rng = Random(0)
+    game = Game(7, backend=BitBoard)
+    table = TranspositionTable(1)
+
+    for _ in range(20) :
+        player = game.get_current_player()
+        best = HeuristIA._get_best(game, player)
+
+        assert HeuristIA._get_best(game, player, table) == best # Mêmes évaluations, mémorisées ou non
+
+        moves = list(game.generate_moves())
+        if moves == [] or game.is_finished() != Pawn.VOID :
+            break
+        game.play(*rng.choice(moves))
@@ -0,0 +1,71 @@
+import re
+
+import utils.terminal
+from boundary.View import View
+from controler.Game import Game
+from controler.autoplayer.RandomIA import RandomIA
+from utils.Pawn import Pawn
+
+CELL = re.compile(r"\033\[(\d+);(\d+)H") # Déplacement du curseur vers une case (voir `View._cell`)
+
+def cells(output:str) -> list[tuple[int, int]] :
+    """
+    Retourne les cases réécrites par un affichage.
+    """
+
+    return [((int(column) - 5) // 4, (int(row) - 2) // 2) for row, column in CELL.findall(output)]
+
+def view(game:Game) -> View :
+    """
+    Retourne une vue de la partie entre deux joueurs aléatoires.
+    """
+
+    return View(game, RandomIA(game), RandomIA(game))
+
+def test_render_changes(capsys) :
+    game = Game(5)
+    screen = view(game)
+
+    screen._render()
+
+    assert sorted(cells(capsys.readouterr().out)) == sorted((x, y) for x, y, _ in game.get_pawns()) # Premier affichage : tous les pions
+
+    screen._render()
+
+    assert capsys.readouterr().out == "" # Rien n'a changé
+
+    x1, y1, x2, y2 = next(game.generate_moves())
+    assert game.play(x1, y1, x2, y2)
+    screen._render()
+
+    assert sorted(cells(capsys.readouterr().out)) == sorted([(x1, y1), (x2, y2)]) # Seules la case quittée et la case atteinte
+
+def test_render_take(capsys) :
+    game = Game(5, [(0, 0, Pawn.BLACK), (1, 1, Pawn.WHITE), (4, 4, Pawn.WHITE)])
+    screen = view(game)
+    screen._render()
+    capsys.readouterr()
+
+    assert game.play(0, 0, 2, 2)
+    screen._render()
+
+    assert sorted(cells(capsys.readouterr().out)) == [(0, 0), (1, 1), (2, 2)] # Le pion pris est effacé
+
+def test_board_resets_frame(capsys) :
+    game = Game(5)
+    screen = view(game)
+    screen._render()
+    screen._board() # Plateau vide : tous les pions doivent être réaffichés
+    capsys.readouterr()
+    screen._render()
+
+    assert len(cells(capsys.readouterr().out)) == len(game.get_pawns())
+
+def test_single_write(monkeypatch) :
+    writes = []
+    game = Game(7)
+    monkeypatch.setattr(utils.terminal.sys.stdout, "write", writes.append)
+    monkeypatch.setattr(utils.terminal.sys.stdout, "flush", lambda : None)
+    view(game)._render()
+
+    assert len(writes) == 1 # Une seule écriture par affichage
@@ -0,0 +1,114 @@
+from random import Random
+
+import pytest
+
+from controler.Game import Game
+from entity.Board import Board
+from entity.BitBoard import BitBoard
+from utils.Pawn import Pawn
+from utils.Zobrist import Zobrist
+
+def full_hash(game:Game) -> int :
+    """
+    Recalcule la clé de Zobrist d'une partie en parcourant tout le plateau.
+    """
+
+    zobrist = Zobrist.get(game.get_size())
+    key = zobrist.side if game.get_current_player() == Pawn.WHITE else 0
+
+    for x, y, pawn in game.get_pawns() :
+        key ^= zobrist.cells[(x, y)][pawn]
+
+    if game.possible_moves != [] :
+        key ^= zobrist.forced[game.possible_moves[0][:2]]
+
+    return key
+
+def random_game(size:int, backend:type[Board | BitBoard], seed:int, plies:int = 60) -> tuple[Game, list] :
+    """
+    Joue une partie aléatoire et retourne la partie et les annulations de chaque coup.
+    """
+
+    rng = Random(seed)
+    game = Game(size, backend=backend)
+    undos = []
+
+    for _ in range(plies) :
+        moves = sorted(
+            (x1, y1, x2, y2)
+            for x1, y1, p in game.get_pawns() if p == game.get_current_player()
+            for x2, y2, _ in game.get_possible_moves(x1, y1)
+            if game.possible_moves == [] or (x1, y1, x2, y2) in game.possible_moves
+        )
+
+        if moves == [] or game.is_finished() != Pawn.VOID :
+            break
+
+        undos.append(game.make(*rng.choice(moves)))
+
+        assert game.get_hash() == full_hash(game)
+
+    return game, undos
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+@pytest.mark.parametrize("size", [3, 5, 7])
+def test_incremental_hash(backend, size) :
+    for seed in range(10) :
+        start = Game(size, backend=backend).get_hash()
+        game, undos = random_game(size, backend, seed)
+
+        for undo in reversed(undos) :
+            game.unmake(undo)
+
+            assert game.get_hash() == full_hash(game)
+
+        assert game.get_hash() == start
+
+@pytest.mark.parametrize("size", [3, 5, 7])
+def test_backends_agree(size) :
+    for seed in range(5) :
+        board, _ = random_game(size, Board, seed)
+        bitboard, _ = random_game(size, BitBoard, seed) # Coups triés : les deux plateaux jouent la même partie
+
+        assert sorted(board.get_pawns(), key=str) == sorted(bitboard.get_pawns(), key=str)
+        assert board.get_hash() == bitboard.get_hash()
+
+def test_pass_turn() :
+    game = Game(5)
+    key = game.get_hash()
+    game.pass_turn()
+
+    assert game.get_hash() == key ^ Zobrist.get(5).side
+    assert Zobrist(5).cells == Zobrist.get(5).cells # Graine fixe : mêmes clés d'un processus à l'autre
+
+@pytest.mark.parametrize("backend", [Board, BitBoard])
+def test_unpass_turn(backend) :
+    rng = Random(4)
+
+    for _ in range(10) :
+        game = Game(5, backend=backend)
+        undos = []
+
+        for _ in range(40) :
+            moves = sorted(
+                (x1, y1, x2, y2)
+                for x1, y1, p in game.get_pawns() if p == game.get_current_player()
+                for x2, y2, _ in game.get_possible_moves(x1, y1)
+                if game.possible_moves == [] or (x1, y1, x2, y2) in game.possible_moves
+            )
+            before = (game.get_hash(), game.get_current_player(), list(game.possible_moves))
+
+            if moves == [] or rng.random() < 0.2 : # Passe-tour, y compris au milieu d'une chaîne de prises
+                undos.append((before, None, game.pass_turn()))
+            else :
+                undos.append((before, game.make(*rng.choice(moves)), None))
+
+            assert game.get_hash() == full_hash(game)
+
+        for before, undo, possible_moves in reversed(undos) :
+            if undo is None :
+                game.unpass_turn(possible_moves)
+            else :
+                game.unmake(undo)
+
+            assert (game.get_hash(), game.get_current_player(), game.possible_moves) == before
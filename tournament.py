@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+
+from controler.Tournament import Tournament
+from controler.autoplayer.RandomIA import RandomIA
+from controler.autoplayer.HeuristIA import HeuristIA
+from controler.autoplayer.AlphaBetaIA import AlphaBetaIA
+from controler.autoplayer.MCTSIA import MCTSIA
+
+Tournament.register("RandomIA", RandomIA)
+Tournament.register("HeuristIA", HeuristIA)
+Tournament.register("AlphaBetaIA", AlphaBetaIA, time_limit=0.1)
+Tournament.register("MCTSIA", MCTSIA, time_limit=0.1)
+
+if __name__ == "__main__" :
+    parser = argparse.ArgumentParser(description="Tournoi toutes rondes entre les IA, avec classement Elo.")
+    parser.add_argument("--rounds", type=int, default=1, help="nombre de parties par paire, par taille et par couleur")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(range(3, 10)), help="tailles de plateau")
+    parser.add_argument("--workers", type=int, default=1, help="nombre de processus")
+    parser.add_argument("--checkpoint", default="tournament.json", help="fichier de sauvegarde (reprise automatique)")
+    parser.add_argument("--seed", type=int, default=0, help="graine du tournoi")
+    args = parser.parse_args()
+
+    tournament = Tournament(sizes=args.sizes, rounds=args.rounds, workers=args.workers, checkpoint=args.checkpoint, seed=args.seed)
+
+    try :
+        tournament.run(lambda done, total : print(f"\r{done}/{total}", end="", flush=True))
+    except KeyboardInterrupt :
+        print("\nInterrompu, résultats sauvegardés dans", args.checkpoint)
+
+    print()
+
+    for name, games, score, elo, ci in tournament.table() :
+        print(f"{name:<12} {games:>6} parties  {100 * score:5.1f} %  {elo:+7.1f} ± {ci:.1f}")
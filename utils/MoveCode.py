@@ -0,0 +1,135 @@
+from typing import Optional
+
+from utils.Move import Move
+
+class MoveCode :
+    # Codes spéciaux : jamais produits par un coup réel (la case de départ et la case d'arrivée seraient identiques)
+    PASS = 0 # Le joueur passe son tour
+    QUIT = -1 # Le joueur quitte la partie
+
+    # Saisies reconnues pour les codes spéciaux
+    PASS_WORDS = ("", "pass")
+    QUIT_WORDS = ("exit", "quit", "q")
+
+    @staticmethod
+    def encode(x1:int, y1:int, x2:int, y2:int) -> int :
+        """
+        Code un coup en entier : x1, y1, x2 et y2 sur 4 bits chacun, puis le type du coup (`Move.SIMPLE` ou `Move.TAKE`) à partir du bit 16.
+
+        Parameters:
+        -----------
+        x1 : int
+            La coordonnée x de la case de départ.
+        y1 : int
+            La coordonnée y de la case de départ.
+        x2 : int
+            La coordonnée x de la case d'arrivée.
+        y2 : int
+            La coordonnée y de la case d'arrivée.
+
+        Returns:
+        --------
+        int
+            Le coup codé.
+        """
+
+        kind = Move.TAKE if abs(x2 - x1) == 2 or abs(y2 - y1) == 2 else Move.SIMPLE # Seule la distance distingue une prise d'un déplacement simple
+
+        return x1 | y1 << 4 | x2 << 8 | y2 << 12 | kind.value << 16
+
+    @staticmethod
+    def decode(code:int) -> tuple[int, int, int, int] :
+        """
+        Décode un coup codé par `encode`.
+
+        Parameters:
+        -----------
+        code : int
+            Le coup codé.
+
+        Returns:
+        --------
+        tuple[int, int, int, int]
+            Les coordonnées du coup (x1, y1, x2, y2).
+        """
+
+        return code & 0xF, code >> 4 & 0xF, code >> 8 & 0xF, code >> 12 & 0xF
+
+    @staticmethod
+    def kind(code:int) -> Move :
+        """
+        Retourne le type d'un coup codé.
+
+        Parameters:
+        -----------
+        code : int
+            Le coup codé.
+
+        Returns:
+        --------
+        Move
+            Le type du coup, `Move.INVALID` pour un code spécial.
+        """
+
+        return Move(code >> 16) if code > 0 else Move.INVALID
+
+    @staticmethod
+    def to_text(code:int) -> str :
+        """
+        Convertit un coup codé en notation texte, pour l'affichage.
+
+        Parameters:
+        -----------
+        code : int
+            Le coup codé.
+
+        Returns:
+        --------
+        str
+            Le coup sous la forme "a1b2", ou "pass" / "quit" pour un code spécial.
+        """
+
+        if code == MoveCode.PASS :
+            return "pass"
+        if code == MoveCode.QUIT :
+            return "quit"
+
+        x1, y1, x2, y2 = MoveCode.decode(code)
+
+        return f"{chr(97 + x1)}{y1 + 1}{chr(97 + x2)}{y2 + 1}"
+
+    @staticmethod
+    def from_text(text:str, size:int=9) -> Optional[int] :
+        """
+        Convertit une saisie en coup codé.
+
+        Parameters:
+        -----------
+        text : str
+            La saisie : un coup de la forme "a1b2" (lettres majuscules ou minuscules), "pass" (ou rien) pour passer son tour,
+            "exit", "quit" ou "q" pour quitter la partie.
+        size : int, optional
+            La taille du plateau : les coordonnées en dehors du plateau sont refusées.
+
+        Returns:
+        --------
+        Optional[int]
+            Le coup codé, ou None si la saisie n'est pas reconnue.
+        """
+
+        text = text.strip().lower()
+
+        if text in MoveCode.PASS_WORDS :
+            return MoveCode.PASS
+        if text in MoveCode.QUIT_WORDS :
+            return MoveCode.QUIT
+
+        if len(text) != 4 or not text[0].isalpha() or not text[1].isdigit() or not text[2].isalpha() or not text[3].isdigit() : # Si la saisie n'est pas de la forme "a1b2"
+            return None
+
+        x1, y1, x2, y2 = ord(text[0]) - 97, int(text[1]) - 1, ord(text[2]) - 97, int(text[3]) - 1 # Conversion des lettres en nombres (a -> 0, b -> 1, ...)
+
+        if not all(0 <= c < size for c in (x1, y1, x2, y2)) : # Si les coordonnées ne sont pas dans le plateau de jeu
+            return None
+
+        return MoveCode.encode(x1, y1, x2, y2)
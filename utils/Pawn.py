@@ -3,4 +3,5 @@ from enum import Enum
 class Pawn(Enum) :
     WHITE = "○"
     BLACK = "●"
-    VOID =  " "
\ No newline at end of file
+    VOID =  " "
+    DRAW = "=" # Résultat d'une partie nulle (voir `Game.is_finished`), jamais placé sur le plateau
\ No newline at end of file
@@ -0,0 +1,58 @@
+from random import Random
+
+from utils.Pawn import Pawn
+
+class Zobrist :
+    # Graine fixe : les clés sont identiques d'une exécution (et d'un processus) à l'autre
+    SEED = 0x4172756261
+
+    # Clés déjà tirées, une table par taille de plateau (voir `Zobrist.get`)
+    TABLES = {}
+
+    def __init__(self, size:int) :
+        """
+        Tire les clés de Zobrist d'un plateau de taille spécifiée.
+
+        La clé d'une position est le XOR des clés de ses éléments :
+        - `cells[(x, y)][pion]` : une clé par case et par couleur (0 pour une case vide).
+        - `side` : présente si c'est aux rouges (`Pawn.WHITE`) de jouer.
+        - `forced[(x, y)]` : présente si le joueur doit continuer une prise avec le pion en (x, y).
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+        """
+
+        rng = Random(Zobrist.SEED + size)
+
+        self.cells = {}
+        self.forced = {}
+
+        for y in range(size) :
+            for x in range(size) :
+                self.cells[(x, y)] = {Pawn.VOID: 0, Pawn.BLACK: rng.getrandbits(64), Pawn.WHITE: rng.getrandbits(64)}
+                self.forced[(x, y)] = rng.getrandbits(64)
+
+        self.side = rng.getrandbits(64)
+
+    @staticmethod
+    def get(size:int) -> "Zobrist" :
+        """
+        Retourne les clés de Zobrist d'une taille de plateau, tirées une seule fois par taille.
+
+        Parameters:
+        -----------
+        size : int
+            La taille du plateau.
+
+        Returns:
+        --------
+        Zobrist
+            Les clés de Zobrist.
+        """
+
+        if size not in Zobrist.TABLES :
+            Zobrist.TABLES[size] = Zobrist(size)
+
+        return Zobrist.TABLES[size]
\ No newline at end of file
@@ -1,28 +1,131 @@
 import os
+import shutil
+import signal
+import sys
+import threading
 
-def clear() -> None :
+_size = None # Taille du terminal (colonnes, lignes), None tant qu'elle n'a pas été lue (voir `size`)
+_buffer = [] # Textes écrits depuis le dernier `flush`
+_lock = threading.Lock() # Protège le tampon : l'affichage peut écrire depuis son propre fil (voir `Renderer`)
+
+if os.name == "nt":
+    try :
+        import ctypes
+
+        _handle = ctypes.windll.kernel32.GetStdHandle(-11) # Sortie standard
+        _mode = ctypes.c_uint32()
+        if ctypes.windll.kernel32.GetConsoleMode(_handle, ctypes.byref(_mode)) :
+            ctypes.windll.kernel32.SetConsoleMode(_handle, _mode.value | 0x0004) # Active les séquences d'échappement ANSI (ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+    except (AttributeError, OSError) : # Pas de console (sortie redirigée)
+        pass
+
+def _resized(signum:int, frame:object) -> None :
+    """
+    Relit la taille du terminal quand il est redimensionné (signal SIGWINCH).
+
+    Parameters:
+    -----------
+    signum : int
+        Le numéro du signal.
+    frame : object
+        Le cadre d'exécution interrompu.
+    """
+
+    global _size
+    _size = tuple(shutil.get_terminal_size())
+
+_watched = False # Si le gestionnaire du signal SIGWINCH est installé (voir `_watch`)
+
+def _watch() -> bool :
     """
-    Efface l'écran selon le système d'exploitation.
+    Installe le gestionnaire du signal SIGWINCH au premier appel depuis le fil principal, et non à l'import :
+    importer le module ne modifie pas les gestionnaires de signaux du programme.
+
+    Sous Windows, aucun signal ne prévient du redimensionnement. Hors du fil principal, le gestionnaire ne peut pas être installé :
+    il le sera au prochain appel depuis le fil principal.
+
+    Returns:
+    --------
+    bool
+        True si le gestionnaire est installé, False si la taille doit être relue à chaque fois.
+    """
+
+    global _watched, _size
+
+    if not _watched and hasattr(signal, "SIGWINCH") and threading.current_thread() is threading.main_thread() :
+        signal.signal(signal.SIGWINCH, _resized)
+        _watched = True
+        _size = None # La taille lue avant n'était pas tenue à jour
+
+    return _watched
+
+def size() -> tuple[int, int] :
+    """
+    Récupère la taille du terminal.
+
+    La taille est lue une seule fois, puis relue seulement quand le terminal est redimensionné (signal SIGWINCH, voir `_watch`).
+
+    Returns:
+    --------
+    tuple[int, int]
+        Le nombre de colonnes et de lignes du terminal.
     """
 
-    if os.name == "nt":
-        os.system("cls")  # Efface l'écran sous Windows
-    else:
-        os.system("clear")  # Efface l'écran sous Linux
+    global _size
+
+    if not _watch() or _size is None :
+        _size = tuple(shutil.get_terminal_size()) # 80x24 si la sortie n'est pas un terminal
+
+    return _size
 
 def height() -> int :
     """
     Récupère la hauteur du terminal.
     """
     
-    return os.get_terminal_size().lines # Récupère la hauteur du terminal
+    return size()[1] # Récupère la hauteur du terminal
 
 def width() -> int :
     """
     Récupère la largeur du terminal.
     """
     
-    return os.get_terminal_size().columns # Récupère la largeur du terminal
+    return size()[0] # Récupère la largeur du terminal
+
+def write(text:str) -> None :
+    """
+    Écrit du texte dans le tampon de sortie, partagé par toutes les vues. Rien n'est affiché avant `flush`.
+
+    Parameters:
+    -----------
+    text : str
+        Le texte, séquences d'échappement ANSI comprises.
+    """
+
+    with _lock :
+        _buffer.append(text)
+
+def flush() -> None :
+    """
+    Affiche le contenu du tampon de sortie, en une seule écriture.
+    """
+
+    with _lock :
+        text = "".join(_buffer)
+        _buffer.clear()
+
+        if text != "" :
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+def clear() -> None :
+    """
+    Efface l'écran avec des séquences d'échappement ANSI, sans lancer de commande, et place le curseur en haut à gauche.
+
+    L'effacement est écrit dans le tampon de sortie (voir `write`) : il est affiché avec ce qui suit, au prochain `flush`.
+    """
+
+    write("\033[2J\033[3J\033[H") # Efface l'écran, l'historique de défilement, puis replace le curseur
 
 def wrap(lines:list[str], n:int) -> list[str]:
     """